@@ -0,0 +1 @@
+"""Terra Futura micro-benchmarks."""
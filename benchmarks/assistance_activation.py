@@ -0,0 +1,42 @@
+"""Measure assistance activations per second on a full 3x3 grid.
+
+Run with ``python3 -m benchmarks.assistance_activation``.
+"""
+from __future__ import annotations
+import time
+from typing import List
+from terra_futura.card import Card
+from terra_futura.effects import EffectAssistance, EffectTransformationFixed
+from terra_futura.grid import Grid
+from terra_futura.interfaces import InterfaceCard, InterfaceSelectReward
+from terra_futura.process_action_assistance import ProcessActionAssistance
+from terra_futura.simple_types import GridPosition, Resource
+
+ITERATIONS = 200_000
+
+
+class _RewardSink(InterfaceSelectReward):
+    def set_reward(self, player: int, card: InterfaceCard, reward: List[Resource]) -> None:
+        pass
+
+
+def run(iterations: int = ITERATIONS) -> float:
+    """Return assistance activations per second."""
+    grid = Grid()
+    for x in range(-1, 2):
+        for y in range(-1, 2):
+            grid.put_card(GridPosition(x, y), Card([], 1, True, EffectAssistance()))
+    card = grid.get_card(GridPosition(1, 1))
+    assert card is not None
+    assisting = Card([], 1, lowerEffect=EffectTransformationFixed([], [], 0))
+    action = ProcessActionAssistance(_RewardSink())
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        if not action.activate_card(card, grid, 2, assisting, [], [], []):
+            raise RuntimeError("Assistance activation failed")
+    return iterations / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    print(f"{run():,.0f} assistance activations/s")
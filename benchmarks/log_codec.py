@@ -0,0 +1,86 @@
+"""Compare decoding an action log from the binary codec and from JSON.
+
+Run with ``python3 -m benchmarks.log_codec``.
+"""
+from __future__ import annotations
+import json
+import time
+from typing import Any, Dict, List
+from terra_futura.action_log import ActionLog, ActionRecord
+from terra_futura.actions import ActivateCardAction, FinishTurnAction, TakeCardAction
+from terra_futura.log_codec import decode_log, encode_log
+from terra_futura.simple_types import CardSource, Deck, GridPosition, Resource
+
+GAMES = 2_000
+
+
+def _sample() -> ActionLog:
+    records: List[ActionRecord] = []
+    for turn in range(9):
+        pos = GridPosition(turn % 3 - 1, turn // 3 - 1)
+        records.append(ActionRecord(turn % 2, TakeCardAction(CardSource(Deck.I, turn % 4), pos)))
+        records.append(ActionRecord(turn % 2, ActivateCardAction(
+            pos, [(Resource.GREEN, pos), (Resource.RED, pos)], [(Resource.GEAR, pos)], [pos])))
+        records.append(ActionRecord(turn % 2, FinishTurnAction()))
+    return ActionLog(12345, [0, 1], records)
+
+
+def _to_json(log: ActionLog) -> str:
+    rows: List[Dict[str, Any]] = []
+    for record in log.records:
+        action = record.action
+        if isinstance(action, TakeCardAction):
+            rows.append({"type": "take", "player": record.player_id,
+                         "deck": action.source.deck.value, "index": action.source.index,
+                         "x": action.destination.x, "y": action.destination.y})
+        elif isinstance(action, ActivateCardAction):
+            rows.append({"type": "activate", "player": record.player_id,
+                         "card": [action.card.x, action.card.y],
+                         "inputs": [[r.value, p.x, p.y] for r, p in action.inputs],
+                         "outputs": [[r.value, p.x, p.y] for r, p in action.outputs],
+                         "pollution": [[p.x, p.y] for p in action.pollution]})
+        else:
+            rows.append({"type": "finish", "player": record.player_id})
+    return json.dumps({"seed": log.seed, "players": log.player_ids, "records": rows})
+
+
+def _from_json(text: str) -> ActionLog:
+    data = json.loads(text)
+    records: List[ActionRecord] = []
+    for row in data["records"]:
+        if row["type"] == "take":
+            action: Any = TakeCardAction(CardSource(Deck(row["deck"]), row["index"]),
+                                         GridPosition(row["x"], row["y"]))
+        elif row["type"] == "activate":
+            action = ActivateCardAction(
+                GridPosition(*row["card"]),
+                [(Resource(r), GridPosition(x, y)) for r, x, y in row["inputs"]],
+                [(Resource(r), GridPosition(x, y)) for r, x, y in row["outputs"]],
+                [GridPosition(x, y) for x, y in row["pollution"]])
+        else:
+            action = FinishTurnAction()
+        records.append(ActionRecord(row["player"], action))
+    return ActionLog(data["seed"], data["players"], records)
+
+
+def run(games: int = GAMES) -> None:
+    """Print size and decode throughput of both formats."""
+    log = _sample()
+    binary, text = encode_log(log), _to_json(log)
+    assert decode_log(binary)[0] == log == _from_json(text)
+
+    start = time.perf_counter()
+    for _ in range(games):
+        decode_log(binary)
+    binary_rate = games / (time.perf_counter() - start)
+    start = time.perf_counter()
+    for _ in range(games):
+        _from_json(text)
+    json_rate = games / (time.perf_counter() - start)
+
+    print(f"binary: {len(binary)} bytes, {binary_rate:,.0f} games/s")
+    print(f"json:   {len(text)} bytes, {json_rate:,.0f} games/s")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,142 @@
+"""
+Terra Futura: action logs of played games and their deterministic replay.
+"""
+from __future__ import annotations
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from terra_futura.actions import (
+    Action,
+    ActivateCardAction,
+    DiscardCardAction,
+    FinishTurnAction,
+    SelectActivationPatternAction,
+    SelectRewardAction,
+    SelectScoringAction,
+    TakeCardAction,
+)
+from terra_futura.interfaces import TerraFuturaInterface
+
+GameFactory = Callable[[int, List[int]], TerraFuturaInterface]
+
+
+def _activate(card: Any, inputs: Any, outputs: Any, pollution: Any,
+              other_player_id: Any = None, other_card: Any = None) -> Action:
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    return ActivateCardAction(card, list(inputs), list(outputs), list(pollution),
+                              other_player_id, other_card)
+
+
+# Interface method name -> record factory taking the arguments after player_id.
+_FACTORIES: Dict[str, Callable[..., Action]] = {
+    "take_card": TakeCardAction,
+    "discard_last_card_from_deck": DiscardCardAction,
+    "activate_card": _activate,
+    "select_reward": SelectRewardAction,
+    "turn_finished": FinishTurnAction,
+    "select_activation_pattern": SelectActivationPatternAction,
+    "select_scoring": SelectScoringAction,
+}
+
+
+class ActionRecord:
+    """One successful interface call: who played which action."""
+
+    __slots__ = ("player_id", "action")
+
+    def __init__(self, player_id: int, action: Action):
+        self.player_id = player_id
+        self.action = action
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ActionRecord) and \
+            (self.player_id, self.action) == (other.player_id, other.action)
+
+    def __hash__(self) -> int:
+        return hash((self.player_id, self.action))
+
+
+def record_call(name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> ActionRecord:
+    """Build the record of a call of the named TerraFuturaInterface action."""
+    if "player_id" in kwargs:
+        kwargs = dict(kwargs)
+        player_id = kwargs.pop("player_id")
+    else:
+        player_id, args = args[0], args[1:]
+    return ActionRecord(player_id, _FACTORIES[name](*args, **kwargs))
+
+
+class ActionLog:
+    """Seed, seating and the ordered action records of one game."""
+
+    def __init__(self, seed: int, player_ids: List[int],
+                 records: Optional[List[ActionRecord]] = None):
+        """Initialize the log of a game set up from seed and player_ids."""
+        self.seed = seed
+        self.player_ids = list(player_ids)
+        self.records: List[ActionRecord] = records if records is not None else []
+
+    def append(self, record: ActionRecord) -> None:
+        self.records.append(record)
+
+    def pop(self) -> ActionRecord:
+        return self.records.pop()
+
+    def truncate(self, length: int) -> None:
+        del self.records[length:]
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[ActionRecord]:
+        return iter(self.records)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ActionLog) and \
+            (self.seed, self.player_ids, self.records) == \
+            (other.seed, other.player_ids, other.records)
+
+
+class ReplayError(ValueError):
+    """A logged action was refused by the replayed game."""
+
+    def __init__(self, index: int, record: ActionRecord):
+        super().__init__(f"Action {index} of player {record.player_id} "
+                         f"was refused: {record.action.key()}")
+        self.index = index
+        self.record = record
+
+
+class ReplayEngine:
+    """Rebuilds games from their seed and action log.
+
+    The factory must set a game up deterministically from the seed, e.g.
+    with SeededRandomProvider streams. Replayed games get no observers,
+    record nothing and are never serialized.
+    """
+
+    def __init__(self, game_factory: GameFactory):
+        self._game_factory = game_factory
+        self.games = 0
+        self.actions = 0
+        self.seconds = 0.0
+
+    def replay(self, log: ActionLog) -> TerraFuturaInterface:
+        """Return the game in its position after the last logged action."""
+        start = time.perf_counter()
+        game = self._game_factory(log.seed, log.player_ids)
+        for index, record in enumerate(log.records):
+            if not record.action.apply(game, record.player_id):
+                raise ReplayError(index, record)
+        self.games += 1
+        self.actions += len(log.records)
+        self.seconds += time.perf_counter() - start
+        return game
+
+    def replay_many(self, logs: Iterable[ActionLog]) -> Iterator[TerraFuturaInterface]:
+        """Lazily replay a stream of logs."""
+        for log in logs:
+            yield self.replay(log)
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.seconds if self.seconds > 0 else 0.0
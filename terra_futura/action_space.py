@@ -0,0 +1,161 @@
+"""Fixed-size action indexing and legal-action masks for learning agents.
+
+The space is laid out as consecutive blocks::
+
+    take      deck x pile index x grid slot
+    discard   deck
+    activate  grid slot x activation choice
+    finish    1
+    reward    resource
+    pattern   activation pattern card
+    scoring   scoring method card
+
+Activation choice ``k`` of a slot is the k-th activation listed by
+ActivationEnumerator for the card on that slot, so only the first
+``activation_choices`` activations of a card are reachable.
+"""
+from __future__ import annotations
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, List, Optional, cast
+from terra_futura.actions import (
+    Action,
+    ActivateCardAction,
+    DiscardCardAction,
+    FinishTurnAction,
+    SelectActivationPatternAction,
+    SelectRewardAction,
+    SelectScoringAction,
+    TakeCardAction,
+)
+from terra_futura.activation_enumerator import ActivationEnumerator
+from terra_futura.grid import GRID_SLOTS, POSITIONS, slot_of
+from terra_futura.interfaces import TerraFuturaInterface
+from terra_futura.move_generator import TAKE_STATES, VISIBLE_CARDS
+from terra_futura.resource_bag import RESOURCE_ORDER
+from terra_futura.simple_types import CardSource, Deck, GameState
+
+if TYPE_CHECKING:
+    from terra_futura.game import Game
+
+PILE_INDICES = VISIBLE_CARDS + 1
+DECKS: List[Deck] = list(Deck)
+# Bits of every byte value spread into eight 0/1 bytes, lowest bit first.
+_BYTE_BITS = [bytes(value >> bit & 1 for bit in range(8)) for value in range(256)]
+
+
+class ActionSpace:
+    """Canonical integer codes for actions, with masks of the legal codes.
+
+    Codes of actions without resource choices map to shared action objects.
+    Masks are computed from the grid and pile state: free grid slots come
+    from the grid's placeable mask and only activations are enumerated.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, activation_choices: int = 8, patterns: int = 2, scorings: int = 2):
+        """Initialize the layout of the space."""
+        self.activation_choices = activation_choices
+        self.take = 0
+        self.discard = self.take + len(DECKS) * PILE_INDICES * GRID_SLOTS
+        self.activate = self.discard + len(DECKS)
+        self.finish = self.activate + GRID_SLOTS * activation_choices
+        self.reward = self.finish + 1
+        self.pattern = self.reward + len(RESOURCE_ORDER)
+        self.scoring = self.pattern + patterns
+        self.size = self.scoring + scorings
+
+        self._enumerator = ActivationEnumerator()
+        self._actions: List[Optional[Action]] = [None] * self.size
+        for d, deck in enumerate(DECKS):
+            for index in range(PILE_INDICES):
+                source = CardSource(deck, index)
+                for slot, pos in enumerate(POSITIONS):
+                    self._actions[self._take_code(d, index, slot)] = TakeCardAction(source, pos)
+            self._actions[self.discard + d] = DiscardCardAction(deck)
+        self._actions[self.finish] = FinishTurnAction()
+        for i, resource in enumerate(RESOURCE_ORDER):
+            self._actions[self.reward + i] = SelectRewardAction(resource)
+        for i in range(patterns):
+            self._actions[self.pattern + i] = SelectActivationPatternAction(i)
+        for i in range(scorings):
+            self._actions[self.scoring + i] = SelectScoringAction(i)
+        self._codes: Dict[Action, int] = {
+            action: code for code, action in enumerate(self._actions) if action is not None
+        }
+
+    def _take_code(self, deck: int, index: int, slot: int) -> int:
+        return self.take + (deck * PILE_INDICES + index) * GRID_SLOTS + slot
+
+    def encode(self, action: Action) -> Optional[int]:
+        """Return the code of an action without resource choices."""
+        return self._codes.get(action)
+
+    def decode(self, terra_futura: TerraFuturaInterface, code: int) -> Optional[Action]:
+        """Return the action of a code in the current position of the game."""
+        if not 0 <= code < self.size:
+            return None
+        if not self.activate <= code < self.finish:
+            return self._actions[code]
+        game = cast("Game", terra_futura)
+        grid = game.players[game.get_current_player()].grid
+        slot, choice = divmod(code - self.activate, self.activation_choices)
+        card = grid.get_card(POSITIONS[slot])
+        if card is None:
+            return None
+        for inputs, outputs, pollution in islice(
+                self._enumerator.activations(card, grid), choice, choice + 1):
+            return ActivateCardAction(POSITIONS[slot], inputs, outputs, pollution)
+        return None
+
+    def mask_bits(self, terra_futura: TerraFuturaInterface) -> int:
+        """Return the legal codes as bits of an integer."""
+        # pylint: disable=too-many-locals, too-many-branches
+        game = cast("Game", terra_futura)
+        player = game.players[game.get_current_player()]
+        state = game.get_state()
+        bits = 0
+
+        if state in TAKE_STATES:
+            free = player.grid.placeable_mask()
+            for d, deck in enumerate(DECKS):
+                pile = game.piles[deck]
+                for index in range(PILE_INDICES):
+                    if pile.get_card(index) is not None:
+                        bits |= free << self._take_code(d, index, 0)
+                if state == GameState.TAKE_CARD_NO_CARD_DISCARDED:
+                    bits |= 1 << (self.discard + d)
+
+        elif state == GameState.ACTIVATE_CARD:
+            for pos in game.get_cards_to_activate():
+                card = player.grid.get_card(pos)
+                if card is None:
+                    continue
+                start = self.activate + slot_of(pos) * self.activation_choices
+                listed = sum(1 for _ in islice(
+                    self._enumerator.activations(card, player.grid), self.activation_choices))
+                bits |= ((1 << listed) - 1) << start
+            if game.is_activation_complete():
+                bits |= 1 << self.finish
+
+        elif state == GameState.SELECT_REWARD:
+            for i, resource in enumerate(RESOURCE_ORDER):
+                if game.can_select_reward(resource):
+                    bits |= 1 << (self.reward + i)
+
+        elif state == GameState.SELECT_ACTIVATION_PATTERN:
+            if player.selected_pattern is None:
+                count = min(len(player.activation_patterns), self.scoring - self.pattern)
+                bits |= ((1 << count) - 1) << self.pattern
+
+        elif state == GameState.SELECT_SCORING_METHOD:
+            if player.selected_scoring is None:
+                count = min(len(player.scoring_methods), self.size - self.scoring)
+                bits |= ((1 << count) - 1) << self.scoring
+
+        return bits
+
+    def mask(self, terra_futura: TerraFuturaInterface, out: memoryview) -> None:
+        """Write the legal mask of the game as 0/1 bytes into out."""
+        packed = self.mask_bits(terra_futura).to_bytes((self.size + 7) // 8, "little")
+        out[:self.size] = b"".join([_BYTE_BITS[byte] for byte in packed])[:self.size]
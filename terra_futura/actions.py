@@ -0,0 +1,162 @@
+"""
+Terra Futura: typed records of the actions a player can submit.
+"""
+from __future__ import annotations
+from typing import Any, List, Optional, Tuple, Union
+from terra_futura.interfaces import TerraFuturaInterface
+from terra_futura.simple_types import CardSource, Deck, GridPosition, Resource
+
+
+class Action:
+    """Base of all action records; equal actions have equal keys."""
+
+    def apply(self, game: TerraFuturaInterface, player_id: int) -> bool:
+        """Submit the action to the game on behalf of the player."""
+        raise NotImplementedError
+
+    def key(self) -> Tuple[Any, ...]:
+        """Return a hashable description of the action."""
+        raise NotImplementedError
+
+    def __eq__(self, other: object) -> bool:
+        """Equality check."""
+        return isinstance(other, Action) and self.key() == other.key()
+
+    def __hash__(self) -> int:
+        """Hash for using in sets/dicts."""
+        return hash(self.key())
+
+
+class TakeCardAction(Action):
+    """Take a card from a pile and put it on the grid."""
+
+    def __init__(self, source: CardSource, destination: GridPosition):
+        """Initialize with the pile source and grid destination."""
+        self.source = source
+        self.destination = destination
+
+    def apply(self, game: TerraFuturaInterface, player_id: int) -> bool:
+        """Submit the action to the game on behalf of the player."""
+        return game.take_card(player_id, self.source, self.destination)
+
+    def key(self) -> Tuple[Any, ...]:
+        """Return a hashable description of the action."""
+        return ("take", self.source.deck.value, self.source.index,
+                self.destination.x, self.destination.y)
+
+
+class DiscardCardAction(Action):
+    """Discard the last visible card of a deck."""
+
+    def __init__(self, deck: Deck):
+        """Initialize with the deck to discard from."""
+        self.deck = deck
+
+    def apply(self, game: TerraFuturaInterface, player_id: int) -> bool:
+        """Submit the action to the game on behalf of the player."""
+        return game.discard_last_card_from_deck(player_id, self.deck)
+
+    def key(self) -> Tuple[Any, ...]:
+        """Return a hashable description of the action."""
+        return ("discard", self.deck.value)
+
+
+class ActivateCardAction(Action):
+    """Activate a card, optionally assisted by another player's card."""
+
+    def __init__(
+        self,
+        card: GridPosition,
+        inputs: List[Tuple[Resource, GridPosition]],
+        outputs: List[Tuple[Resource, GridPosition]],
+        pollution: List[GridPosition],
+        other_player_id: Optional[int] = None,
+        other_card: Optional[GridPosition] = None
+    ):
+        """Initialize with the arguments of activate_card."""
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self.card = card
+        self.inputs = inputs
+        self.outputs = outputs
+        self.pollution = pollution
+        self.other_player_id = other_player_id
+        self.other_card = other_card
+
+    def apply(self, game: TerraFuturaInterface, player_id: int) -> bool:
+        """Submit the action to the game on behalf of the player."""
+        return game.activate_card(player_id, self.card, self.inputs, self.outputs,
+                                  self.pollution, self.other_player_id, self.other_card)
+
+    def key(self) -> Tuple[Any, ...]:
+        """Return a hashable description of the action."""
+        return (
+            "activate", self.card.x, self.card.y,
+            tuple(sorted((r.value, pos.x, pos.y) for r, pos in self.inputs)),
+            tuple(sorted((r.value, pos.x, pos.y) for r, pos in self.outputs)),
+            tuple(sorted((pos.x, pos.y) for pos in self.pollution)),
+            self.other_player_id,
+            (self.other_card.x, self.other_card.y) if self.other_card else None,
+        )
+
+
+class FinishTurnAction(Action):
+    """Finish the current turn."""
+
+    def apply(self, game: TerraFuturaInterface, player_id: int) -> bool:
+        """Submit the action to the game on behalf of the player."""
+        return game.turn_finished(player_id)
+
+    def key(self) -> Tuple[Any, ...]:
+        """Return a hashable description of the action."""
+        return ("finish",)
+
+
+class SelectRewardAction(Action):
+    """Select the resource rewarded for assisting another player's card."""
+
+    def __init__(self, resource: Resource):
+        """Initialize with the chosen resource."""
+        self.resource = resource
+
+    def apply(self, game: TerraFuturaInterface, player_id: int) -> bool:
+        """Submit the action to the game on behalf of the player."""
+        return game.select_reward(player_id, self.resource)
+
+    def key(self) -> Tuple[Any, ...]:
+        """Return a hashable description of the action."""
+        return ("reward", self.resource.value)
+
+
+class SelectActivationPatternAction(Action):
+    """Select one of the player's activation patterns."""
+
+    def __init__(self, card: int):
+        """Initialize with the index of the pattern card."""
+        self.card = card
+
+    def apply(self, game: TerraFuturaInterface, player_id: int) -> bool:
+        """Submit the action to the game on behalf of the player."""
+        return game.select_activation_pattern(player_id, self.card)
+
+    def key(self) -> Tuple[Any, ...]:
+        """Return a hashable description of the action."""
+        return ("pattern", self.card)
+
+
+class SelectScoringAction(Action):
+    """Select one of the player's scoring methods."""
+
+    def __init__(self, card: int):
+        """Initialize with the index of the scoring card."""
+        self.card = card
+
+    def apply(self, game: TerraFuturaInterface, player_id: int) -> bool:
+        """Submit the action to the game on behalf of the player."""
+        return game.select_scoring(player_id, self.card)
+
+    def key(self) -> Tuple[Any, ...]:
+        """Return a hashable description of the action."""
+        return ("scoring", self.card)
+
+
+CandidateAction = Union[TakeCardAction, ActivateCardAction]
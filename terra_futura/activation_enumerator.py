@@ -0,0 +1,175 @@
+"""Enumerates legal activations of a card on a grid."""
+from __future__ import annotations
+from itertools import product
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from terra_futura.effects import (
+    RAW_RESOURCES,
+    EffectArbitraryBasic,
+    EffectOr,
+    EffectPollutionTransfer,
+    EffectTransformationFixed,
+)
+from terra_futura.interfaces import InterfaceCard, InterfaceEffect, InterfaceGrid
+from terra_futura.simple_types import GridPosition, Resource
+
+Inputs = List[Tuple[Resource, GridPosition]]
+Outputs = List[Tuple[Resource, GridPosition]]
+Pollution = List[GridPosition]
+Activation = Tuple[Inputs, Outputs, Pollution]
+
+_Key = Tuple[Tuple[Tuple[int, int, int], ...], Tuple[int, ...], Tuple[Tuple[int, int], ...]]
+
+
+def _distributions(total: int, capacities: List[int]) -> Iterator[Tuple[int, ...]]:
+    """Yield every way to split total into counts bounded by capacities."""
+    if not capacities:
+        if total == 0:
+            yield ()
+        return
+    head, rest = capacities[0], capacities[1:]
+    rest_capacity = sum(rest)
+    for taken in range(min(head, total), -1, -1):
+        if total - taken > rest_capacity:
+            break
+        for tail in _distributions(total - taken, rest):
+            yield (taken,) + tail
+
+
+def _expand(items: List[Tuple[Resource, GridPosition]],
+            counts: Tuple[int, ...]) -> Inputs:
+    result: Inputs = []
+    for item, count in zip(items, counts):
+        result.extend([item] * count)
+    return result
+
+
+class ActivationEnumerator:
+    """Streams every distinct activation that ProcessAction would accept.
+
+    Each activation is an (inputs, outputs, pollution) tuple ready to be
+    passed to ``activate_card``. Resources are assigned to source cards as
+    counts, so permutations of the same choice are produced only once.
+    Assistance effects are skipped, they need the other player's card.
+    """
+
+    def activations(self, card: InterfaceCard,
+                    grid: InterfaceGrid) -> Iterator[Activation]:
+        """Lazily yield the legal activations of the card."""
+        card_pos = card.get_position()
+        if not grid.can_be_activated(card_pos):
+            return
+        sources = [(pos, c) for pos, c in grid.get_cards() if c.is_active()]
+        seen: Set[_Key] = set()
+        for effect in self._leaves(card.upper_effect, card.lower_effect):
+            for activation in self._effect_activations(effect, card_pos, sources):
+                key = self._key(activation)
+                if key not in seen:
+                    seen.add(key)
+                    yield activation
+
+    def _leaves(self, *effects: Optional[InterfaceEffect]) -> Iterator[InterfaceEffect]:
+        for effect in effects:
+            if isinstance(effect, EffectOr):
+                yield from self._leaves(*effect.effects)
+            elif effect is not None:
+                yield effect
+
+    def _effect_activations(
+        self,
+        effect: InterfaceEffect,
+        card_pos: GridPosition,
+        sources: List[Tuple[GridPosition, InterfaceCard]]
+    ) -> Iterator[Activation]:
+        if isinstance(effect, EffectTransformationFixed):
+            input_choices = self._fixed_inputs(effect.inputs, sources)
+            outputs, pollution = effect.outputs, effect.pollution
+        elif isinstance(effect, EffectArbitraryBasic):
+            input_choices = self._arbitrary_inputs(effect.from_count, sources)
+            outputs, pollution = effect.outputs, effect.pollution
+        elif isinstance(effect, EffectPollutionTransfer):
+            yield [], [], []
+            return
+        else:
+            return
+        placed_outputs = [(r, card_pos) for r in outputs]
+        pollution_choices = list(self._pollution_targets(pollution, sources))
+        for inputs in input_choices:
+            for targets in pollution_choices:
+                yield inputs, placed_outputs.copy(), targets
+
+    def _fixed_inputs(
+        self,
+        needed: List[Resource],
+        sources: List[Tuple[GridPosition, InterfaceCard]]
+    ) -> Iterator[Inputs]:
+        needed_counts: Dict[Resource, int] = {}
+        for r in needed:
+            needed_counts[r] = needed_counts.get(r, 0) + 1
+        per_resource: List[List[Inputs]] = []
+        for r, count in needed_counts.items():
+            items: List[Tuple[Resource, GridPosition]] = []
+            capacities: List[int] = []
+            for pos, c in sources:
+                available = self._available(c, r, count)
+                if available:
+                    items.append((r, pos))
+                    capacities.append(available)
+            choices = [_expand(items, counts)
+                       for counts in _distributions(count, capacities)]
+            if not choices:
+                return
+            per_resource.append(choices)
+        for parts in product(*per_resource):
+            yield [item for part in parts for item in part]
+
+    def _arbitrary_inputs(
+        self,
+        count: int,
+        sources: List[Tuple[GridPosition, InterfaceCard]]
+    ) -> Iterator[Inputs]:
+        items: List[Tuple[Resource, GridPosition]] = []
+        capacities: List[int] = []
+        for pos, c in sources:
+            for r in sorted(RAW_RESOURCES, key=lambda res: res.value):
+                available = self._available(c, r, count)
+                if available:
+                    items.append((r, pos))
+                    capacities.append(available)
+        for counts in _distributions(count, capacities):
+            yield _expand(items, counts)
+
+    def _pollution_targets(
+        self,
+        count: int,
+        sources: List[Tuple[GridPosition, InterfaceCard]]
+    ) -> Iterator[Pollution]:
+        positions = [pos for pos, _ in sources]
+        capacities = [self._free_pollution(c, count) for _, c in sources]
+        for counts in _distributions(count, capacities):
+            targets: Pollution = []
+            for pos, taken in zip(positions, counts):
+                targets.extend([pos] * taken)
+            yield targets
+
+    @staticmethod
+    def _available(card: InterfaceCard, resource: Resource, limit: int) -> int:
+        available = 0
+        while available < limit and card.can_get_resources([resource] * (available + 1)):
+            available += 1
+        return available
+
+    @staticmethod
+    def _free_pollution(card: InterfaceCard, limit: int) -> int:
+        free = 0
+        while free < limit and card.can_put_resources([Resource.POLLUTION] * (free + 1)):
+            free += 1
+        return free
+
+    @staticmethod
+    def _key(activation: Activation) -> _Key:
+        inputs, outputs, pollution = activation
+        return (
+            tuple(sorted((pos.x, pos.y, r.value) for r, pos in inputs)),
+            tuple(sorted(r.value for r, _ in outputs)),
+            tuple(sorted((pos.x, pos.y) for pos in pollution)),
+        )
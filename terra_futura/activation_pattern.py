@@ -1,7 +1,19 @@
 from __future__ import annotations
 import json
-from typing import List, Tuple, Any
+from typing import Any, Dict, List, Optional, Tuple
+from terra_futura.grid import Grid
 from terra_futura.interfaces import InterfaceActivateGrid
+from terra_futura.simple_types import GridPosition
+
+
+class GridActivation(InterfaceActivateGrid):
+    """Hands the coordinates of a pattern to a grid as positions."""
+
+    def __init__(self, grid: Grid) -> None:
+        self.grid = grid
+
+    def set_activation_pattern(self, pattern: List[Tuple[int, int]]) -> None:
+        self.grid.set_activation_pattern([GridPosition(x, y) for x, y in pattern])
 
 
 class ActivationPattern:
@@ -13,18 +25,37 @@ class ActivationPattern:
         self._grid = grid
         self._pattern = pattern.copy()
         self._selected = False
+        self._dict: Optional[Dict[str, Any]] = None
 
     def select(self) -> None:
         assert self._selected is False
         self._grid.set_activation_pattern(self._pattern)
         self._selected = True
+        self._dict = None
+
+    @property
+    def pattern(self) -> List[Tuple[int, int]]:
+        """Coordinates of the cards the pattern activates."""
+        return self._pattern
 
     def is_selected(self) -> bool:
         return self._selected
 
+    def snapshot(self) -> bool:
+        return self._selected
+
+    def restore(self, snapshot: bool) -> None:
+        self._selected = snapshot
+        self._dict = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the cached state; callers must not modify it."""
+        if self._dict is None:
+            self._dict = {
+                "activations": self._pattern,
+                "selected": self._selected,
+            }
+        return self._dict
+
     def state(self) -> str:
-        state: Any = {
-            "activations": self._pattern,
-            "selected": self._selected,
-        }
-        return json.dumps(state)
+        return json.dumps(self.to_dict())
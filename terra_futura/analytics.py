@@ -0,0 +1,313 @@
+"""
+Terra Futura: lazy analytics pipeline over archived games.
+
+Every stage is a generator consuming the previous one, so only the game
+being replayed is held in memory::
+
+    frames = archive_source(archive)
+    logs = decode(frames)
+    events = replay(logs, game_factory)
+    rows = extract(events, [ActivationCounts(), PollutionPerTurn()])
+    totals = aggregate(rows, {"activations": CountAccumulator(),
+                              "pollution": SeriesAccumulator()})
+"""
+from __future__ import annotations
+import json
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple, cast
+from terra_futura.action_log import ActionLog, ActionRecord, GameFactory, ReplayError
+from terra_futura.actions import ActivateCardAction, FinishTurnAction
+from terra_futura.archive import Archive
+from terra_futura.interfaces import InterfaceCard, TerraFuturaInterface
+from terra_futura.log_codec import Data, decode_log
+from terra_futura.resource_bag import SHIFT, SLOT_MASK
+from terra_futura.simple_types import Resource
+
+if TYPE_CHECKING:
+    from terra_futura.game import Game
+
+GAME_START = 0
+ACTION = 1
+GAME_END = 2
+
+_POLLUTION_SHIFT = SHIFT[Resource.POLLUTION]
+
+
+def archive_source(archive: Archive, start: int = 0,
+                   stop: Optional[int] = None) -> Iterator[memoryview]:
+    """Yield the encoded games of an archive as zero-copy views."""
+    for game in range(start, len(archive) if stop is None else min(stop, len(archive))):
+        yield archive.game_bytes(game)
+
+
+def decode(frames: Iterable[Data]) -> Iterator[ActionLog]:
+    """Decode encoded games one at a time."""
+    for frame in frames:
+        yield decode_log(frame)[0]
+
+
+class ReplayEvent:
+    """A game starting, one of its actions having been applied, or its end."""
+
+    __slots__ = ("kind", "log", "game", "index", "record")
+
+    def __init__(self, kind: int, log: ActionLog, game: TerraFuturaInterface,
+                 index: int = -1, record: Optional[ActionRecord] = None):
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self.kind = kind
+        self.log = log
+        self.game = game
+        self.index = index
+        self.record = record
+
+
+def replay(logs: Iterable[ActionLog], game_factory: GameFactory) -> Iterator[ReplayEvent]:
+    """Replay games, yielding an event before, during and after each one.
+
+    The game in an event is live: it keeps changing as later events are
+    produced, so consumers must read what they need before moving on.
+    """
+    for log in logs:
+        game = game_factory(log.seed, log.player_ids)
+        yield ReplayEvent(GAME_START, log, game)
+        for index, record in enumerate(log.records):
+            if not record.action.apply(game, record.player_id):
+                raise ReplayError(index, record)
+            yield ReplayEvent(ACTION, log, game, index, record)
+        yield ReplayEvent(GAME_END, log, game)
+
+
+class Extractor:
+    """Computes one value per replayed game; override the hooks needed."""
+
+    name = "value"
+
+    def start(self, log: ActionLog, game: TerraFuturaInterface) -> None:
+        """Called before the first action of a game."""
+
+    def step(self, game: TerraFuturaInterface, record: ActionRecord) -> None:
+        """Called after each applied action."""
+
+    def finish(self, game: TerraFuturaInterface) -> Any:  # pylint: disable=unused-argument
+        """Return the value of the finished game."""
+        return None
+
+
+def extract(events: Iterable[ReplayEvent], extractors: List[Extractor]) -> Iterator[Dict[str, Any]]:
+    """Run extractors over replay events and yield one row per game."""
+    for event in events:
+        if event.kind == ACTION:
+            assert event.record is not None
+            for extractor in extractors:
+                extractor.step(event.game, event.record)
+        elif event.kind == GAME_START:
+            for extractor in extractors:
+                extractor.start(event.log, event.game)
+        else:
+            yield {extractor.name: extractor.finish(event.game) for extractor in extractors}
+
+
+def card_label(card: InterfaceCard) -> str:
+    """Describe a card by its effects, so equal cards share a label."""
+    return json.dumps([
+        card.upper_effect.to_dict() if card.upper_effect else None,
+        card.lower_effect.to_dict() if card.lower_effect else None,
+    ], separators=(",", ":"))
+
+
+class ActivationCounts(Extractor):
+    """Number of activations of every card, keyed by card_label."""
+
+    name = "activations"
+
+    def __init__(self) -> None:
+        self._counts: Dict[str, int] = {}
+        self._labels: Dict[int, str] = {}
+
+    def start(self, log: ActionLog, game: TerraFuturaInterface) -> None:
+        self._counts = {}
+        self._labels = {}
+
+    def step(self, game: TerraFuturaInterface, record: ActionRecord) -> None:
+        action = record.action
+        if not isinstance(action, ActivateCardAction):
+            return
+        card = cast("Game", game).players[record.player_id].grid.get_card(action.card)
+        if card is None:
+            return
+        label = self._labels.get(id(card))
+        if label is None:
+            label = self._labels[id(card)] = card_label(card)
+        self._counts[label] = self._counts.get(label, 0) + 1
+
+    def finish(self, game: TerraFuturaInterface) -> Dict[str, int]:
+        return self._counts
+
+
+class PollutionPerTurn(Extractor):
+    """Pollution on all grids at the end of every finished turn."""
+
+    name = "pollution"
+
+    def __init__(self) -> None:
+        self._series: List[int] = []
+
+    def start(self, log: ActionLog, game: TerraFuturaInterface) -> None:
+        self._series = []
+
+    def step(self, game: TerraFuturaInterface, record: ActionRecord) -> None:
+        if not isinstance(record.action, FinishTurnAction):
+            return
+        total = 0
+        for player in cast("Game", game).players.values():
+            for _, card in player.grid.get_cards():
+                total += card.snapshot() >> _POLLUTION_SHIFT & SLOT_MASK
+        self._series.append(total)
+
+    def finish(self, game: TerraFuturaInterface) -> List[int]:
+        return self._series
+
+
+class ScoringTotals(Extractor):
+    """Points of every player's selected ScoringMethod at the end."""
+
+    name = "scores"
+
+    def finish(self, game: TerraFuturaInterface) -> Dict[int, int]:
+        totals: Dict[int, int] = {}
+        for player_id, player in cast("Game", game).players.items():
+            scoring = player.selected_scoring
+            if scoring is not None and scoring.calculated_total is not None:
+                totals[player_id] = scoring.calculated_total.value
+        return totals
+
+
+class CardWins(Extractor):
+    """For every card label, games won and games played by its owners.
+
+    A card counts once per grid it lies on; games without a winner count
+    as played only.
+    """
+
+    name = "card_wins"
+
+    def finish(self, game: TerraFuturaInterface) -> Dict[str, Tuple[int, int]]:
+        winner = game.get_winner()
+        results: Dict[str, Tuple[int, int]] = {}
+        for player_id, player in cast("Game", game).players.items():
+            for label in {card_label(card) for _, card in player.grid.get_cards()}:
+                won, played = results.get(label, (0, 0))
+                results[label] = (won + (player_id == winner), played + 1)
+        return results
+
+
+class Accumulator:
+    """Mergeable aggregate of extracted values."""
+
+    def add(self, value: Any) -> None:
+        """Fold in the value of one game."""
+        raise NotImplementedError
+
+    def merge(self, other: Accumulator) -> None:
+        """Fold in another accumulator of the same kind."""
+        raise NotImplementedError
+
+    def result(self) -> Any:
+        """Return the aggregate."""
+        raise NotImplementedError
+
+
+class CountAccumulator(Accumulator):
+    """Sums per-key counts, e.g. of ActivationCounts."""
+
+    def __init__(self) -> None:
+        self.counts: Dict[Any, int] = {}
+
+    def add(self, value: Any) -> None:
+        counts = self.counts
+        for key, count in value.items():
+            counts[key] = counts.get(key, 0) + count
+
+    def merge(self, other: Accumulator) -> None:
+        assert isinstance(other, CountAccumulator)
+        self.add(other.counts)
+
+    def result(self) -> Dict[Any, int]:
+        return self.counts
+
+
+class SeriesAccumulator(Accumulator):
+    """Mean of per-turn series; turns missing in shorter games are skipped."""
+
+    def __init__(self) -> None:
+        self.sums: List[float] = []
+        self.counts: List[int] = []
+
+    def add(self, value: Any) -> None:
+        self._add(value, [1] * len(value))
+
+    def _add(self, sums: List[float], counts: List[int]) -> None:
+        missing = len(sums) - len(self.sums)
+        if missing > 0:
+            self.sums.extend([0.0] * missing)
+            self.counts.extend([0] * missing)
+        for turn, (total, count) in enumerate(zip(sums, counts)):
+            self.sums[turn] += total
+            self.counts[turn] += count
+
+    def merge(self, other: Accumulator) -> None:
+        assert isinstance(other, SeriesAccumulator)
+        self._add(other.sums, other.counts)
+
+    def result(self) -> List[float]:
+        return [total / count for total, count in zip(self.sums, self.counts)]
+
+
+class HistogramAccumulator(Accumulator):
+    """Counts of values, or of every value of a series, in bins of bin_width."""
+
+    def __init__(self, bin_width: int = 1) -> None:
+        self.bin_width = bin_width
+        self.bins: Dict[int, int] = {}
+
+    def add(self, value: Any) -> None:
+        bins = self.bins
+        for item in value if isinstance(value, (list, tuple)) else [value]:
+            start = int(item) // self.bin_width * self.bin_width
+            bins[start] = bins.get(start, 0) + 1
+
+    def merge(self, other: Accumulator) -> None:
+        assert isinstance(other, HistogramAccumulator) and other.bin_width == self.bin_width
+        for start, count in other.bins.items():
+            self.bins[start] = self.bins.get(start, 0) + count
+
+    def result(self) -> Dict[int, int]:
+        return dict(sorted(self.bins.items()))
+
+
+class WinRateAccumulator(Accumulator):
+    """Win rate per key of (won, played) pairs, e.g. of CardWins."""
+
+    def __init__(self) -> None:
+        self.games: Dict[Any, Tuple[int, int]] = {}
+
+    def add(self, value: Any) -> None:
+        games = self.games
+        for key, (won, played) in value.items():
+            total_won, total_played = games.get(key, (0, 0))
+            games[key] = (total_won + won, total_played + played)
+
+    def merge(self, other: Accumulator) -> None:
+        assert isinstance(other, WinRateAccumulator)
+        self.add(other.games)
+
+    def result(self) -> Dict[Any, float]:
+        return {key: won / played for key, (won, played) in self.games.items() if played}
+
+
+def aggregate(rows: Iterable[Dict[str, Any]],
+              accumulators: Dict[str, Accumulator]) -> Dict[str, Accumulator]:
+    """Fold rows into the accumulator registered for each extractor name."""
+    for row in rows:
+        for name, accumulator in accumulators.items():
+            accumulator.add(row[name])
+    return accumulators
@@ -0,0 +1,177 @@
+"""
+Terra Futura: append-only archive of encoded games with random access.
+
+An archive is three files:
+
+``<path>``        an action log stream (see log_codec) holding every game
+``<path>.games``  one fixed-size entry per game: body offset and length,
+                  first turn entry and turn count
+``<path>.turns``  per game, the offset of every turn's first record
+                  relative to the game body
+
+The reader maps all three with mmap, so locating a game or a turn is a few
+struct reads and game bytes are handed out as memoryview slices without
+copying. Games are decoded with the format version named in the stream
+header; new games can only be appended to an archive of the current version.
+"""
+from __future__ import annotations
+import mmap
+import os
+import struct
+from typing import BinaryIO, Iterable, List, Optional, Tuple
+from terra_futura.action_log import ActionLog, ReplayEngine
+from terra_futura.interfaces import TerraFuturaInterface
+from terra_futura.log_codec import (
+    MAGIC,
+    VERSION,
+    CodecError,
+    encode_log,
+    format_of,
+    write_varint,
+)
+
+GAME_ENTRY = struct.Struct("<QIQI")
+TURN_ENTRY = struct.Struct("<I")
+HEADER = MAGIC + bytes([VERSION])
+
+
+class ArchiveWriter:
+    """Appends games to an archive, creating it if needed."""
+
+    def __init__(self, path: str):
+        """Open the archive files for appending."""
+        self._data: BinaryIO = open(path, "ab")  # pylint: disable=consider-using-with
+        self._games: BinaryIO = open(path + ".games", "ab")  # pylint: disable=consider-using-with
+        self._turns: BinaryIO = open(path + ".turns", "ab")  # pylint: disable=consider-using-with
+        self._offset = self._data.seek(0, os.SEEK_END)
+        if self._offset == 0:
+            self._offset = self._data.write(HEADER)
+        else:
+            with open(path, "rb") as data:
+                header = data.read(len(HEADER))
+            if header != HEADER:
+                self.close()
+                raise CodecError("Can only append to an archive of the current version")
+        self._turn_count = self._turns.seek(0, os.SEEK_END) // TURN_ENTRY.size
+
+    def append(self, log: ActionLog) -> int:
+        """Append one game and return its number in the archive."""
+        turn_starts: List[int] = []
+        body = encode_log(log, turn_starts)
+        frame = bytearray()
+        write_varint(frame, len(body))
+        body_offset = self._offset + len(frame)
+        frame += body
+        self._data.write(frame)
+        self._offset += len(frame)
+
+        self._turns.write(b"".join(TURN_ENTRY.pack(start) for start in turn_starts))
+        game = self._games.tell() // GAME_ENTRY.size
+        self._games.write(GAME_ENTRY.pack(body_offset, len(body),
+                                          self._turn_count, len(turn_starts)))
+        self._turn_count += len(turn_starts)
+        return game
+
+    def extend(self, logs: Iterable[ActionLog]) -> None:
+        for log in logs:
+            self.append(log)
+
+    def close(self) -> None:
+        """Flush and close; data is written before the index referring to it."""
+        self._data.close()
+        self._turns.close()
+        self._games.close()
+
+    def __enter__(self) -> ArchiveWriter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def _map(path: str) -> Optional[mmap.mmap]:
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class Archive:
+    """Read-only, memory-mapped view of an archive."""
+
+    def __init__(self, path: str):
+        """Map the archive files; games appended later need a new Archive."""
+        self._maps = [_map(path), _map(path + ".games"), _map(path + ".turns")]
+        data, games, turns = self._maps
+        try:
+            if data is not None and (len(data) <= len(MAGIC) or data[:len(MAGIC)] != MAGIC):
+                raise CodecError("Not an action log archive")
+            self._format = format_of(data[len(MAGIC)] if data is not None else VERSION)
+        except CodecError:
+            self._unmap()
+            raise
+        self._data = memoryview(data) if data is not None else memoryview(b"")
+        self._games = memoryview(games) if games is not None else memoryview(b"")
+        self._turns = memoryview(turns) if turns is not None else memoryview(b"")
+        self._size = len(self._games) // GAME_ENTRY.size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _entry(self, game: int) -> Tuple[int, int, int, int]:
+        if not 0 <= game < self._size:
+            raise IndexError(f"Game {game} is not in the archive")
+        return GAME_ENTRY.unpack_from(self._games, game * GAME_ENTRY.size)
+
+    def game_bytes(self, game: int) -> memoryview:
+        """Encoded game as a view into the mapped file."""
+        offset, length, _, _ = self._entry(game)
+        return self._data[offset:offset + length]
+
+    def turn_count(self, game: int) -> int:
+        return self._entry(game)[3]
+
+    def _turn_start(self, game: int, turn: int) -> int:
+        _, length, first, count = self._entry(game)
+        if turn == count:
+            return length
+        if not 0 <= turn < count:
+            raise IndexError(f"Game {game} has no turn {turn}")
+        return int(TURN_ENTRY.unpack_from(self._turns, (first + turn) * TURN_ENTRY.size)[0])
+
+    def turn_bytes(self, game: int, turn: int) -> memoryview:
+        """Encoded records of one turn (numbered from 0) as a view."""
+        body = self.game_bytes(game)
+        return body[self._turn_start(game, turn):self._turn_start(game, turn + 1)]
+
+    def log(self, game: int) -> ActionLog:
+        """Decode a whole game."""
+        return self._format.decode_log(self.game_bytes(game), 0)[0]
+
+    def log_before(self, game: int, turn: int) -> ActionLog:
+        """Decode only the records played before the given turn."""
+        body = self.game_bytes(game)
+        seed, player_ids, _, pos = self._format.decode_header(body, 0)
+        records = self._format.decode_records(body, pos, max(pos, self._turn_start(game, turn)))
+        return ActionLog(seed, player_ids, records)
+
+    def position(self, game: int, turn: int, engine: ReplayEngine) -> TerraFuturaInterface:
+        """Replay a game up to the start of the given turn."""
+        return engine.replay(self.log_before(game, turn))
+
+    def close(self) -> None:
+        """Release the views and unmap the files."""
+        for view in (self._data, self._games, self._turns):
+            view.release()
+        self._unmap()
+
+    def _unmap(self) -> None:
+        for mapped in self._maps:
+            if mapped is not None:
+                mapped.close()
+
+    def __enter__(self) -> Archive:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
@@ -0,0 +1,135 @@
+"""
+Terra Futura: asyncio fan-out of state notifications.
+
+AsyncGameObserver hands every notification to an event loop and returns at
+once; each registered observer is fed by its own task from a bounded queue.
+When a consumer falls behind and its queue is full, the oldest queued state
+is dropped, so a slow observer sees fewer, but always the latest, states and
+never delays the game or the other observers.
+
+Dropping only suits full states: patches of DeltaGameObserver depend on
+every earlier message and must not be coalesced.
+"""
+from __future__ import annotations
+import asyncio
+import inspect
+from collections import deque
+from typing import Callable, Deque, Dict, Optional
+from terra_futura.gameobserver import GameObserver
+from terra_futura.interfaces import ObserverInterface
+
+
+class QueueMetrics:
+    """Counters of one observer's queue."""
+
+    __slots__ = ("depth", "max_depth", "enqueued", "delivered", "dropped", "errors")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.max_depth = 0
+        self.enqueued = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+
+
+class _Outbox:
+    """Queue and delivery task of one observer; used on the loop only."""
+
+    def __init__(self, observer: ObserverInterface, maxsize: int):
+        self.observer = observer
+        self.queue: Deque[str] = deque()
+        self.maxsize = maxsize
+        self.ready = asyncio.Event()
+        self.idle = asyncio.Event()
+        self.idle.set()
+        self.metrics = QueueMetrics()
+        self.task: Optional[asyncio.Task[None]] = None
+
+    def put(self, state: str) -> None:
+        metrics = self.metrics
+        if len(self.queue) >= self.maxsize:
+            self.queue.popleft()
+            metrics.dropped += 1
+        self.queue.append(state)
+        metrics.enqueued += 1
+        metrics.depth = len(self.queue)
+        metrics.max_depth = max(metrics.max_depth, metrics.depth)
+        self.idle.clear()
+        self.ready.set()
+
+    async def run(self) -> None:
+        metrics = self.metrics
+        notify: Callable[[str], object] = self.observer.notify
+        while True:
+            await self.ready.wait()
+            while self.queue:
+                state = self.queue.popleft()
+                metrics.depth = len(self.queue)
+                try:
+                    result = notify(state)
+                    if inspect.isawaitable(result):
+                        await result
+                    metrics.delivered += 1
+                except Exception:  # pylint: disable=broad-exception-caught
+                    metrics.errors += 1
+            self.ready.clear()
+            self.idle.set()
+
+
+class AsyncGameObserver(GameObserver):
+    """GameObserver delivering notifications from tasks on an event loop.
+
+    notifyAll may be called from any thread, including the loop's own.
+    Observers may implement notify as a coroutine to await slow clients.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int = 8) -> None:
+        super().__init__()
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        self.loop = loop
+        self.maxsize = maxsize
+        self._outboxes: Dict[int, _Outbox] = {}
+
+    def register(self, player_id: int, observer: ObserverInterface) -> None:
+        super().register(player_id, observer)
+        self.loop.call_soon_threadsafe(self._start, player_id, observer)
+
+    def _start(self, player_id: int, observer: ObserverInterface) -> None:
+        old = self._outboxes.get(player_id)
+        if old is not None and old.task is not None:
+            old.task.cancel()
+        outbox = self._outboxes[player_id] = _Outbox(observer, self.maxsize)
+        outbox.task = self.loop.create_task(outbox.run())
+
+    def notifyAll(self, new_state: Dict[int, str]) -> None:
+        self.loop.call_soon_threadsafe(self._enqueue, dict(new_state))
+
+    def _enqueue(self, new_state: Dict[int, str]) -> None:
+        for player_id, state_string in new_state.items():
+            outbox = self._outboxes.get(player_id)
+            if outbox is not None:
+                outbox.put(state_string)
+
+    def metrics(self) -> Dict[int, QueueMetrics]:
+        """Queue metrics per registered player."""
+        return {player_id: outbox.metrics for player_id, outbox in self._outboxes.items()}
+
+    async def drain(self, timeout: Optional[float] = None) -> None:
+        """Wait until every queued notification has been delivered.
+
+        Raises TimeoutError when timeout seconds pass first.
+        """
+        waits = [outbox.idle.wait() for outbox in self._outboxes.values()]
+        await asyncio.wait_for(asyncio.gather(*waits), timeout)
+
+    async def close(self) -> None:
+        """Stop the delivery tasks; undelivered notifications are discarded."""
+        tasks = [outbox.task for outbox in self._outboxes.values() if outbox.task is not None]
+        for task in tasks:
+            task.cancel()
+        for outbox in self._outboxes.values():
+            outbox.idle.set()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._outboxes.clear()
@@ -1,9 +1,10 @@
-# pylint: disable=invalid-name, too-many-arguments, too-many-positional-arguments
+# pylint: disable=invalid-name, too-many-arguments, too-many-positional-arguments, too-many-instance-attributes
 from __future__ import annotations
 import json
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from terra_futura.interfaces import InterfaceCard, InterfaceEffect
 from terra_futura.simple_types import Resource, GridPosition
+from terra_futura.resource_bag import ResourceBag
 
 
 class Card(InterfaceCard):
@@ -16,37 +17,53 @@ class Card(InterfaceCard):
         lowerEffect: Optional[InterfaceEffect] = None,
         pos: GridPosition = GridPosition(0, 0)
     ):
-        self.resources = resources.copy()
+        self._bag = ResourceBag(resources)
         self.pollution_limit = pollutionSpacesL
         self.assistance = assistance
         self.upper_effect = upperEffect
         self.lower_effect = lowerEffect
         self._pos = pos
+        # Serialized state, dropped by every mutator; the effect part never changes.
+        self._dict: Optional[Dict[str, Any]] = None
+        self._state: Optional[str] = None
+        self._effects_state: Optional[str] = None
+
+    def _changed(self) -> None:
+        self._dict = None
+        self._state = None
+
+    @property
+    def resources(self) -> List[Resource]:
+        return self._bag.to_list()
+
+    @resources.setter
+    def resources(self, resources: List[Resource]) -> None:
+        self._bag = ResourceBag(resources)
+        self._changed()
+
+    def snapshot(self) -> int:
+        return self._bag.packed
+
+    def restore(self, snapshot: int) -> None:
+        self._bag = ResourceBag(packed=snapshot)
+        self._changed()
 
     def can_get_resources(self, resources: List[Resource]) -> bool:
-        temp = self.resources.copy()
-        for r in resources:
-            if r in temp:
-                temp.remove(r)
-            else:
-                return False
-        return True
+        return self._bag.contains(ResourceBag(resources))
 
     def get_resources(self, resources: List[Resource]) -> None:
-        if not self.can_get_resources(resources):
-            raise ValueError("Not enough resources")
-        for r in resources:
-            self.resources.remove(r)
+        self._bag.remove(ResourceBag(resources))
+        self._changed()
 
     def can_put_resources(self, resources: List[Resource]) -> bool:
-        pol_new = sum(r == Resource.POLLUTION for r in resources)
-        pol_old = sum(r == Resource.POLLUTION for r in self.resources)
-        return pol_new + pol_old <= self.pollution_limit
+        pol_new = resources.count(Resource.POLLUTION)
+        return pol_new + self._bag.pollution <= self.pollution_limit
 
     def put_resources(self, resources: List[Resource]) -> None:
         if not self.can_put_resources(resources):
             raise ValueError("Too much pollution")
-        self.resources.extend(resources)
+        self._bag.add(ResourceBag(resources))
+        self._changed()
 
     def check(self,
     inputs: List[Resource],
@@ -74,19 +91,33 @@ class Card(InterfaceCard):
 
     def set_position(self, pos: GridPosition) -> None:
         self._pos = pos
+        self._changed()
 
     def is_active(self) -> bool:
-        pol_count = sum(r == Resource.POLLUTION for r in self.resources)
-        return pol_count <= self.pollution_limit
+        return self._bag.pollution <= self.pollution_limit
 
-    def state(self) -> str:
-        return json.dumps({
-            "resources": [r.name.capitalize() for r in self.resources],
-            "pollution": sum(r == Resource.POLLUTION for r in self.resources),
+    def _resources_dict(self) -> Dict[str, Any]:
+        return {
+            "resources": [r.name.capitalize() for r in self._bag],
+            "pollution": self._bag.pollution,
             "pollution_limit": self.pollution_limit,
             "assistance": self.assistance,
-            "upper_effect": json.loads(self.upper_effect.state())
-            if self.upper_effect else None,
-            "lower_effect": json.loads(self.lower_effect.state())
-            if self.lower_effect else None,
-        })
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the cached state; callers must not modify it."""
+        if self._dict is None:
+            self._dict = self._resources_dict()
+            self._dict["upper_effect"] = self.upper_effect.to_dict() if self.upper_effect else None
+            self._dict["lower_effect"] = self.lower_effect.to_dict() if self.lower_effect else None
+        return self._dict
+
+    def state(self) -> str:
+        """Return the state as JSON, re-encoding only the resources after a change."""
+        if self._state is None:
+            if self._effects_state is None:
+                upper = self.upper_effect.state() if self.upper_effect else "null"
+                lower = self.lower_effect.state() if self.lower_effect else "null"
+                self._effects_state = f', "upper_effect": {upper}, "lower_effect": {lower}}}'
+            self._state = json.dumps(self._resources_dict())[:-1] + self._effects_state
+        return self._state
@@ -1,74 +1,158 @@
 # pylint: disable=invalid-name, too-few-public-methods, disable=unused-argument
 import json
-from collections import Counter
-from typing import List, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 from terra_futura.simple_types import Resource
 from terra_futura.interfaces import InterfaceEffect
+from terra_futura.resource_bag import pack, mask_of
 
 RAW_RESOURCES: Set[Resource] = {
     Resource.GREEN,
     Resource.RED,
     Resource.YELLOW,
 }
+NON_RAW_MASK = mask_of(r for r in Resource if r not in RAW_RESOURCES)
 
-class EffectTransformationFixed(InterfaceEffect):
+# (packed inputs, packed outputs, pollution)
+FixedSignature = Tuple[int, int, int]
+# (number of inputs, packed non-raw inputs, packed outputs, pollution)
+ArbitrarySignature = Tuple[int, int, int, int]
+
+
+def _fixed_signature(inputs: List[Resource], output: List[Resource],
+                     pollution: int) -> FixedSignature:
+    return pack(inputs), pack(output), pollution
+
+
+def _arbitrary_signature(inputs: List[Resource], output: List[Resource],
+                         pollution: int) -> ArbitrarySignature:
+    return len(inputs), pack(inputs) & NON_RAW_MASK, pack(output), pollution
+
+
+class _StateCache:
+    """Effects never change, so their state is built on first use and kept."""
+
+    _dict: Optional[Dict[str, Any]] = None
+    _state: Optional[str] = None
+
+    def _build(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the cached state; callers must not modify it."""
+        if self._dict is None:
+            self._dict = self._build()
+        return self._dict
+
+    def state(self) -> str:
+        if self._state is None:
+            self._state = json.dumps(self.to_dict())
+        return self._state
+
+
+class EffectTransformationFixed(_StateCache, InterfaceEffect):
     def __init__(self, input_res: List[Resource], output_res: List[Resource], pollution: int):
-        self._inputs = Counter(input_res)
-        self._outputs = Counter(output_res)
         self._pollution = pollution
+        self._inputs = input_res.copy()
+        self._outputs = output_res.copy()
         self._input_list = [str(r) for r in input_res]
         self._output_list = [str(r) for r in output_res]
+        self.signature = _fixed_signature(input_res, output_res, pollution)
+
+    @property
+    def inputs(self) -> List[Resource]:
+        return self._inputs
+
+    @property
+    def outputs(self) -> List[Resource]:
+        return self._outputs
+
+    @property
+    def pollution(self) -> int:
+        return self._pollution
 
     def check(self, inputs: List[Resource], output: List[Resource], pollution: int) -> bool:
-        return (Counter(inputs) == self._inputs and
-                Counter(output) == self._outputs and
-                pollution == self._pollution)
+        return _fixed_signature(inputs, output, pollution) == self.signature
 
     def has_assistance(self) -> bool:
         return False
 
-    def state(self) -> str:
-        return json.dumps({
+    def _build(self) -> Dict[str, Any]:
+        return {
             "type": "fixed",
             "inputs": self._input_list,
             "outputs": self._output_list,
             "pollution": self._pollution
-        })
+        }
 
 
-class EffectArbitraryBasic(InterfaceEffect):
+class EffectArbitraryBasic(_StateCache, InterfaceEffect):
     def __init__(self, from_count: int, output_res: List[Resource], pollution: int):
         self._from_count = from_count
-        self._outputs = Counter(output_res)
         self._pollution = pollution
+        self._outputs = output_res.copy()
         self._output_list = [str(r) for r in output_res]
+        self.signature = (from_count, 0, pack(output_res), pollution)
+
+    @property
+    def from_count(self) -> int:
+        return self._from_count
+
+    @property
+    def outputs(self) -> List[Resource]:
+        return self._outputs
+
+    @property
+    def pollution(self) -> int:
+        return self._pollution
 
     def check(self, inputs: List[Resource], output: List[Resource], pollution: int) -> bool:
         if len(inputs) != self._from_count:
             return False
-        for res in inputs:
-            if res not in RAW_RESOURCES:
-                return False
-        return (Counter(output) == self._outputs and
-                pollution == self._pollution)
+        return _arbitrary_signature(inputs, output, pollution) == self.signature
 
     def has_assistance(self) -> bool:
         return False
 
-    def state(self) -> str:
-        return json.dumps({
+    def _build(self) -> Dict[str, Any]:
+        return {
             "type": "arbitrary",
             "count_needed": self._from_count,
             "outputs": self._output_list,
             "pollution": self._pollution
-        })
+        }
 
-class EffectOr(InterfaceEffect):
+class EffectOr(_StateCache, InterfaceEffect):
     def __init__(self, effects: List[InterfaceEffect]):
         self._effects = effects
+        self._fixed: Set[FixedSignature] = set()
+        self._arbitrary: Set[ArbitrarySignature] = set()
+        self._others: List[InterfaceEffect] = []
+        self._compile(effects)
+
+    def _compile(self, effects: List[InterfaceEffect]) -> None:
+        for effect in effects:
+            if isinstance(effect, EffectTransformationFixed):
+                self._fixed.add(effect.signature)
+            elif isinstance(effect, EffectArbitraryBasic):
+                self._arbitrary.add(effect.signature)
+            elif isinstance(effect, EffectOr):
+                self._compile(effect.effects)
+            else:
+                self._others.append(effect)
+
+    @property
+    def effects(self) -> List[InterfaceEffect]:
+        return self._effects
 
     def check(self, inputs: List[Resource], output: List[Resource], pollution: int) -> bool:
-        for effect in self._effects:
+        packed_inputs = pack(inputs)
+        packed_output = pack(output)
+        if (packed_inputs, packed_output, pollution) in self._fixed:
+            return True
+        if self._arbitrary and (len(inputs), packed_inputs & NON_RAW_MASK,
+                                packed_output, pollution) in self._arbitrary:
+            return True
+        for effect in self._others:
             if effect.check(inputs, output, pollution):
                 return True
         return False
@@ -79,14 +163,19 @@ class EffectOr(InterfaceEffect):
                 return True
         return False
 
-    def state(self) -> str:
-        children_states = [json.loads(e.state()) for e in self._effects]
-        return json.dumps({
+    def _build(self) -> Dict[str, Any]:
+        return {
             "type": "or",
-            "options": children_states
-        })
+            "options": [e.to_dict() for e in self._effects]
+        }
+
+    def state(self) -> str:
+        if self._state is None:
+            self._state = '{"type": "or", "options": [' + \
+                ", ".join(e.state() for e in self._effects) + "]}"
+        return self._state
 
-class EffectAssistance(InterfaceEffect):
+class EffectAssistance(_StateCache, InterfaceEffect):
     def __init__(self) -> None:
         pass
 
@@ -96,10 +185,10 @@ class EffectAssistance(InterfaceEffect):
     def has_assistance(self) -> bool:
         return True
 
-    def state(self) -> str:
-        return json.dumps({"type": "assistance"})
+    def _build(self) -> Dict[str, Any]:
+        return {"type": "assistance"}
 
-class EffectPollutionTransfer(InterfaceEffect):
+class EffectPollutionTransfer(_StateCache, InterfaceEffect):
     def __init__(self) -> None:
         pass
 
@@ -109,5 +198,5 @@ class EffectPollutionTransfer(InterfaceEffect):
     def has_assistance(self) -> bool:
         return False
 
-    def state(self) -> str:
-        return json.dumps({"type": "pollution_transfer"})
+    def _build(self) -> Dict[str, Any]:
+        return {"type": "pollution_transfer"}
@@ -1,16 +1,25 @@
-from typing import Dict, List, Optional, Tuple
-# from enum import Enum
-# pylint: skip-file
-# mypy: ignore-errors
-from .interfaces import TerraFuturaInterface
+# pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-return-statements
+"""
+Terra Futura: the game, its players and the turn order.
+"""
+from __future__ import annotations
+import functools
+import json
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+from .interfaces import TerraFuturaInterface, InterfaceGrid, InterfaceCard, InterfacePile
+from .actions import CandidateAction, TakeCardAction, ActivateCardAction
 from .simple_types import Resource, GridPosition, CardSource, Deck, GameState
-from .grid import Grid
+from .grid import Grid, slot_of
+from .resource_bag import pack
 from .select_reward import SelectReward
 from .activation_pattern import ActivationPattern
 from .scoring_method import ScoringMethod
 from .process_action import ProcessAction
 from .process_action_assistance import ProcessActionAssistance
-from .pile import Pile
+from .pile import Pile, VISIBLE_CARDS
+from .journal import Journal
+from .zobrist import ZobristTable
+from .action_log import ActionLog, record_call
 
 
 class Player:
@@ -23,13 +32,150 @@ class Player:
         self.selected_scoring: Optional[ScoringMethod] = None
 
 
+class PlayerSnapshot:
+    """Mutable state of one player; patterns and scoring methods are shared."""
+
+    def __init__(self, player: Player):
+        self.grid = player.grid.snapshot()
+        self.patterns = [p.snapshot() for p in player.activation_patterns]
+        self.scorings = [m.snapshot() for m in player.scoring_methods]
+        self.selected_pattern = player.selected_pattern
+        self.selected_scoring = player.selected_scoring
+
+    def restore(self, player: Player) -> None:
+        player.grid.restore(self.grid)
+        for pattern, selected in zip(player.activation_patterns, self.patterns):
+            pattern.restore(selected)
+        for method, scoring in zip(player.scoring_methods, self.scorings):
+            method.restore(scoring)
+        player.selected_pattern = self.selected_pattern
+        player.selected_scoring = self.selected_scoring
+
+
+class GameSnapshot:
+    """Compact copy of the mutable game state, see Game.snapshot."""
+
+    # pylint: disable=too-many-instance-attributes, protected-access
+
+    def __init__(self, game: Game):
+        self.game_state = game._state
+        self.on_turn = game.on_turn
+        self.turn_number = game.turn_number
+        self.cards_to_activate = game._cards_to_activate.copy()
+        self.activation_complete = game._activation_complete
+        self.final_activation_phase = game._final_activation_phase
+        self.final_activated_players: FrozenSet[int] = frozenset(
+            game._final_activated_players
+        )
+        self.reward: Any = game._reward.snapshot()
+        self.reward_cell = game._reward_cell
+        self.hash = game.hash
+        self.log_length = len(game.action_log) if game.action_log is not None else 0
+        self.piles = {deck: pile.snapshot() for deck, pile in game.piles.items()}
+        self.players = {
+            pid: PlayerSnapshot(player) for pid, player in game.players.items()
+        }
+        self.cards: List[Tuple[InterfaceCard, int]] = []
+        for player in game.players.values():
+            for _, card in player.grid.get_cards():
+                self.cards.append((card, card.snapshot()))
+        for visible, hidden, discarded, _ in self.piles.values():
+            for sequence in (visible, hidden, discarded):
+                for card in sequence:
+                    if card is not None:
+                        self.cards.append((card, card.snapshot()))
+
+    def restore(self, game: Game) -> None:
+        game._state = self.game_state
+        game.on_turn = self.on_turn
+        game.turn_number = self.turn_number
+        game._cards_to_activate = self.cards_to_activate.copy()
+        game._activation_complete = self.activation_complete
+        game._final_activation_phase = self.final_activation_phase
+        game._final_activated_players = set(self.final_activated_players)
+        game._reward.restore(self.reward)
+        game._reward_cell = self.reward_cell
+        game.hash = self.hash
+        if game.action_log is not None:
+            game.action_log.truncate(self.log_length)
+        for deck, pile in game.piles.items():
+            pile.restore(self.piles[deck])
+        for pid, player in game.players.items():
+            self.players[pid].restore(player)
+        for card, resources in self.cards:
+            card.restore(resources)
+
+
+class _GridLookup(InterfaceGrid):
+    """Read-only view of a grid that remembers lookups made during a batch."""
+
+    def __init__(self, grid: InterfaceGrid):
+        self._grid = grid
+        self._cards: Dict[GridPosition, Optional[InterfaceCard]] = {}
+        self._activatable: Dict[GridPosition, bool] = {}
+        self._free: Dict[GridPosition, bool] = {}
+
+    def get_card(self, coordinate: GridPosition) -> Optional[InterfaceCard]:
+        if coordinate not in self._cards:
+            self._cards[coordinate] = self._grid.get_card(coordinate)
+        return self._cards[coordinate]
+
+    def find_card(self, card: InterfaceCard) -> Optional[GridPosition]:
+        return self._grid.find_card(card)
+
+    def can_put_card(self, coordinate: GridPosition) -> bool:
+        if coordinate not in self._free:
+            self._free[coordinate] = self._grid.can_put_card(coordinate)
+        return self._free[coordinate]
+
+    def can_be_activated(self, coordinate: GridPosition) -> bool:
+        if coordinate not in self._activatable:
+            self._activatable[coordinate] = self._grid.can_be_activated(coordinate)
+        return self._activatable[coordinate]
+
+
+def _action(action: Callable[..., bool]) -> Callable[..., bool]:
+    """Run a Game action as one undoable step that keeps the hash current."""
+    @functools.wraps(action)
+    def wrapper(self: Game, *args: Any, **kwargs: Any) -> bool:
+        # pylint: disable=protected-access
+        if self._action_depth:
+            return action(self, *args, **kwargs)
+        journal = self.journal
+        mark = journal.mark()
+        turn_key = self._turn_key()
+        if journal.enabled:
+            self._remember_turn()
+        self._action_depth += 1
+        try:
+            done = action(self, *args, **kwargs)
+        finally:
+            self._action_depth -= 1
+        if done:
+            self.hash ^= turn_key ^ self._turn_key()
+            log = self.action_log
+            if log is not None:
+                log.append(record_call(action.__name__, args, kwargs))
+                journal.record(log.pop)
+            if journal.enabled:
+                self._action_marks.append(mark)
+        elif journal.enabled:
+            journal.undo_to(mark)
+        return done
+    return wrapper
+
+
 class Game(TerraFuturaInterface):
-    def __init__(self, player_ids: List[int]):
+    # pylint: disable=too-many-instance-attributes, too-many-public-methods
+
+    def __init__(self, player_ids: List[int],
+                 piles: Optional[Dict[Deck, InterfacePile]] = None):
+        """Set up a game; piles default to empty ones and must hold every Deck."""
 
         if len(player_ids) < 2 or len(player_ids) > 5:
             raise ValueError("Game requires 2-5 players")
 
-        self.state = GameState.TAKE_CARD_NO_CARD_DISCARDED
+        self._state = GameState.TAKE_CARD_NO_CARD_DISCARDED
 
         self.players: Dict[int, Player] = {}
         for player_id in player_ids:
@@ -40,14 +186,14 @@ class Game(TerraFuturaInterface):
         self.on_turn = self.starting_player
         self.turn_number = 1
 
-        self.piles: Dict[Deck, Pile] = {
+        self.piles: Dict[Deck, InterfacePile] = piles if piles is not None else {
             Deck.I: Pile(),
             Deck.II: Pile()
         }
 
         self._reward = SelectReward()
         self.process_action = ProcessAction()
-        self.process_action_assistance = ProcessActionAssistance(self.select_reward)
+        self.process_action_assistance = ProcessActionAssistance(self._reward)
 
         self._cards_to_activate: List[GridPosition] = []
         self._activation_complete = False
@@ -55,6 +201,22 @@ class Game(TerraFuturaInterface):
         self._final_activation_phase: bool = False
         self._final_activated_players: set[int] = set()
 
+        self.journal = Journal()
+        self._action_depth = 0
+        self._action_marks: List[int] = []
+        self.process_action.journal = self.journal
+        self.process_action_assistance.journal = self.journal
+        for pile in self.piles.values():
+            if isinstance(pile, Pile):
+                pile.journal = self.journal
+
+        self._reward_cell: Optional[Tuple[int, GridPosition]] = None
+        self.action_log: Optional[ActionLog] = None
+        self.zobrist = ZobristTable()
+        self.hash = 0
+        self.rehash()
+
+    @_action
     def take_card(
         self,
         player_id: int,
@@ -64,7 +226,7 @@ class Game(TerraFuturaInterface):
         if not self._validate_player_turn(player_id):
             return False
 
-        if self.state not in [
+        if self._state not in [
             GameState.TAKE_CARD_NO_CARD_DISCARDED,
             GameState.TAKE_CARD_CARD_DISCARDED
         ]:
@@ -83,30 +245,43 @@ class Game(TerraFuturaInterface):
         if card is None:
             return False
 
+        self._remember_pile(pile)
+        self._remember(player.grid)
+        pile_key = self.zobrist.pile_slot(source.deck, pile, source.index)
         pile.take_card(source.index)
         player.grid.put_card(destination, card)
+        slot = slot_of(destination)
+        self.hash ^= (
+            pile_key
+            ^ self.zobrist.pile_slot(source.deck, pile, source.index)
+            ^ self.zobrist.placement(player_id, slot, card)
+            ^ self.zobrist.resources(player_id, slot, card.snapshot())
+        )
 
-        row_cards, col_cards = player.grid.get_row_and_column(destination)
-        unique_positions = list({(pos.x, pos.y): pos for pos in row_cards + col_cards}.values())
-        self._cards_to_activate = unique_positions
+        self._cards_to_activate = player.grid.get_cross(destination)
         self._activation_complete = False
-        self.state = GameState.ACTIVATE_CARD
+        self._state = GameState.ACTIVATE_CARD
         return True
 
+    @_action
     def discard_last_card_from_deck(self, player_id: int, deck: Deck) -> bool:
         if not self._validate_player_turn(player_id):
             return False
-        if self.state != GameState.TAKE_CARD_NO_CARD_DISCARDED:
+        if self._state != GameState.TAKE_CARD_NO_CARD_DISCARDED:
             return False
         if self._final_activation_phase:
             return False
 
         pile = self.piles[deck]
+        self._remember_pile(pile)
+        pile_key = self.zobrist.pile_slot(deck, pile, VISIBLE_CARDS)
         pile.remove_last_card()
+        self.hash ^= pile_key ^ self.zobrist.pile_slot(deck, pile, VISIBLE_CARDS)
 
-        self.state = GameState.TAKE_CARD_CARD_DISCARDED
+        self._state = GameState.TAKE_CARD_CARD_DISCARDED
         return True
 
+    @_action
     def activate_card(
         self,
         player_id: int,
@@ -117,10 +292,11 @@ class Game(TerraFuturaInterface):
         other_player_id: Optional[int],
         other_card: Optional[GridPosition]
     ) -> bool:
+        # pylint: disable=too-many-locals, too-many-branches
         if not self._validate_player_turn(player_id):
             return False
 
-        if self.state != GameState.ACTIVATE_CARD:
+        if self._state != GameState.ACTIVATE_CARD:
             return False
 
         player = self.players[player_id]
@@ -132,7 +308,13 @@ class Game(TerraFuturaInterface):
 
         is_assistance = other_player_id is not None and other_card is not None
 
-        if is_assistance:
+        cells = {(player_id, card)}
+        cells.update((player_id, pos) for _, pos in inputs)
+        if not is_assistance:
+            cells.update((player_id, pos) for pos in pollution)
+        resources_key = self._resources_key(cells)
+
+        if other_player_id is not None and other_card is not None:
             if other_player_id not in self.players:
                 return False
             other_player = self.players[other_player_id]
@@ -153,13 +335,15 @@ class Game(TerraFuturaInterface):
                 return False
 
             reward_resources = [resource for resource, _ in outputs]
+            self._remember(self._reward)
+            self._reward_cell = (other_player_id, other_card)
             self._reward.set_reward(
                 player=other_player_id,
                 card=other_card_obj,
                 reward=reward_resources
             )
 
-            self.state = GameState.SELECT_REWARD
+            self._state = GameState.SELECT_REWARD
 
         else:
             success = self.process_action.activate_card(
@@ -172,7 +356,10 @@ class Game(TerraFuturaInterface):
             if not success:
                 return False
 
+        self._remember(player.grid)
+        activated_key = self._activated_key(player_id)
         player.grid.set_activated(card)
+        self.hash ^= activated_key ^ self._activated_key(player_id)
 
         if card in self._cards_to_activate:
             self._cards_to_activate.remove(card)
@@ -180,33 +367,46 @@ class Game(TerraFuturaInterface):
         if len(self._cards_to_activate) == 0 and not is_assistance:
             self._activation_complete = True
 
+        self.hash ^= resources_key ^ self._resources_key(cells)
         return True
 
+    @_action
     def select_reward(self, player_id: int, resource: Resource) -> bool:
-        if self.state != GameState.SELECT_REWARD:
+        if self._state != GameState.SELECT_REWARD:
             return False
-        if self.select_reward.get_pending_player() != player_id:
+        if self._reward.get_pending_player() != player_id:
             return False
 
+        self._remember(self._reward)
+        reward_cells = [self._reward_cell] if self._reward_cell else []
+        for pid, pos in reward_cells:
+            self._remember(self.players[pid].grid.get_card(pos))
+        resources_key = self._resources_key(reward_cells)
         try:
             self._reward.select_reward(resource)
         except ValueError:
             return False
 
         self._reward.clear()
-        self.state = GameState.ACTIVATE_CARD
+        self._reward_cell = None
+        self.hash ^= resources_key ^ self._resources_key(reward_cells)
+        self._state = GameState.ACTIVATE_CARD
         return True
 
+    @_action
     def turn_finished(self, player_id: int) -> bool:
         if not self._validate_player_turn(player_id):
             return False
-        if self.state != GameState.ACTIVATE_CARD:
+        if self._state != GameState.ACTIVATE_CARD:
             return False
         if not self._activation_complete:
             return False
 
         player = self.players[player_id]
+        self._remember(player.grid)
+        activated_key = self._activated_key(player_id)
         player.grid.end_turn()
+        self.hash ^= activated_key ^ self._activated_key(player_id)
         self._cards_to_activate = []
         self._activation_complete = False
 
@@ -218,7 +418,7 @@ class Game(TerraFuturaInterface):
 
             if self.turn_number > total_turns:
                 self._final_activation_phase = True
-                self.state = GameState.SELECT_ACTIVATION_PATTERN
+                self._state = GameState.SELECT_ACTIVATION_PATTERN
                 self.on_turn = self.starting_player
                 self._final_activated_players.clear()
                 return True
@@ -227,24 +427,25 @@ class Game(TerraFuturaInterface):
             next_index = (current_index + 1) % len(self.player_order)
             self.on_turn = self.player_order[next_index]
 
-            self.state = GameState.TAKE_CARD_NO_CARD_DISCARDED
+            self._state = GameState.TAKE_CARD_NO_CARD_DISCARDED
             return True
 
         self._final_activated_players.add(player_id)
 
         if len(self._final_activated_players) == len(self.player_order):
-            self.state = GameState.SELECT_SCORING_METHOD
+            self._state = GameState.SELECT_SCORING_METHOD
             self.on_turn = self.starting_player
             return True
 
         current_index = self.player_order.index(self.on_turn)
         next_index = (current_index + 1) % len(self.player_order)
         self.on_turn = self.player_order[next_index]
-        self.state = GameState.SELECT_ACTIVATION_PATTERN
+        self._state = GameState.SELECT_ACTIVATION_PATTERN
         return True
 
+    @_action
     def select_activation_pattern(self, player_id: int, card: int) -> bool:
-        if self.state != GameState.SELECT_ACTIVATION_PATTERN:
+        if self._state != GameState.SELECT_ACTIVATION_PATTERN:
             return False
         if player_id != self.on_turn:
             return False
@@ -261,23 +462,32 @@ class Game(TerraFuturaInterface):
             return False
 
         pattern_obj = player.activation_patterns[card]
+        self._remember(pattern_obj)
+        self._remember(player.grid)
+        self._remember_attribute(player, "selected_pattern")
+        activated_key = self._activated_key(player_id)
         pattern_obj.select()
+        self.hash ^= activated_key ^ self._activated_key(player_id)
         player.selected_pattern = pattern_obj
 
-        pattern_cards = pattern_obj._pattern.copy()
+        # Positions without a card that can be activated are skipped.
+        pattern_cards = [pos for pos in (GridPosition(x, y) for x, y in pattern_obj.pattern)
+                         if player.grid.can_be_activated(pos)]
 
         if len(pattern_cards) == 0:
+            self._state = GameState.ACTIVATE_CARD
             self._activation_complete = True
             return self.turn_finished(player_id)
 
         self._cards_to_activate = pattern_cards
         self._activation_complete = False
-        self.state = GameState.ACTIVATE_CARD
+        self._state = GameState.ACTIVATE_CARD
         return True
 
 
+    @_action
     def select_scoring(self, player_id: int, card: int) -> bool:
-        if self.state != GameState.SELECT_SCORING_METHOD:
+        if self._state != GameState.SELECT_SCORING_METHOD:
             return False
         if player_id not in self.players:
             return False
@@ -292,6 +502,8 @@ class Game(TerraFuturaInterface):
             return False
 
         method = player.scoring_methods[card]
+        self._remember(method)
+        self._remember_attribute(player, "selected_scoring")
         player.selected_scoring = method
 
         player_resources = self._get_player_resources(player_id)
@@ -303,7 +515,7 @@ class Game(TerraFuturaInterface):
         )
 
         if all_selected:
-            self.state = GameState.FINISH
+            self._state = GameState.FINISH
             return True
 
         current_index = self.player_order.index(self.on_turn)
@@ -312,6 +524,197 @@ class Game(TerraFuturaInterface):
 
         return True
 
+    def mark(self) -> int:
+        """Return a journal position that undo_to can roll back to."""
+        return self.journal.mark()
+
+    def undo(self) -> bool:
+        """Revert the last successful action recorded in the journal."""
+        if not self._action_marks:
+            return False
+        self.journal.undo_to(self._action_marks.pop())
+        return True
+
+    def undo_to(self, mark: int) -> None:
+        """Revert every action recorded after the mark."""
+        self.journal.undo_to(mark)
+        while self._action_marks and self._action_marks[-1] >= mark:
+            self._action_marks.pop()
+
+    def _remember(self, obj: Any) -> None:
+        if self.journal.enabled:
+            self.journal.record(obj.restore, obj.snapshot())
+
+    def _remember_pile(self, pile: InterfacePile) -> None:
+        """Snapshot a pile that does not journal its own changes."""
+        if not isinstance(pile, Pile):
+            self._remember(pile)
+
+    def _remember_attribute(self, obj: Any, name: str) -> None:
+        if self.journal.enabled:
+            self.journal.record(setattr, obj, name, getattr(obj, name))
+
+    def _remember_turn(self) -> None:
+        self.journal.record(self._restore_turn, (
+            self._state,
+            self.on_turn,
+            self.turn_number,
+            self._cards_to_activate.copy(),
+            self._activation_complete,
+            self._final_activation_phase,
+            self._final_activated_players.copy(),
+            self._reward_cell,
+            self.hash,
+        ))
+
+    def _restore_turn(self, turn: Tuple[Any, ...]) -> None:
+        (self._state, self.on_turn, self.turn_number, cards_to_activate,
+         self._activation_complete, self._final_activation_phase,
+         final_activated_players, self._reward_cell, self.hash) = turn
+        self._cards_to_activate = cards_to_activate.copy()
+        self._final_activated_players = final_activated_players.copy()
+
+    def rehash(self) -> int:
+        """Recompute the Zobrist hash of the whole position from scratch."""
+        key = self._turn_key()
+        for pid, player in self.players.items():
+            key ^= self._activated_key(pid)
+            for pos, card in player.grid.get_cards():
+                slot = slot_of(pos)
+                key ^= self.zobrist.placement(pid, slot, card)
+                key ^= self.zobrist.resources(pid, slot, card.snapshot())
+        for deck, pile in self.piles.items():
+            key ^= self.zobrist.pile(deck, pile)
+        self.hash = key
+        return key
+
+    def _turn_key(self) -> int:
+        """Key of the turn state that actions replace wholesale."""
+        zobrist = self.zobrist
+        pending = 0
+        for pos in self._cards_to_activate:
+            slot = slot_of(pos)
+            if slot >= 0:
+                pending |= 1 << slot
+        key = (zobrist.turn(self._state, self.on_turn, self.turn_number)
+               ^ zobrist.activation(pending, self._activation_complete)
+               ^ zobrist.final_phase(self._final_activation_phase,
+                                     self._final_activated_players))
+        if self._reward_cell is not None:
+            pid, pos = self._reward_cell
+            key ^= zobrist.reward(pid, slot_of(pos), pack(self._reward.selection))
+        return key
+
+    def _activated_key(self, player_id: int) -> int:
+        return self.zobrist.activated(player_id, self.players[player_id].grid.activated_mask())
+
+    def _resources_key(self, cells: Any) -> int:
+        key = 0
+        for pid, pos in cells:
+            card = self.players[pid].grid.get_card(pos)
+            if card is not None:
+                key ^= self.zobrist.resources(pid, slot_of(pos), card.snapshot())
+        return key
+
+    def snapshot(self) -> GameSnapshot:
+        """Copy the mutable state; effects and card definitions are shared."""
+        return GameSnapshot(self)
+
+    def restore(self, snapshot: GameSnapshot) -> None:
+        """Return the game to a state captured by snapshot, forgetting the journal."""
+        snapshot.restore(self)
+        self.journal.clear()
+        self._action_marks.clear()
+
+    def validate_many(
+        self,
+        player_id: int,
+        candidates: List[CandidateAction]
+    ) -> List[bool]:
+        """Check candidate actions against the current state without applying them."""
+        if not self._validate_player_turn(player_id) or player_id not in self.players:
+            return [False] * len(candidates)
+
+        can_take = (
+            self._state in [
+                GameState.TAKE_CARD_NO_CARD_DISCARDED,
+                GameState.TAKE_CARD_CARD_DISCARDED
+            ]
+            and not self._final_activation_phase
+        )
+        can_activate = self._state == GameState.ACTIVATE_CARD
+        grid = _GridLookup(self.players[player_id].grid)
+        other_grids: Dict[int, _GridLookup] = {}
+        pile_cards: Dict[Tuple[Deck, int], bool] = {}
+
+        verdicts: List[bool] = []
+        for candidate in candidates:
+            if isinstance(candidate, TakeCardAction):
+                verdicts.append(
+                    can_take and self._can_take(grid, pile_cards, candidate)
+                )
+            elif isinstance(candidate, ActivateCardAction):
+                verdicts.append(
+                    can_activate and self._can_activate(grid, other_grids, candidate)
+                )
+            else:
+                verdicts.append(False)
+        return verdicts
+
+    def _can_take(
+        self,
+        grid: _GridLookup,
+        pile_cards: Dict[Tuple[Deck, int], bool],
+        candidate: TakeCardAction
+    ) -> bool:
+        if not grid.can_put_card(candidate.destination):
+            return False
+        key = (candidate.source.deck, candidate.source.index)
+        if key not in pile_cards:
+            pile = self.piles[candidate.source.deck]
+            pile_cards[key] = pile.get_card(candidate.source.index) is not None
+        return pile_cards[key]
+
+    def _can_activate(
+        self,
+        grid: _GridLookup,
+        other_grids: Dict[int, _GridLookup],
+        candidate: ActivateCardAction
+    ) -> bool:
+        card_obj = grid.get_card(candidate.card)
+        if card_obj is None or not grid.can_be_activated(candidate.card):
+            return False
+
+        if candidate.other_player_id is None or candidate.other_card is None:
+            return self.process_action.plan_activation(
+                card_obj,
+                grid,
+                candidate.inputs,
+                candidate.outputs,
+                candidate.pollution
+            ) is not None
+
+        if candidate.other_player_id not in self.players:
+            return False
+        if candidate.other_player_id not in other_grids:
+            other_grids[candidate.other_player_id] = _GridLookup(
+                self.players[candidate.other_player_id].grid
+            )
+        other_card_obj = other_grids[candidate.other_player_id].get_card(
+            candidate.other_card
+        )
+        if other_card_obj is None:
+            return False
+        return self.process_action_assistance.can_activate_card(
+            card=card_obj,
+            grid=grid,
+            assisting_player=candidate.other_player_id,
+            assisting_card=other_card_obj,
+            inputs=candidate.inputs,
+            outputs=candidate.outputs,
+            pollution=[]
+        )
+
     def _validate_player_turn(self, player_id: int) -> bool:
         return self.on_turn == player_id
 
@@ -319,15 +722,36 @@ class Game(TerraFuturaInterface):
         player = self.players[player_id]
         total: List[Resource] = []
 
-        for _, card in player.grid._cards.items():
+        for _, card in player.grid.get_cards():
             for r in card.resources:
                 if r != Resource.POLLUTION:
                     total.append(r)
 
         return total
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the public game state as plain JSON-serializable objects."""
+        return {
+            "state": self._state.name,
+            "on_turn": self.on_turn,
+            "turn": self.turn_number,
+            "players": [
+                {
+                    "id": pid,
+                    "grid": player.grid.to_dict(),
+                    "scoring": player.selected_scoring.to_dict()
+                    if player.selected_scoring else None,
+                }
+                for pid, player in self.players.items()
+            ],
+            "piles": {deck.name: pile.to_dict() for deck, pile in self.piles.items()},
+        }
+
+    def state(self) -> str:
+        return json.dumps(self.to_dict())
+
     def get_state(self) -> GameState:
-        return self.state
+        return self._state
 
     def get_current_player(self) -> int:
         return self.on_turn
@@ -335,8 +759,18 @@ class Game(TerraFuturaInterface):
     def get_turn_number(self) -> int:
         return self.turn_number
 
+    def get_cards_to_activate(self) -> List[GridPosition]:
+        return self._cards_to_activate.copy()
+
+    def is_activation_complete(self) -> bool:
+        return self._activation_complete
+
+    def can_select_reward(self, resource: Resource) -> bool:
+        return self._state == GameState.SELECT_REWARD and \
+            self._reward.can_select_reward(resource)
+
     def get_winner(self) -> Optional[int]:
-        if self.state != GameState.FINISH:
+        if self._state != GameState.FINISH:
             return None
 
         best_player = None
@@ -1,7 +1,9 @@
 # pylint: disable=invalid-name, too-many-arguments, too-many-positional-arguments
 from __future__ import annotations
-from typing import Dict
+import json
+from typing import Any, Dict, Tuple
 from .interfaces import ObserverInterface
+from .state_patch import diff
 
 
 class GameObserver(ObserverInterface):
@@ -15,3 +17,73 @@ class GameObserver(ObserverInterface):
         for player_id, state_string in new_state.items():
             if player_id in self.observers:
                 self.observers[player_id].notify(state_string)
+
+
+class DeltaGameObserver(GameObserver):
+    """Sends every player versioned patches instead of full states.
+
+    A player gets a keyframe (the full state) first, after a resync and
+    every ``keyframe_interval`` versions, and otherwise a patch against the
+    last acknowledged version. Without ``wait_for_ack`` every sent version
+    counts as acknowledged. Messages are JSON::
+
+        {"version": 7, "state": {...}}
+        {"version": 8, "base": 7, "patch": [{"op": "replace", ...}]}
+
+    States passed in are kept as bases and must not be modified afterwards;
+    unchanged to_dict() fragments are shared objects and are not diffed.
+    """
+
+    def __init__(self, keyframe_interval: int = 32, wait_for_ack: bool = False) -> None:
+        super().__init__()
+        self.keyframe_interval = keyframe_interval
+        self.wait_for_ack = wait_for_ack
+        self.versions: Dict[int, int] = {}
+        self.bytes_sent = 0
+        self._keyframes: Dict[int, int] = {}
+        self._acked: Dict[int, Tuple[int, Any]] = {}
+        self._pending: Dict[int, Dict[int, Any]] = {}
+
+    def notifyAll(self, new_state: Dict[int, str]) -> None:
+        self.notifyAllStates({player_id: json.loads(state_string)
+                              for player_id, state_string in new_state.items()
+                              if player_id in self.observers})
+
+    def notifyAllStates(self, new_state: Dict[int, Any]) -> None:
+        """Notify with structured states, e.g. built from to_dict()."""
+        for player_id, state in new_state.items():
+            if player_id in self.observers:
+                message = self._message(player_id, state)
+                self.bytes_sent += len(message)
+                self.observers[player_id].notify(message)
+
+    def _message(self, player_id: int, state: Any) -> str:
+        version = self.versions.get(player_id, 0) + 1
+        self.versions[player_id] = version
+        base = self._acked.get(player_id)
+        pending = self._pending.setdefault(player_id, {})
+        if base is None or version - self._keyframes.get(player_id, 0) >= self.keyframe_interval:
+            self._keyframes[player_id] = version
+            pending.clear()
+            message = json.dumps({"version": version, "state": state})
+        else:
+            message = json.dumps({"version": version, "base": base[0],
+                                  "patch": diff(base[1], state)})
+        if self.wait_for_ack:
+            pending[version] = state
+        else:
+            self._acked[player_id] = (version, state)
+        return message
+
+    def acknowledge(self, player_id: int, version: int) -> None:
+        """Record that a player applied a version; unknown versions are ignored."""
+        pending = self._pending.get(player_id, {})
+        if version in pending:
+            self._acked[player_id] = (version, pending[version])
+            for old in [v for v in pending if v <= version]:
+                del pending[old]
+
+    def resync(self, player_id: int) -> None:
+        """Send the player a keyframe next, e.g. after it reported a gap."""
+        self._acked.pop(player_id, None)
+        self._pending.pop(player_id, None)
@@ -0,0 +1,235 @@
+"""
+Terra Futura: player grid backed by a fixed 25-slot array and bitmasks.
+"""
+from __future__ import annotations
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from terra_futura.interfaces import InterfaceGrid, InterfaceCard
+from terra_futura.simple_types import GridPosition
+
+GRID_MIN = -2
+GRID_SIDE = 5
+GRID_SLOTS = GRID_SIDE * GRID_SIDE
+MAX_SPAN = 3
+ALL_SLOTS = (1 << GRID_SLOTS) - 1
+
+# (cards, occupied, rows, columns, turn, activated, activated turn, pattern)
+GridSnapshot = Tuple[Tuple[Optional[InterfaceCard], ...], int, int, int, int, int, int, int]
+
+POSITIONS: List[GridPosition] = [
+    GridPosition(i % GRID_SIDE + GRID_MIN, i // GRID_SIDE + GRID_MIN)
+    for i in range(GRID_SLOTS)
+]
+ROW_MASK: List[int] = [
+    ((1 << GRID_SIDE) - 1) << (GRID_SIDE * row) for row in range(GRID_SIDE)
+]
+COLUMN_MASK: List[int] = [
+    sum(1 << (GRID_SIDE * row + col) for row in range(GRID_SIDE))
+    for col in range(GRID_SIDE)
+]
+
+
+def _neighbours(slot: int) -> int:
+    col, row = slot % GRID_SIDE, slot // GRID_SIDE
+    mask = 0
+    for d_col, d_row in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+        if 0 <= col + d_col < GRID_SIDE and 0 <= row + d_row < GRID_SIDE:
+            mask |= 1 << ((row + d_row) * GRID_SIDE + col + d_col)
+    return mask
+
+
+NEIGHBOUR_MASK: List[int] = [_neighbours(i) for i in range(GRID_SLOTS)]
+
+
+def slot_of(coordinate: GridPosition) -> int:
+    """Return the array index of a coordinate, or -1 if it is off the grid."""
+    col = coordinate.x - GRID_MIN
+    row = coordinate.y - GRID_MIN
+    if 0 <= col < GRID_SIDE and 0 <= row < GRID_SIDE:
+        return row * GRID_SIDE + col
+    return -1
+
+
+def positions_of(mask: int) -> List[GridPosition]:
+    """Return the positions of all slots set in the mask."""
+    result: List[GridPosition] = []
+    while mask:
+        low = mask & -mask
+        result.append(POSITIONS[low.bit_length() - 1])
+        mask ^= low
+    return result
+
+
+def _span(bits: int) -> int:
+    return bits.bit_length() - (bits & -bits).bit_length() + 1
+
+
+@lru_cache(maxsize=4096)
+def placeable_slots(occupied: int) -> int:
+    """Return the mask of slots a card may be put on, given the occupied mask."""
+    if not occupied:
+        return ALL_SLOTS
+    adjacent = rows = columns = 0
+    for slot in range(GRID_SLOTS):
+        if occupied >> slot & 1:
+            adjacent |= NEIGHBOUR_MASK[slot]
+            rows |= 1 << (slot // GRID_SIDE)
+            columns |= 1 << (slot % GRID_SIDE)
+    allowed = 0
+    for line in range(GRID_SIDE):
+        if _span(rows | 1 << line) <= MAX_SPAN:
+            allowed |= ROW_MASK[line]
+    allowed_columns = 0
+    for line in range(GRID_SIDE):
+        if _span(columns | 1 << line) <= MAX_SPAN:
+            allowed_columns |= COLUMN_MASK[line]
+    return adjacent & allowed & allowed_columns & ~occupied
+
+
+class Grid(InterfaceGrid):
+    # pylint: disable=too-many-instance-attributes
+    """Player grid of at most 3x3 cards placed within a 5x5 coordinate range."""
+
+    def __init__(self) -> None:
+        """Initialize an empty grid."""
+        self._cards: List[Optional[InterfaceCard]] = [None] * GRID_SLOTS
+        self._occupied = 0
+        self._rows = 0
+        self._columns = 0
+        self._turn = 0
+        self._activated = 0
+        self._activated_turn = 0
+        self._pattern = ALL_SLOTS
+
+    def get_card(self, coordinate: GridPosition) -> Optional[InterfaceCard]:
+        """Get a card at the given coordinate."""
+        slot = slot_of(coordinate)
+        return self._cards[slot] if slot >= 0 else None
+
+    def find_card(self, card: InterfaceCard) -> Optional[GridPosition]:
+        """Return the position of the given card object, if it is on the grid."""
+        slot = slot_of(card.get_position())
+        return POSITIONS[slot] if slot >= 0 and self._cards[slot] is card else None
+
+    def get_cards(self) -> List[Tuple[GridPosition, InterfaceCard]]:
+        """Return all placed cards with their positions."""
+        return [(POSITIONS[i], card) for i, card in enumerate(self._cards)
+                if card is not None]
+
+    def can_put_card(self, coordinate: GridPosition) -> bool:
+        """Check if a card can be placed at the coordinate."""
+        slot = slot_of(coordinate)
+        if slot < 0 or self._occupied >> slot & 1:
+            return False
+        if self._occupied == 0:
+            return True
+        if not self._occupied & NEIGHBOUR_MASK[slot]:
+            return False
+        rows = self._rows | 1 << (slot // GRID_SIDE)
+        columns = self._columns | 1 << (slot % GRID_SIDE)
+        return _span(rows) <= MAX_SPAN and _span(columns) <= MAX_SPAN
+
+    def placeable_mask(self) -> int:
+        """Return the mask of slots where can_put_card holds."""
+        return placeable_slots(self._occupied)
+
+    def put_card(self, coordinate: GridPosition, card: InterfaceCard) -> None:
+        """Place a card at the given coordinate."""
+        if not self.can_put_card(coordinate):
+            raise ValueError("Card cannot be placed here")
+        slot = slot_of(coordinate)
+        self._cards[slot] = card
+        self._occupied |= 1 << slot
+        self._rows |= 1 << (slot // GRID_SIDE)
+        self._columns |= 1 << (slot % GRID_SIDE)
+        card.set_position(POSITIONS[slot])
+
+    def get_row_and_column(
+        self,
+        coordinate: GridPosition
+    ) -> Tuple[List[GridPosition], List[GridPosition]]:
+        """Return occupied positions in the row and in the column of the coordinate."""
+        slot = slot_of(coordinate)
+        if slot < 0:
+            return [], []
+        return (positions_of(self._occupied & ROW_MASK[slot // GRID_SIDE]),
+                positions_of(self._occupied & COLUMN_MASK[slot % GRID_SIDE]))
+
+    def get_cross(self, coordinate: GridPosition) -> List[GridPosition]:
+        """Return occupied positions sharing the row or column, each once."""
+        slot = slot_of(coordinate)
+        if slot < 0:
+            return []
+        cross = ROW_MASK[slot // GRID_SIDE] | COLUMN_MASK[slot % GRID_SIDE]
+        return positions_of(self._occupied & cross)
+
+    def activated_mask(self) -> int:
+        """Bit mask of the slots activated in the current turn."""
+        return self._activated if self._activated_turn == self._turn else 0
+
+    def can_be_activated(self, coordinate: GridPosition) -> bool:
+        """Check if a card at the coordinate can be activated."""
+        slot = slot_of(coordinate)
+        if slot < 0:
+            return False
+        bit = 1 << slot
+        if not self._occupied & self._pattern & bit or self.activated_mask() & bit:
+            return False
+        card = self._cards[slot]
+        return card is not None and card.is_active()
+
+    def set_activated(self, coordinate: GridPosition) -> None:
+        """Mark the card at the coordinate as activated."""
+        slot = slot_of(coordinate)
+        if slot < 0 or not self._occupied >> slot & 1:
+            raise ValueError("No card to activate")
+        self._activated = self.activated_mask() | 1 << slot
+        self._activated_turn = self._turn
+
+    def set_activation_pattern(self, pattern: List[GridPosition]) -> None:
+        """Start a new activation round limited to the given positions."""
+        self._turn += 1
+        self._pattern = 0
+        for coordinate in pattern:
+            slot = slot_of(coordinate)
+            if slot >= 0:
+                self._pattern |= 1 << slot
+
+    def end_turn(self) -> None:
+        """End the current turn, forgetting all activations."""
+        self._turn += 1
+        self._pattern = ALL_SLOTS
+
+    def snapshot(self) -> GridSnapshot:
+        """Return a copy of the mutable grid state."""
+        return (tuple(self._cards), self._occupied, self._rows, self._columns,
+                self._turn, self._activated, self._activated_turn, self._pattern)
+
+    def restore(self, snapshot: GridSnapshot) -> None:
+        """Restore a state returned by snapshot."""
+        cards, self._occupied, self._rows, self._columns, \
+            self._turn, self._activated, self._activated_turn, self._pattern = snapshot
+        self._cards = list(cards)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the grid state as plain JSON-serializable objects."""
+        activated = self.activated_mask()
+        return {
+            "cards": [
+                {
+                    "position": [pos.x, pos.y],
+                    "card": card.to_dict(),
+                    "activated": bool(activated >> slot_of(pos) & 1),
+                }
+                for pos, card in self.get_cards()
+            ]
+        }
+
+    def state(self) -> str:
+        """Return the grid state as JSON, spliced from the cards' cached states."""
+        activated = self.activated_mask()
+        return '{"cards": [' + ", ".join(
+            f'{{"position": [{pos.x}, {pos.y}], "card": {card.state()}, '
+            f'"activated": {"true" if activated >> slot_of(pos) & 1 else "false"}}}'
+            for pos, card in self.get_cards()
+        ) + "]}"
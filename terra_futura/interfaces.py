@@ -1,8 +1,8 @@
 # pylint: disable=unused-argument, duplicate-code, redefined-builtin, too-many-arguments, too-many-positional-arguments
 """Interfaces for Terra Futura game entities and actions."""
 from __future__ import annotations
-from typing import List, Tuple, Optional, Protocol, TYPE_CHECKING
-from terra_futura.simple_types import GridPosition, Resource, CardSource
+from typing import Any, Dict, List, Tuple, Optional, Protocol, TYPE_CHECKING
+from terra_futura.simple_types import GridPosition, Resource, CardSource, Deck, GameState
 
 if TYPE_CHECKING:
     from terra_futura.card import Card
@@ -47,6 +47,14 @@ class InterfaceSelectReward:
         """Return the state of reward selection."""
         assert False
 
+    def snapshot(self) -> Any:
+        """Return a copy of the mutable reward selection state."""
+        assert False
+
+    def restore(self, snapshot: Any) -> None:
+        """Restore a state returned by snapshot."""
+        assert False
+
 
 class InterfaceProcessActionAssistance:
     """Interface for processing assistance actions on cards."""
@@ -74,6 +82,14 @@ class RandomProviderInterface:
         """Pop a card from the given list."""
         assert False
 
+    def snapshot(self) -> Any:
+        """Return the position of the random stream."""
+        assert False
+
+    def restore(self, state: Any) -> None:
+        """Return to a position returned by snapshot."""
+        assert False
+
 
 class InterfaceCard:
     # pylint: disable=redefined-builtin
@@ -114,6 +130,9 @@ class InterfaceCard:
     def has_assistance(self) -> bool:
         assert False
 
+    def to_dict(self) -> Dict[str, Any]:
+        assert False
+
     def state(self) -> str:
         assert False
 
@@ -123,6 +142,15 @@ class InterfaceCard:
     def get_position(self) -> GridPosition:
         raise NotImplementedError
 
+    def set_position(self, pos: GridPosition) -> None:
+        assert False
+
+    def snapshot(self) -> int:
+        assert False
+
+    def restore(self, snapshot: int) -> None:
+        assert False
+
 
 class ObserverInterface:
     def notify(self, game_state: str) -> None:
@@ -140,6 +168,9 @@ class InterfaceEffect(Protocol):
     def has_assistance(self) -> bool:
         raise NotImplementedError
 
+    def to_dict(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
     def state(self) -> str:
         raise NotImplementedError
 
@@ -150,6 +181,14 @@ class InterfaceGrid:
         """Get a card at the given coordinate."""
         assert False
 
+    def get_cards(self) -> List[Tuple[GridPosition, InterfaceCard]]:
+        """Return all placed cards with their positions."""
+        assert False
+
+    def find_card(self, card: InterfaceCard) -> Optional[GridPosition]:
+        """Return the position of the given card object, if it is on the grid."""
+        assert False
+
     def can_put_card(self, coordinate: GridPosition) -> bool:
         """Check if a card can be placed at the coordinate."""
         assert False
@@ -177,8 +216,20 @@ class InterfaceGrid:
         """End the current turn."""
         assert False
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the grid state as plain JSON-serializable objects."""
+        assert False
+
     def state(self) -> str:
-        """Return the grid state as a JSON-serializable string."""
+        """Return the grid state as a JSON string."""
+        assert False
+
+    def snapshot(self) -> Any:
+        """Return a copy of the mutable grid state."""
+        assert False
+
+    def restore(self, snapshot: Any) -> None:
+        """Restore a state returned by snapshot."""
         assert False
 
 class InterfacePile:
@@ -196,15 +247,34 @@ class InterfacePile:
         """Remove the last visible card and move it to the discard pile."""
         assert False
 
+    def sizes(self) -> Tuple[int, int]:
+        """Return the numbers of hidden and discarded cards."""
+        assert False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the pile state as plain JSON-serializable objects."""
+        assert False
+
     def state(self) -> str:
         """Return the pile state as a JSON-serializable string."""
         assert False
+
+    def snapshot(self) -> Any:
+        """Return the card sequences of the pile (visible, hidden, discarded)
+        followed by the position of its random stream."""
+        assert False
+
+    def restore(self, snapshot: Any) -> None:
+        """Restore card sequences returned by snapshot."""
+        assert False
 class TerraFuturaInterface:
+    hash: int
+
     def take_card(self, player_id: int, source: CardSource,
                  destination: GridPosition) -> bool:
         raise NotImplementedError
 
-    def discard_last_card_from_deck(self, player_id: int, deck: CardSource) -> bool:
+    def discard_last_card_from_deck(self, player_id: int, deck: Deck) -> bool:
         raise NotImplementedError
 
     def activate_card(
@@ -233,3 +303,18 @@ class TerraFuturaInterface:
 
     def state(self) -> str:
         raise NotImplementedError
+
+    def get_state(self) -> GameState:
+        raise NotImplementedError
+
+    def get_current_player(self) -> int:
+        raise NotImplementedError
+
+    def get_winner(self) -> Optional[int]:
+        raise NotImplementedError
+
+    def snapshot(self) -> Any:
+        raise NotImplementedError
+
+    def restore(self, snapshot: Any) -> None:
+        raise NotImplementedError
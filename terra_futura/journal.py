@@ -0,0 +1,38 @@
+"""
+Terra Futura: journal of undo steps for rolling back game actions.
+"""
+from __future__ import annotations
+from typing import Any, Callable, List, Tuple
+
+
+class Journal:
+    """Stack of undo steps, each a function and the arguments restoring a change."""
+
+    def __init__(self, enabled: bool = False):
+        """Initialize an empty journal."""
+        self.enabled = enabled
+        self._entries: List[Tuple[Callable[..., Any], Tuple[Any, ...]]] = []
+
+    def record(self, undo: Callable[..., Any], *args: Any) -> None:
+        """Remember how to revert a change that is about to happen."""
+        if self.enabled:
+            self._entries.append((undo, args))
+
+    def mark(self) -> int:
+        """Return a position that undo_to can roll back to."""
+        return len(self._entries)
+
+    def undo_to(self, mark: int) -> None:
+        """Revert every change recorded after the mark, newest first."""
+        entries = self._entries
+        while len(entries) > mark:
+            undo, args = entries.pop()
+            undo(*args)
+
+    def clear(self) -> None:
+        """Forget all recorded changes."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of recorded undo steps."""
+        return len(self._entries)
@@ -0,0 +1,368 @@
+"""
+Terra Futura: compact, versioned binary encoding of action logs.
+
+A stream starts with ``MAGIC`` and a version byte and holds any number of
+games, each prefixed by its varint byte length. A game is encoded as::
+
+    varint seed, varint player count, varint player ids,
+    varint record count, records
+
+and every record as a tag byte (action kind in the high nibble, a small
+operand in the low nibble), the varint player id and a kind-specific
+payload. Grid positions take one byte (x and y as signed nibbles),
+resources are nibbles packed two per byte and a card source is one byte
+(deck in the high nibble, pile index in the low one).
+"""
+from __future__ import annotations
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from terra_futura.action_log import ActionLog, ActionRecord
+from terra_futura.actions import (
+    Action,
+    ActivateCardAction,
+    DiscardCardAction,
+    FinishTurnAction,
+    SelectActivationPatternAction,
+    SelectRewardAction,
+    SelectScoringAction,
+    TakeCardAction,
+)
+from terra_futura.simple_types import CardSource, Deck, GridPosition, Resource
+
+MAGIC = b"TFL"
+VERSION = 1
+
+_TAKE = 0
+_DISCARD = 1
+_ACTIVATE = 2
+_REWARD = 3
+_FINISH = 4
+_PATTERN = 5
+_SCORING = 6
+
+_ASSISTED = 1
+
+# Encoded data may be read from bytes or from a zero-copy view of a file.
+Data = Union[bytes, bytearray, memoryview]
+
+_DECKS: Dict[int, Deck] = {deck.value: deck for deck in Deck}
+_RESOURCES: Dict[int, Resource] = {resource.value: resource for resource in Resource}
+
+
+def _position_byte(position: GridPosition) -> int:
+    if not (-8 <= position.x < 8 and -8 <= position.y < 8):
+        raise ValueError(f"Grid position {position} does not fit into one byte")
+    return (position.x & 0xF) << 4 | position.y & 0xF
+
+
+def _signed_nibble(value: int) -> int:
+    return value - 16 if value >= 8 else value
+
+
+# Decoded positions are shared; GridPosition is immutable.
+_POSITIONS: List[GridPosition] = [
+    GridPosition(_signed_nibble(byte >> 4), _signed_nibble(byte & 0xF)) for byte in range(256)
+]
+
+
+class CodecError(ValueError):
+    """The data is not a valid encoded action log."""
+
+
+def write_varint(out: bytearray, value: int) -> None:
+    """Append an unsigned LEB128 varint."""
+    if value < 0:
+        raise ValueError("Varints must not be negative")
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data: Data, pos: int) -> Tuple[int, int]:
+    """Return the varint at pos and the position after it."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _write_placed(out: bytearray, items: List[Tuple[Resource, GridPosition]]) -> None:
+    write_varint(out, len(items))
+    out.extend(_position_byte(position) for _, position in items)
+    for i in range(0, len(items), 2):
+        low = items[i + 1][0].value if i + 1 < len(items) else 0
+        out.append(items[i][0].value << 4 | low)
+
+
+def _read_placed(data: Data, pos: int) -> Tuple[List[Tuple[Resource, GridPosition]], int]:
+    count, pos = read_varint(data, pos)
+    positions = data[pos:pos + count]
+    pos += count
+    items: List[Tuple[Resource, GridPosition]] = []
+    for i, byte in enumerate(positions):
+        packed = data[pos + i // 2]
+        items.append((_RESOURCES[packed & 0xF if i & 1 else packed >> 4], _POSITIONS[byte]))
+    return items, pos + (count + 1) // 2
+
+
+def _encode_action(out: bytearray, player_id: int, action: Action) -> None:
+    # pylint: disable=too-many-branches
+    if isinstance(action, TakeCardAction):
+        source = action.source
+        if source.index >= 16:
+            raise ValueError("Pile index does not fit into a nibble")
+        out.append(_TAKE << 4)
+        write_varint(out, player_id)
+        out.append(source.deck.value << 4 | source.index)
+        out.append(_position_byte(action.destination))
+    elif isinstance(action, DiscardCardAction):
+        out.append(_DISCARD << 4 | action.deck.value)
+        write_varint(out, player_id)
+    elif isinstance(action, ActivateCardAction):
+        assisted = action.other_player_id is not None and action.other_card is not None
+        out.append(_ACTIVATE << 4 | (_ASSISTED if assisted else 0))
+        write_varint(out, player_id)
+        out.append(_position_byte(action.card))
+        _write_placed(out, action.inputs)
+        _write_placed(out, action.outputs)
+        write_varint(out, len(action.pollution))
+        out.extend(_position_byte(position) for position in action.pollution)
+        if assisted:
+            assert action.other_player_id is not None and action.other_card is not None
+            write_varint(out, action.other_player_id)
+            out.append(_position_byte(action.other_card))
+    elif isinstance(action, SelectRewardAction):
+        out.append(_REWARD << 4 | action.resource.value)
+        write_varint(out, player_id)
+    elif isinstance(action, FinishTurnAction):
+        out.append(_FINISH << 4)
+        write_varint(out, player_id)
+    elif isinstance(action, SelectActivationPatternAction):
+        out.append(_PATTERN << 4)
+        write_varint(out, player_id)
+        write_varint(out, action.card)
+    elif isinstance(action, SelectScoringAction):
+        out.append(_SCORING << 4)
+        write_varint(out, player_id)
+        write_varint(out, action.card)
+    else:
+        raise ValueError(f"Cannot encode {type(action).__name__}")
+
+
+def _decode_take(data: Data, pos: int, _operand: int) -> Tuple[Action, int]:
+    source = data[pos]
+    return TakeCardAction(CardSource(_DECKS[source >> 4], source & 0xF),
+                          _POSITIONS[data[pos + 1]]), pos + 2
+
+
+def _decode_discard(_data: Data, pos: int, operand: int) -> Tuple[Action, int]:
+    return DiscardCardAction(_DECKS[operand]), pos
+
+
+def _decode_activate(data: Data, pos: int, operand: int) -> Tuple[Action, int]:
+    card = _POSITIONS[data[pos]]
+    inputs, pos = _read_placed(data, pos + 1)
+    outputs, pos = _read_placed(data, pos)
+    count, pos = read_varint(data, pos)
+    pollution = [_POSITIONS[byte] for byte in data[pos:pos + count]]
+    pos += count
+    other_player_id: Optional[int] = None
+    other_card: Optional[GridPosition] = None
+    if operand & _ASSISTED:
+        other_player_id, pos = read_varint(data, pos)
+        other_card = _POSITIONS[data[pos]]
+        pos += 1
+    return ActivateCardAction(card, inputs, outputs, pollution,
+                              other_player_id, other_card), pos
+
+
+def _decode_reward(_data: Data, pos: int, operand: int) -> Tuple[Action, int]:
+    return SelectRewardAction(_RESOURCES[operand]), pos
+
+
+def _decode_finish(_data: Data, pos: int, _operand: int) -> Tuple[Action, int]:
+    return FinishTurnAction(), pos
+
+
+def _decode_pattern(data: Data, pos: int, _operand: int) -> Tuple[Action, int]:
+    card, pos = read_varint(data, pos)
+    return SelectActivationPatternAction(card), pos
+
+
+def _decode_scoring(data: Data, pos: int, _operand: int) -> Tuple[Action, int]:
+    card, pos = read_varint(data, pos)
+    return SelectScoringAction(card), pos
+
+
+_Decoder = Callable[[Data, int, int], Tuple[Action, int]]
+_DECODERS: Dict[int, _Decoder] = {
+    _TAKE: _decode_take,
+    _DISCARD: _decode_discard,
+    _ACTIVATE: _decode_activate,
+    _REWARD: _decode_reward,
+    _FINISH: _decode_finish,
+    _PATTERN: _decode_pattern,
+    _SCORING: _decode_scoring,
+}
+
+
+def encode_record(out: bytearray, record: ActionRecord) -> None:
+    """Append the encoding of one action record."""
+    _encode_action(out, record.player_id, record.action)
+
+
+def decode_record(data: Data, pos: int) -> Tuple[ActionRecord, int]:
+    """Decode the record at pos; return it and the position after it."""
+    tag = data[pos]
+    kind = tag >> 4
+    decoder = _DECODERS.get(kind)
+    if decoder is None:
+        raise CodecError(f"Unknown action kind {kind} at byte {pos}")
+    player_id, body = read_varint(data, pos + 1)
+    action, end = decoder(data, body, tag & 0xF)
+    if end > len(data):
+        raise IndexError("Record runs past the end of the data")
+    return ActionRecord(player_id, action), end
+
+
+def encode_log(log: ActionLog, turn_starts: Optional[List[int]] = None) -> bytes:
+    """Return the encoding of one game, without the length prefix.
+
+    If turn_starts is given, the byte offset of the first record of every
+    turn (the first record and every record after a finished turn) is
+    appended to it.
+    """
+    out = bytearray()
+    write_varint(out, log.seed)
+    write_varint(out, len(log.player_ids))
+    for player_id in log.player_ids:
+        write_varint(out, player_id)
+    write_varint(out, len(log.records))
+    turn_start = True
+    for record in log.records:
+        if turn_start and turn_starts is not None:
+            turn_starts.append(len(out))
+        _encode_action(out, record.player_id, record.action)
+        turn_start = isinstance(record.action, FinishTurnAction)
+    return bytes(out)
+
+
+def decode_header(data: Data, pos: int = 0) -> Tuple[int, List[int], int, int]:
+    """Decode seed, player ids and record count; return them and the records' position."""
+    seed, pos = read_varint(data, pos)
+    count, pos = read_varint(data, pos)
+    player_ids: List[int] = []
+    for _ in range(count):
+        player_id, pos = read_varint(data, pos)
+        player_ids.append(player_id)
+    count, pos = read_varint(data, pos)
+    return seed, player_ids, count, pos
+
+
+def decode_records(data: Data, pos: int, end: int) -> List[ActionRecord]:
+    """Decode every record between pos and end."""
+    records: List[ActionRecord] = []
+    try:
+        while pos < end:
+            record, pos = decode_record(data, pos)
+            records.append(record)
+    except (IndexError, KeyError) as error:
+        raise CodecError(f"Truncated or corrupt record at byte {pos}") from error
+    if pos != end:
+        raise CodecError("Record runs past the end of its range")
+    return records
+
+
+def decode_log(data: Data, pos: int = 0) -> Tuple[ActionLog, int]:
+    """Decode one game at pos; return it and the position after it."""
+    try:
+        seed, player_ids, count, pos = decode_header(data, pos)
+        records: List[ActionRecord] = []
+        for _ in range(count):
+            record, pos = decode_record(data, pos)
+            records.append(record)
+    except (IndexError, KeyError) as error:
+        raise CodecError(f"Truncated or corrupt game at byte {pos}") from error
+    return ActionLog(seed, player_ids, records), pos
+
+
+class LogFormat:
+    """Decoders of one format version."""
+
+    __slots__ = ("decode_log", "decode_header", "decode_records")
+
+    def __init__(self, log: Callable[[Data, int], Tuple[ActionLog, int]],
+                 header: Callable[[Data, int], Tuple[int, List[int], int, int]],
+                 records: Callable[[Data, int, int], List[ActionRecord]]):
+        self.decode_log = log
+        self.decode_header = header
+        self.decode_records = records
+
+
+# Decoders of every format version that can still be read.
+FORMATS: Dict[int, LogFormat] = {
+    VERSION: LogFormat(decode_log, decode_header, decode_records),
+}
+
+
+def format_of(version: int) -> LogFormat:
+    """Return the decoders of a version; raises CodecError if it can't be read."""
+    log_format = FORMATS.get(version)
+    if log_format is None:
+        raise CodecError(f"Unsupported action log version {version}")
+    return log_format
+
+
+class LogWriter:
+    """Writes a stream of encoded games to a binary file object."""
+
+    def __init__(self, stream: BinaryIO):
+        """Initialize and write the stream header."""
+        self._stream = stream
+        stream.write(MAGIC + bytes([VERSION]))
+
+    def write(self, log: ActionLog) -> int:
+        """Write one game and return the number of bytes written."""
+        body = encode_log(log)
+        frame = bytearray()
+        write_varint(frame, len(body))
+        frame += body
+        self._stream.write(frame)
+        return len(frame)
+
+    def write_all(self, logs: Iterable[ActionLog]) -> None:
+        for log in logs:
+            self.write(log)
+
+
+def read_logs(stream: BinaryIO) -> Iterator[ActionLog]:
+    """Lazily decode every game of a stream written by LogWriter."""
+    header = stream.read(len(MAGIC) + 1)
+    if len(header) != len(MAGIC) + 1 or header[:len(MAGIC)] != MAGIC:
+        raise CodecError("Not an action log stream")
+    decode = format_of(header[-1]).decode_log
+    while True:
+        length = 0
+        shift = 0
+        while True:
+            byte = stream.read(1)
+            if not byte:
+                if shift:
+                    raise CodecError("Truncated game length")
+                return
+            length |= (byte[0] & 0x7F) << shift
+            if byte[0] < 0x80:
+                break
+            shift += 7
+        body = stream.read(length)
+        if len(body) != length:
+            raise CodecError("Truncated game")
+        log, end = decode(body, 0)
+        if end != length:
+            raise CodecError("Game length does not match its content")
+        yield log
@@ -0,0 +1,169 @@
+"""
+Terra Futura: map-reduce of the analytics pipeline over an archive.
+
+The archive is split into shards of consecutive games. Every worker maps the
+archive itself and gets only the path and a game range, so no game data
+crosses process boundaries and throughput grows with the number of cores
+until the disk is saturated. Shard results are accumulators, merged in
+shard order on the caller's side.
+
+When an output directory is given, every finished shard is saved there as
+soon as it arrives, and a later run loads saved shards instead of
+recomputing them. Saved shards carry a fingerprint of the archive files
+(size and modification time) and of the job (factories and shard size);
+a shard saved by a different job or for a changed archive is recomputed.
+
+Game factories, extractor and accumulator factories are sent to the
+workers and must be picklable (module-level functions and classes are).
+"""
+from __future__ import annotations
+import hashlib
+import os
+import pickle
+import time
+from concurrent.futures import Executor, Future, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
+from terra_futura.action_log import GameFactory
+from terra_futura.analytics import (
+    Accumulator,
+    Extractor,
+    aggregate,
+    archive_source,
+    decode,
+    extract,
+    replay,
+)
+from terra_futura.archive import Archive
+from terra_futura.parallel_search import _Pool
+
+ExtractorFactory = Callable[[], List[Extractor]]
+AccumulatorFactory = Callable[[], Dict[str, Accumulator]]
+Shard = Tuple[int, int]
+
+
+def map_shard(path: str, shard: Shard, game_factory: GameFactory,
+              extractors: ExtractorFactory,
+              accumulators: AccumulatorFactory) -> Dict[str, Accumulator]:
+    """Aggregate the games of one shard of the archive at path."""
+    with Archive(path) as archive:
+        start, stop = shard
+        rows = extract(replay(decode(archive_source(archive, start, stop)), game_factory),
+                       extractors())
+        return aggregate(rows, accumulators())
+
+
+def _qualified_name(obj: object) -> str:
+    named = obj if hasattr(obj, "__qualname__") else type(obj)
+    return f"{getattr(named, '__module__', '')}.{getattr(named, '__qualname__', '')}"
+
+
+def shard_name(shard: Shard) -> str:
+    """File name of a saved shard result."""
+    return f"{shard[0]:012d}-{shard[1]:012d}.part"
+
+
+class MapReduce:
+    """Runs extractors over all games of an archive on a process pool."""
+
+    # pylint: disable=too-many-instance-attributes, too-many-arguments, too-many-positional-arguments
+
+    def __init__(
+        self,
+        path: str,
+        game_factory: GameFactory,
+        extractors: ExtractorFactory,
+        accumulators: AccumulatorFactory,
+        workers: int = 4,
+        shard_size: int = 1000,
+        output_dir: Optional[str] = None,
+        executor: Optional[Executor] = None
+    ):
+        self.path = path
+        self.game_factory = game_factory
+        self.extractors = extractors
+        self.accumulators = accumulators
+        self.shard_size = shard_size
+        self.output_dir = output_dir
+        self._pool = _Pool(workers, executor)
+        self.computed = 0
+        self.resumed = 0
+        self.seconds = 0.0
+
+    def shards(self) -> List[Shard]:
+        """Game ranges of the archive, in archive order."""
+        with Archive(self.path) as archive:
+            games = len(archive)
+        return [(start, min(start + self.shard_size, games))
+                for start in range(0, games, self.shard_size)]
+
+    def fingerprint(self) -> str:
+        """Digest of the archive files' sizes and times and of the job setup."""
+        parts: List[object] = []
+        for name in (self.path, self.path + ".games"):
+            stat = os.stat(name)
+            parts += [stat.st_size, stat.st_mtime_ns]
+        parts += [_qualified_name(factory) for factory in
+                  (self.game_factory, self.extractors, self.accumulators)]
+        parts.append(self.shard_size)
+        return hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+    def run(self) -> Dict[str, Accumulator]:
+        """Aggregate every game of the archive, reusing saved shards."""
+        start = time.perf_counter()
+        shards = self.shards()
+        fingerprint = self.fingerprint()
+        results: Dict[Shard, Dict[str, Accumulator]] = {}
+        futures: Dict[Future[Dict[str, Accumulator]], Shard] = {}
+        for shard in shards:
+            saved = self._load(shard, fingerprint)
+            if saved is not None:
+                results[shard] = saved
+            else:
+                futures[self._pool.get().submit(
+                    map_shard, self.path, shard, self.game_factory,
+                    self.extractors, self.accumulators)] = shard
+        self.resumed = len(results)
+        self.computed = len(futures)
+
+        for future in as_completed(futures):
+            shard = futures[future]
+            results[shard] = future.result()
+            self._save(shard, fingerprint, results[shard])
+
+        merged = self.accumulators()
+        for shard in shards:
+            for name, accumulator in merged.items():
+                accumulator.merge(results[shard][name])
+        self.seconds = time.perf_counter() - start
+        return merged
+
+    def _load(self, shard: Shard, fingerprint: str) -> Optional[Dict[str, Accumulator]]:
+        """Return a saved shard result, or None if it is missing or stale."""
+        if self.output_dir is None:
+            return None
+        try:
+            with open(os.path.join(self.output_dir, shard_name(shard)), "rb") as file:
+                saved: Tuple[str, Dict[str, Accumulator]] = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        return saved[1] if saved[0] == fingerprint else None
+
+    def _save(self, shard: Shard, fingerprint: str, result: Dict[str, Accumulator]) -> None:
+        """Write a shard result; a crash mid-write leaves no partial file."""
+        if self.output_dir is None:
+            return
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, shard_name(shard))
+        with open(path + ".tmp", "wb") as file:
+            pickle.dump((fingerprint, result), file)
+        os.replace(path + ".tmp", path)
+
+    def close(self) -> None:
+        """Shut down the process pool if this runner created it."""
+        self._pool.close()
+
+    def __enter__(self) -> MapReduce:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
@@ -0,0 +1,245 @@
+"""Monte Carlo Tree Search player driving a game through its public actions."""
+from __future__ import annotations
+import math
+import random
+import time
+from typing import Callable, Dict, List, Optional, Protocol, Tuple, cast
+from terra_futura.actions import Action
+from terra_futura.interfaces import TerraFuturaInterface
+from terra_futura.journal import Journal
+from terra_futura.simple_types import GameState
+
+Rewards = Dict[int, float]
+Evaluator = Callable[[TerraFuturaInterface], Rewards]
+
+
+class ActionSource(Protocol):
+    def legal_actions(self, terra_futura: TerraFuturaInterface) -> List[Action]:
+        raise NotImplementedError
+
+
+class RolloutPolicy(Protocol):
+    def choose(self, game: TerraFuturaInterface, actions: List[Action]) -> Action:
+        raise NotImplementedError
+
+
+class Journaled(Protocol):
+    def mark(self) -> int:
+        raise NotImplementedError
+
+    def undo_to(self, mark: int) -> None:
+        raise NotImplementedError
+
+
+def checkpoint(game: TerraFuturaInterface) -> Callable[[], None]:
+    """Return a function rolling the game back to its current position.
+
+    A game keeping an enabled journal is rolled back with undo_to, which
+    leaves the moves played before the checkpoint undoable; other games are
+    restored from a snapshot.
+    """
+    journal = getattr(game, "journal", None)
+    if isinstance(journal, Journal) and journal.enabled:
+        journaled = cast(Journaled, game)
+        mark = journaled.mark()
+        return lambda: journaled.undo_to(mark)
+    snapshot = game.snapshot()
+    return lambda: game.restore(snapshot)
+
+
+class RandomRollout:
+    """Rollout policy picking uniformly among legal actions."""
+
+    def __init__(self, seed: Optional[int] = None):
+        self._random = random.Random(seed)
+
+    def choose(self, game: TerraFuturaInterface, actions: List[Action]) -> Action:
+        # pylint: disable=unused-argument
+        return self._random.choice(actions)
+
+
+def play_out(game: TerraFuturaInterface, actions: ActionSource,
+             policy: RolloutPolicy, depth: int) -> None:
+    """Play up to depth policy moves or until no legal action is left."""
+    for _ in range(depth):
+        if game.get_state() == GameState.FINISH:
+            return
+        legal = actions.legal_actions(game)
+        if not legal:
+            return
+        if not policy.choose(game, legal).apply(game, game.get_current_player()):
+            return
+
+
+def winner_takes_all(game: TerraFuturaInterface) -> Rewards:
+    """Reward 1 for the winner of a finished game, nothing otherwise."""
+    winner = game.get_winner()
+    return {winner: 1.0} if winner is not None else {}
+
+
+class Node:
+    """Search tree node reached by playing action as player."""
+    # pylint: disable=too-many-instance-attributes
+
+    __slots__ = ("action", "player", "parent", "children", "untried",
+                 "visits", "value", "hash")
+
+    def __init__(self, action: Optional[Action], player: Optional[int],
+                 parent: Optional[Node], game_hash: int):
+        self.action = action
+        self.player = player
+        self.parent = parent
+        self.children: List[Node] = []
+        self.untried: Optional[List[Action]] = None
+        self.visits = 0
+        self.value = 0.0
+        self.hash = game_hash
+
+
+class SearchStats:
+    """Work done by the last search."""
+
+    def __init__(self, iterations: int, seconds: float):
+        self.iterations = iterations
+        self.seconds = seconds
+
+    @property
+    def iterations_per_second(self) -> float:
+        return self.iterations / self.seconds if self.seconds > 0 else 0.0
+
+
+class MCTSBot:
+    """UCT search over legal actions with pluggable rollouts.
+
+    The search plays iterations on the given game and rolls it back with
+    ``checkpoint`` afterwards. The tree below the chosen move is kept; call
+    ``advance`` with every action played on the real game so the next
+    search can start from the matching subtree.
+    """
+
+    # pylint: disable=too-many-instance-attributes, too-many-arguments, too-many-positional-arguments
+
+    def __init__(
+        self,
+        actions: ActionSource,
+        iterations: int = 1000,
+        time_limit: Optional[float] = None,
+        exploration: float = math.sqrt(2),
+        rollout_policy: Optional[RolloutPolicy] = None,
+        rollout_depth: int = 200,
+        evaluator: Evaluator = winner_takes_all,
+        seed: Optional[int] = None
+    ):
+        self._actions = actions
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.rollout_policy = rollout_policy or RandomRollout(seed)
+        self.rollout_depth = rollout_depth
+        self.evaluator = evaluator
+        self._random = random.Random(seed)
+        self._root: Optional[Node] = None
+        self.stats = SearchStats(0, 0.0)
+
+    def choose_action(self, game: TerraFuturaInterface) -> Optional[Action]:
+        """Search from the current position and return the most visited action."""
+        root = self._root
+        if root is None or root.hash != game.hash:
+            root = Node(None, None, None, game.hash)
+        self._root = root
+
+        rewind = checkpoint(game)
+        start = time.perf_counter()
+        try:
+            done = self._search(game, root, rewind, start)
+        finally:
+            rewind()
+        self.stats = SearchStats(done, time.perf_counter() - start)
+
+        if not root.children:
+            actions = self._actions.legal_actions(game)
+            return actions[0] if actions else None
+        return max(root.children, key=lambda child: child.visits).action
+
+    def action_statistics(self) -> List[Tuple[Action, int, float]]:
+        """Return (action, visits, value) of every searched root move."""
+        if self._root is None:
+            return []
+        return [(child.action, child.visits, child.value)
+                for child in self._root.children if child.action is not None]
+
+    def advance(self, action: Action) -> None:
+        """Move the root to the subtree of an action played on the real game."""
+        if self._root is None:
+            return
+        for child in self._root.children:
+            if child.action == action:
+                child.parent = None
+                self._root = child
+                return
+        self._root = None
+
+    def play(self, game: TerraFuturaInterface) -> Optional[Action]:
+        """Choose an action, play it for the player on turn and keep its subtree."""
+        action = self.choose_action(game)
+        if action is not None and action.apply(game, game.get_current_player()):
+            self.advance(action)
+            return action
+        return None
+
+    def _search(self, game: TerraFuturaInterface, root: Node,
+                rewind: Callable[[], None], start: float) -> int:
+        done = 0
+        while done < self.iterations or self.time_limit is not None:
+            if self.time_limit is not None and \
+                    time.perf_counter() - start >= self.time_limit:
+                break
+            node = self._descend(game, root)
+            play_out(game, self._actions, self.rollout_policy, self.rollout_depth)
+            self._backpropagate(node, self.evaluator(game))
+            rewind()
+            done += 1
+        return done
+
+    def _descend(self, game: TerraFuturaInterface, root: Node) -> Node:
+        """Select down the tree and expand one untried action."""
+        node = root
+        while node.untried is not None and not node.untried and node.children:
+            node = self._select_child(node)
+            assert node.action is not None
+            if not node.action.apply(game, game.get_current_player()):
+                break
+
+        if node.untried is None:
+            node.untried = self._legal_actions(game)
+            self._random.shuffle(node.untried)
+        while node.untried:
+            action = node.untried.pop()
+            player = game.get_current_player()
+            if action.apply(game, player):
+                child = Node(action, player, node, game.hash)
+                node.children.append(child)
+                node = child
+                break
+        return node
+
+    def _legal_actions(self, game: TerraFuturaInterface) -> List[Action]:
+        if game.get_state() == GameState.FINISH:
+            return []
+        return self._actions.legal_actions(game)
+
+    def _select_child(self, node: Node) -> Node:
+        log_visits = math.log(node.visits)
+        return max(
+            node.children,
+            key=lambda child: child.value / child.visits
+            + self.exploration * math.sqrt(log_visits / child.visits)
+        )
+
+    @staticmethod
+    def _backpropagate(node: Optional[Node], rewards: Rewards) -> None:
+        while node is not None:
+            node.visits += 1
+            if node.player is not None:
+                node.value += rewards.get(node.player, 0.0)
+            node = node.parent
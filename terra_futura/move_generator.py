@@ -0,0 +1,100 @@
+"""Lists the actions the player on turn can legally submit to a Game."""
+from __future__ import annotations
+from typing import TYPE_CHECKING, List, cast
+from terra_futura.actions import (
+    Action,
+    ActivateCardAction,
+    DiscardCardAction,
+    FinishTurnAction,
+    SelectActivationPatternAction,
+    SelectScoringAction,
+    TakeCardAction,
+)
+from terra_futura.activation_enumerator import ActivationEnumerator
+from terra_futura.grid import POSITIONS
+from terra_futura.interfaces import TerraFuturaInterface
+from terra_futura.simple_types import CardSource, Deck, GameState
+
+if TYPE_CHECKING:
+    from terra_futura.game import Game
+
+VISIBLE_CARDS = 4
+
+TAKE_STATES = (
+    GameState.TAKE_CARD_NO_CARD_DISCARDED,
+    GameState.TAKE_CARD_CARD_DISCARDED,
+)
+
+
+class MoveGenerator:
+    """Generates legal actions from the grid and pile state.
+
+    Assisted activations are not generated, they need a second player to
+    pick a reward. ``max_activations`` caps the activations listed per card
+    so that cards with many resource choices do not dominate the list.
+    Actions without resource choices are built once and shared between
+    calls.
+    """
+
+    def __init__(self, max_activations: int = 0):
+        """Initialize; a max_activations of 0 lists every activation."""
+        self._enumerator = ActivationEnumerator()
+        self._max_activations = max_activations
+        self._takes = {
+            (deck, index): [TakeCardAction(CardSource(deck, index), pos) for pos in POSITIONS]
+            for deck in Deck for index in range(VISIBLE_CARDS + 1)
+        }
+        self._discards = {deck: DiscardCardAction(deck) for deck in Deck}
+        self._finish = FinishTurnAction()
+        self._patterns: List[SelectActivationPatternAction] = []
+        self._scorings: List[SelectScoringAction] = []
+
+    def legal_actions(self, terra_futura: TerraFuturaInterface) -> List[Action]:
+        """Return the legal actions of the player on turn."""
+        # pylint: disable=too-many-locals, too-many-branches
+        game = cast("Game", terra_futura)
+        player_id = game.get_current_player()
+        player = game.players[player_id]
+        state = game.get_state()
+        actions: List[Action] = []
+
+        if state in TAKE_STATES:
+            free = [slot for slot, pos in enumerate(POSITIONS)
+                    if player.grid.can_put_card(pos)]
+            for deck in Deck:
+                pile = game.piles[deck]
+                for index in range(VISIBLE_CARDS + 1):
+                    if pile.get_card(index) is None:
+                        continue
+                    takes = self._takes[(deck, index)]
+                    actions.extend(takes[slot] for slot in free)
+                if state == GameState.TAKE_CARD_NO_CARD_DISCARDED:
+                    actions.append(self._discards[deck])
+
+        elif state == GameState.ACTIVATE_CARD:
+            for pos in game.get_cards_to_activate():
+                card = player.grid.get_card(pos)
+                if card is None:
+                    continue
+                listed = 0
+                for inputs, outputs, pollution in self._enumerator.activations(card, player.grid):
+                    actions.append(ActivateCardAction(pos, inputs, outputs, pollution))
+                    listed += 1
+                    if listed == self._max_activations:
+                        break
+            if game.is_activation_complete():
+                actions.append(self._finish)
+
+        elif state == GameState.SELECT_ACTIVATION_PATTERN:
+            if player.selected_pattern is None:
+                while len(self._patterns) < len(player.activation_patterns):
+                    self._patterns.append(SelectActivationPatternAction(len(self._patterns)))
+                actions.extend(self._patterns[:len(player.activation_patterns)])
+
+        elif state == GameState.SELECT_SCORING_METHOD:
+            if player.selected_scoring is None:
+                while len(self._scorings) < len(player.scoring_methods):
+                    self._scorings.append(SelectScoringAction(len(self._scorings)))
+                actions.extend(self._scorings[:len(player.scoring_methods)])
+
+        return actions
@@ -0,0 +1,240 @@
+"""Root- and leaf-parallel Monte Carlo Tree Search over a process pool.
+
+Every worker task is seeded from the search seed and its task index, and
+results are merged in task order, so a search with the same seed, worker
+count and iteration budget always picks the same action. Games, action
+sources, rollout factories and evaluators are sent to the workers and must
+be picklable (module-level functions and plain objects are).
+"""
+from __future__ import annotations
+import math
+import pickle
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from terra_futura.actions import Action
+from terra_futura.interfaces import TerraFuturaInterface
+from terra_futura.mcts import (
+    ActionSource,
+    Evaluator,
+    MCTSBot,
+    Node,
+    RandomRollout,
+    Rewards,
+    RolloutPolicy,
+    SearchStats,
+    play_out,
+    winner_takes_all,
+)
+from terra_futura.random_provider import split_seed
+
+RolloutFactory = Callable[[int], RolloutPolicy]
+
+
+def task_seed(seed: int, index: int) -> int:
+    """Seed of the index-th worker task of a search seeded with seed."""
+    return split_seed(seed, index)
+
+
+def _search_tree(game: TerraFuturaInterface, actions: ActionSource, iterations: int,
+                 seed: int, exploration: float, rollout_factory: RolloutFactory,
+                 rollout_depth: int, evaluator: Evaluator
+                 ) -> List[Tuple[Action, int, float]]:
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    bot = MCTSBot(actions, iterations=iterations, exploration=exploration,
+                  rollout_policy=rollout_factory(seed), rollout_depth=rollout_depth,
+                  evaluator=evaluator, seed=seed)
+    bot.choose_action(game)
+    return bot.action_statistics()
+
+
+def _rollout_paths(state: bytes, paths: List[List[Action]], seeds: List[int],
+                   actions: ActionSource, rollout_factory: RolloutFactory,
+                   rollout_depth: int, evaluator: Evaluator) -> List[Rewards]:
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    results: List[Rewards] = []
+    for path, seed in zip(paths, seeds):
+        game: TerraFuturaInterface = pickle.loads(state)
+        for action in path:
+            action.apply(game, game.get_current_player())
+        play_out(game, actions, rollout_factory(seed), rollout_depth)
+        results.append(evaluator(game))
+    return results
+
+
+class _Pool:
+    """Lazily created process pool, or an executor supplied by the caller."""
+
+    def __init__(self, workers: int, executor: Optional[Executor]):
+        self.workers = workers
+        self._executor = executor
+        self._owned = executor is None
+
+    def get(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def close(self) -> None:
+        if self._owned and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+class RootParallelSearch:
+    """Independent trees searched in parallel, merged by summing root visits.
+
+    The iteration budget is split over one tree per worker. Ties between
+    equally visited actions go to the action first seen in task order.
+    """
+
+    # pylint: disable=too-many-instance-attributes, too-many-arguments, too-many-positional-arguments
+
+    def __init__(
+        self,
+        actions: ActionSource,
+        workers: int = 4,
+        iterations: int = 1000,
+        exploration: float = math.sqrt(2),
+        rollout_factory: RolloutFactory = RandomRollout,
+        rollout_depth: int = 200,
+        evaluator: Evaluator = winner_takes_all,
+        seed: int = 0,
+        executor: Optional[Executor] = None
+    ):
+        self._actions = actions
+        self._pool = _Pool(workers, executor)
+        self.workers = workers
+        self.iterations = iterations
+        self.exploration = exploration
+        self.rollout_factory = rollout_factory
+        self.rollout_depth = rollout_depth
+        self.evaluator = evaluator
+        self.seed = seed
+        self.stats = SearchStats(0, 0.0)
+        self.visits: Dict[Action, Tuple[int, float]] = {}
+
+    def choose_action(self, game: TerraFuturaInterface) -> Optional[Action]:
+        """Search from the current position and return the most visited action."""
+        start = time.perf_counter()
+        shares = [self.iterations // self.workers + (i < self.iterations % self.workers)
+                  for i in range(self.workers)]
+        futures = [
+            self._pool.get().submit(
+                _search_tree, game, self._actions, share, task_seed(self.seed, i),
+                self.exploration, self.rollout_factory, self.rollout_depth, self.evaluator)
+            for i, share in enumerate(shares) if share > 0
+        ]
+        merged: Dict[Action, Tuple[int, float]] = {}
+        for future in futures:
+            for action, visits, value in future.result():
+                total_visits, total_value = merged.get(action, (0, 0.0))
+                merged[action] = (total_visits + visits, total_value + value)
+        self.visits = merged
+        self.stats = SearchStats(sum(shares), time.perf_counter() - start)
+
+        if not merged:
+            legal = self._actions.legal_actions(game)
+            return legal[0] if legal else None
+        return max(merged, key=lambda action: merged[action][0])
+
+    def close(self) -> None:
+        """Shut down the process pool if this search created it."""
+        self._pool.close()
+
+    def __enter__(self) -> RootParallelSearch:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class LeafParallelMCTS(MCTSBot):
+    """One tree whose rollouts are batched to a process pool.
+
+    Each round selects ``batch_size`` leaves, using a virtual loss (a visit
+    without reward) so that the leaves differ, and splits their rollouts
+    evenly over the workers. The game is pickled once per round and every
+    rollout replays its path from the root.
+    """
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+
+    def __init__(
+        self,
+        actions: ActionSource,
+        workers: int = 4,
+        batch_size: Optional[int] = None,
+        iterations: int = 1000,
+        exploration: float = math.sqrt(2),
+        rollout_factory: RolloutFactory = RandomRollout,
+        rollout_depth: int = 200,
+        evaluator: Evaluator = winner_takes_all,
+        seed: int = 0,
+        executor: Optional[Executor] = None
+    ):
+        super().__init__(actions, iterations=iterations, exploration=exploration,
+                         rollout_depth=rollout_depth, evaluator=evaluator, seed=seed)
+        self._pool = _Pool(workers, executor)
+        self.workers = workers
+        self.batch_size = batch_size or workers
+        self.rollout_factory = rollout_factory
+        self.seed = seed
+
+    def close(self) -> None:
+        """Shut down the process pool if this search created it."""
+        self._pool.close()
+
+    def __enter__(self) -> LeafParallelMCTS:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _search(self, game: TerraFuturaInterface, root: Node,
+                rewind: Callable[[], None], start: float) -> int:
+        # pylint: disable=too-many-locals
+        state = pickle.dumps(game)
+        done = 0
+        while done < self.iterations:
+            leaves: List[Node] = []
+            for _ in range(min(self.batch_size, self.iterations - done)):
+                leaf = self._descend(game, root)
+                rewind()
+                node: Optional[Node] = leaf
+                while node is not None:
+                    node.visits += 1
+                    node = node.parent
+                leaves.append(leaf)
+
+            paths = [self._path(leaf) for leaf in leaves]
+            seeds = [task_seed(self.seed, done + i) for i in range(len(leaves))]
+            chunk = -(-len(leaves) // self.workers)
+            futures = [
+                self._pool.get().submit(
+                    _rollout_paths, state, paths[i:i + chunk], seeds[i:i + chunk],
+                    self._actions, self.rollout_factory, self.rollout_depth, self.evaluator)
+                for i in range(0, len(leaves), chunk)
+            ]
+            rewards = [reward for future in futures for reward in future.result()]
+            for leaf, reward in zip(leaves, rewards):
+                self._add_value(leaf, reward)
+            done += len(leaves)
+        return done
+
+    @staticmethod
+    def _add_value(node: Optional[Node], rewards: Rewards) -> None:
+        """Backpropagate rewards along a path whose visits are already counted."""
+        while node is not None:
+            if node.player is not None:
+                node.value += rewards.get(node.player, 0.0)
+            node = node.parent
+
+    @staticmethod
+    def _path(node: Node) -> List[Action]:
+        path: List[Action] = []
+        while node.parent is not None and node.action is not None:
+            path.append(node.action)
+            node = node.parent
+        path.reverse()
+        return path
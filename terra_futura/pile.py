@@ -0,0 +1,128 @@
+"""
+Terra Futura: pile of one deck with a visible row, a hidden stack and discards.
+"""
+from __future__ import annotations
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from terra_futura.interfaces import InterfaceCard, InterfacePile, RandomProviderInterface
+from terra_futura.journal import Journal
+
+VISIBLE_CARDS = 4
+
+# (visible row, hidden stack, discarded cards, random stream position)
+PileSnapshot = Tuple[Tuple[Optional[InterfaceCard], ...], Tuple[InterfaceCard, ...],
+                     Tuple[InterfaceCard, ...], Any]
+
+
+class Pile(InterfacePile):
+    """Four visible cards over a hidden stack.
+
+    Index 0 is the top card of the hidden stack and indices 1 to 4 are the
+    visible cards. A visible card that is taken or discarded is replaced in
+    its place by the top hidden card, so the other visible cards keep their
+    indices. When the hidden stack runs out, the discarded cards are
+    shuffled back into it.
+
+    With a journal set, every change records its own undo step: the slot
+    and the card that moved, so undoing costs the same whatever the deck
+    size. Only a reshuffle records the whole discard pile.
+    """
+
+    def __init__(self, cards: Optional[List[InterfaceCard]] = None,
+                 random: Optional[RandomProviderInterface] = None):
+        """Shuffle the cards with random, if given, and deal the visible row."""
+        # pylint: disable=redefined-builtin
+        self._random = random
+        self.journal: Optional[Journal] = None
+        self._hidden: List[InterfaceCard] = list(cards) if cards else []
+        if random is not None:
+            random.shuffle(self._hidden)
+        self._discarded: List[InterfaceCard] = []
+        self._visible: List[Optional[InterfaceCard]] = [None] * VISIBLE_CARDS
+        for index in range(VISIBLE_CARDS):
+            self._visible[index] = self._draw()
+
+    def _record(self, undo: Callable[..., Any], *args: Any) -> None:
+        if self.journal is not None:
+            self.journal.record(undo, *args)
+
+    def _draw(self) -> Optional[InterfaceCard]:
+        if not self._hidden and self._discarded:
+            self._record(self._unshuffle, self._discarded.copy())
+            self._hidden, self._discarded = self._discarded, []
+            if self._random is not None:
+                self._record(self._random.restore, self._random.snapshot())
+                self._random.shuffle(self._hidden)
+        return self._pop_hidden()
+
+    def _pop_hidden(self) -> Optional[InterfaceCard]:
+        if not self._hidden:
+            return None
+        card = self._hidden.pop()
+        self._record(self._hidden_push, card)
+        return card
+
+    def _set_visible(self, index: int, card: Optional[InterfaceCard]) -> None:
+        self._record(self._put_visible, index, self._visible[index])
+        self._visible[index] = card
+
+    # Undo steps look the lists up when run, as a reshuffle replaces them.
+    def _put_visible(self, index: int, card: Optional[InterfaceCard]) -> None:
+        self._visible[index] = card
+
+    def _hidden_push(self, card: InterfaceCard) -> None:
+        self._hidden.append(card)
+
+    def _discarded_pop(self) -> None:
+        self._discarded.pop()
+
+    def _unshuffle(self, discarded: List[InterfaceCard]) -> None:
+        self._hidden, self._discarded = [], discarded
+
+    def get_card(self, index: int) -> Optional[InterfaceCard]:
+        if index == 0:
+            return self._hidden[-1] if self._hidden else None
+        if 1 <= index <= VISIBLE_CARDS:
+            return self._visible[index - 1]
+        return None
+
+    def take_card(self, index: int) -> Optional[InterfaceCard]:
+        if index == 0:
+            return self._pop_hidden()
+        card = self.get_card(index)
+        if card is not None:
+            self._set_visible(index - 1, self._draw())
+        return card
+
+    def remove_last_card(self) -> Optional[InterfaceCard]:
+        card = self._visible[-1]
+        if card is not None:
+            self._set_visible(VISIBLE_CARDS - 1, self._draw())
+            self._record(self._discarded_pop)
+            self._discarded.append(card)
+        return card
+
+    def sizes(self) -> Tuple[int, int]:
+        return len(self._hidden), len(self._discarded)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "visible": [card.to_dict() if card else None for card in self._visible],
+            "hidden": len(self._hidden),
+            "discarded": len(self._discarded),
+        }
+
+    def state(self) -> str:
+        return json.dumps(self.to_dict())
+
+    def snapshot(self) -> PileSnapshot:
+        random = self._random.snapshot() if self._random is not None else None
+        return tuple(self._visible), tuple(self._hidden), tuple(self._discarded), random
+
+    def restore(self, snapshot: PileSnapshot) -> None:
+        visible, hidden, discarded, random = snapshot
+        self._visible = list(visible)
+        self._hidden = list(hidden)
+        self._discarded = list(discarded)
+        if self._random is not None:
+            self._random.restore(random)
@@ -1,11 +1,27 @@
 # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals, too-many-return-statements, too-many-branches, invalid-name
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 from .simple_types import Resource, GridPosition
 from .interfaces import InterfaceCard, InterfaceGrid
+from .journal import Journal
+
+class ActionPlan:
+    def __init__(
+        self,
+        card: InterfaceCard,
+        grid: InterfaceGrid,
+        inputs_by_card: List[Tuple[InterfaceCard, List[Resource]]],
+        output_resources: List[Resource],
+        pollution_cards: List[InterfaceCard]
+    ) -> None:
+        self.card = card
+        self.grid = grid
+        self.inputs_by_card = inputs_by_card
+        self.output_resources = output_resources
+        self.pollution_cards = pollution_cards
 
 class ProcessAction:
     def __init__(self) -> None:
-        pass
+        self.journal: Optional[Journal] = None
     def activate_card(
         self,
         card: InterfaceCard,
@@ -14,24 +30,22 @@ class ProcessAction:
         outputs: List[Tuple[Resource, GridPosition]],
         pollution: List[GridPosition]
     ) -> bool:
-        involved_cards: Dict[GridPosition, InterfaceCard] = {}
-        if not self._validate_action(card, grid, inputs, outputs, pollution, involved_cards):
+        plan = self.plan_activation(card, grid, inputs, outputs, pollution)
+        if plan is None:
             return False
-        self._execute_action(card, inputs, outputs, pollution, involved_cards)
+        self.execute_plan(plan)
         return True
-    def _validate_action(
+    def plan_activation(
         self,
         card_to_activate: InterfaceCard,
         grid: InterfaceGrid,
         inputs: List[Tuple[Resource, GridPosition]],
         outputs: List[Tuple[Resource, GridPosition]],
-        pollution: List[GridPosition],
-        out_involved_cards: Dict[GridPosition, InterfaceCard]
-    ) -> bool:
+        pollution: List[GridPosition]
+    ) -> Optional[ActionPlan]:
         card_pos = card_to_activate.get_position()
         if not grid.can_be_activated(card_pos):
-            return False
-        out_involved_cards[card_pos] = card_to_activate
+            return None
         input_resources = [res for res, _ in inputs]
         output_resources = [res for res, _ in outputs]
         pollution_count = len(pollution)
@@ -41,49 +55,58 @@ class ProcessAction:
             input_resources, output_resources, pollution_count
         )
         if not is_valid_effect:
-            return False
+            return None
         for _, pos in outputs:
             if pos.x != card_pos.x or pos.y != card_pos.y:
-                return False
+                return None
         inputs_by_card: Dict[GridPosition, List[Resource]] = {}
         for res, pos in inputs:
             if pos not in inputs_by_card:
                 inputs_by_card[pos] = []
             inputs_by_card[pos].append(res)
+        planned_inputs: List[Tuple[InterfaceCard, List[Resource]]] = []
         for pos, resources_needed in inputs_by_card.items():
             input_card = grid.get_card(pos)
             if input_card is None:
-                return False
+                return None
             if not input_card.is_active():
-                return False
+                return None
             if not input_card.can_get_resources(resources_needed):
-                return False
-            out_involved_cards[pos] = input_card
+                return None
+            planned_inputs.append((input_card, resources_needed))
+        pollution_cards: List[InterfaceCard] = []
         for pos in pollution:
             pollution_card = grid.get_card(pos)
             if pollution_card is None:
+                return None
+            if not pollution_card.is_active():
+                return None
+            pollution_cards.append(pollution_card)
+        return ActionPlan(card_to_activate, grid, planned_inputs,
+                          output_resources, pollution_cards)
+    def can_execute_plan(self, plan: ActionPlan) -> bool:
+        if not plan.grid.can_be_activated(plan.card.get_position()):
+            return False
+        for input_card, resources_needed in plan.inputs_by_card:
+            if not input_card.is_active():
+                return False
+            if not input_card.can_get_resources(resources_needed):
                 return False
+        for pollution_card in plan.pollution_cards:
             if not pollution_card.is_active():
                 return False
-            out_involved_cards[pos] = pollution_card
         return True
-    def _execute_action(
-        self,
-        card_to_activate: InterfaceCard,
-        inputs: List[Tuple[Resource, GridPosition]],
-        outputs: List[Tuple[Resource, GridPosition]],
-        pollution: List[GridPosition],
-        involved_cards: Dict[GridPosition, InterfaceCard]
-    ) -> None:
-        inputs_by_card: Dict[GridPosition, List[Resource]] = {}
-        for res, pos in inputs:
-            if pos not in inputs_by_card:
-                inputs_by_card[pos] = []
-            inputs_by_card[pos].append(res)
-        for pos, resources_to_spend in inputs_by_card.items():
-            involved_cards[pos].get_resources(resources_to_spend)
-        output_resources = [res for res, _ in outputs]
-        if output_resources:
-            card_to_activate.put_resources(output_resources)
-        for pos in pollution:
-            involved_cards[pos].put_resources([Resource.POLLUTION])
+    def execute_plan(self, plan: ActionPlan) -> None:
+        journal = self.journal
+        if journal is not None and journal.enabled:
+            for input_card, _ in plan.inputs_by_card:
+                journal.record(input_card.restore, input_card.snapshot())
+            journal.record(plan.card.restore, plan.card.snapshot())
+            for pollution_card in plan.pollution_cards:
+                journal.record(pollution_card.restore, pollution_card.snapshot())
+        for input_card, resources_to_spend in plan.inputs_by_card:
+            input_card.get_resources(resources_to_spend)
+        if plan.output_resources:
+            plan.card.put_resources(plan.output_resources)
+        for pollution_card in plan.pollution_cards:
+            pollution_card.put_resources([Resource.POLLUTION])
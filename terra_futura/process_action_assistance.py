@@ -9,17 +9,25 @@ from terra_futura.interfaces import (
     InterfaceCard
 )
 from terra_futura.simple_types import GridPosition, Resource
+from terra_futura.journal import Journal
 
 class ProcessActionAssistance(InterfaceProcessActionAssistance):
     """Manages card activation and standard assistance rewards."""
 
     _select_reward_manager: InterfaceSelectReward
     _current_card: Optional[InterfaceCard]
+    journal: Optional[Journal]
 
     def __init__(self, select_reward_manager: InterfaceSelectReward):
         """Initialize with a reward manager."""
         self._select_reward_manager = select_reward_manager
         self._current_card = None
+        self.journal = None
+
+    def _remember(self, card: InterfaceCard) -> None:
+        """Record the card's resources so the journal can restore them."""
+        if self.journal is not None and self.journal.enabled:
+            self.journal.record(card.restore, card.snapshot())
 
     def current_card(self) -> Optional[InterfaceCard]:
         """Return the current card being processed."""
@@ -35,17 +43,7 @@ class ProcessActionAssistance(InterfaceProcessActionAssistance):
         pollution_count: int
     ) -> Tuple[bool, Optional[GridPosition]]:
         """Check if card activation is valid and find its position."""
-        card_coordinate: Optional[GridPosition] = None
-
-        for row in range(-2, 3):
-            for col in range(-2, 3):
-                pos = GridPosition(row, col)
-                if grid.get_card(pos) is card:
-                    card_coordinate = pos
-                    break
-            if card_coordinate is not None:
-                break
-
+        card_coordinate = grid.find_card(card)
         if card_coordinate is None or not card.has_assistance():
             return False, None
         if not grid.can_be_activated(card_coordinate):
@@ -89,7 +87,11 @@ class ProcessActionAssistance(InterfaceProcessActionAssistance):
         for pos in pollution:
             c = involved_cards.get(pos)
             if c:
+                self._remember(c)
                 c.put_resources([Resource.POLLUTION])
+        if self.journal is not None and self.journal.enabled:
+            self.journal.record(self._select_reward_manager.restore,
+                                self._select_reward_manager.snapshot())
         self._select_reward_manager.set_reward(
             player=player,
             card=card,
@@ -152,6 +154,35 @@ class ProcessActionAssistance(InterfaceProcessActionAssistance):
 
         self._current_card = None
         return success
+    def can_activate_card(
+        self,
+        card: InterfaceCard,
+        grid: InterfaceGrid,
+        assisting_player: int,
+        assisting_card: InterfaceCard,
+        inputs: List[Tuple[Resource, GridPosition]],
+        outputs: List[Tuple[Resource, GridPosition]],
+        pollution: List[GridPosition]
+    ) -> bool:
+        """Check if activate_card would succeed, without side effects."""
+        if assisting_card is None or assisting_player == 0:
+            return False
+        if not self._validate_card_activation(
+            card,
+            grid,
+            assisting_card,
+            [r for r, _ in inputs],
+            [r for r, _ in outputs],
+            len(pollution)
+        ):
+            return False
+        input_data = self._validate_inputs(grid, inputs)
+        if input_data is None:
+            return False
+        return self._process_pollution_cards(grid,
+                                             pollution,
+                                             input_data["involved_cards"])
+
     def _start_activation(
         self,
         card: InterfaceCard,
@@ -208,5 +239,7 @@ class ProcessActionAssistance(InterfaceProcessActionAssistance):
     ) -> None:
         """Distribute resources to involved cards and the main card."""
         for pos, resources in inputs_by_card.items():
+            self._remember(involved_cards[pos])
             involved_cards[pos].get_resources(resources)
+        self._remember(card)
         card.put_resources(gained_resources)
@@ -0,0 +1,77 @@
+"""
+Terra Futura: reproducible random provider with hierarchical seed splitting.
+"""
+from __future__ import annotations
+from typing import List, Optional
+from terra_futura.interfaces import InterfaceCard, RandomProviderInterface
+from terra_futura.simple_types import Deck
+from terra_futura.zobrist import MASK64, splitmix64
+
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+
+def split_seed(seed: int, key: int) -> int:
+    """Derive the seed of an independent child stream identified by key."""
+    return splitmix64(splitmix64(seed & MASK64) ^ splitmix64(key & MASK64 ^ GOLDEN_GAMMA))
+
+
+class SeededRandomProvider(RandomProviderInterface):
+    """SplitMix64 stream implementing the pile's random operations.
+
+    Providers are split into children by key, e.g. a game seed into one
+    stream per pile, or a run seed into one stream per worker and game.
+    Children are reproducible from the parent seed and key alone and do not
+    consume values of the parent stream.
+    """
+
+    __slots__ = ("seed", "_state")
+
+    def __init__(self, seed: int = 0):
+        """Initialize the stream; equal seeds produce equal streams."""
+        self.seed = seed & MASK64
+        self._state = self.seed
+
+    def split(self, key: int) -> SeededRandomProvider:
+        """Return the child stream identified by key."""
+        return SeededRandomProvider(split_seed(self.seed, key))
+
+    def for_pile(self, deck: Deck) -> SeededRandomProvider:
+        """Return the stream of the pile of a deck."""
+        return self.split(deck.value)
+
+    def next_u64(self) -> int:
+        """Return the next 64-bit value of the stream."""
+        value = splitmix64(self._state)
+        self._state = (self._state + GOLDEN_GAMMA) & MASK64
+        return value
+
+    def below(self, bound: int) -> int:
+        """Return a uniform integer in [0, bound) without modulo bias."""
+        if bound <= 0:
+            raise ValueError("bound must be positive")
+        product = self.next_u64() * bound
+        if product & MASK64 < bound:
+            threshold = ((1 << 64) - bound) % bound
+            while product & MASK64 < threshold:
+                product = self.next_u64() * bound
+        return product >> 64
+
+    def shuffle(self, _cards: List[InterfaceCard]) -> None:
+        """Shuffle the given cards in place (Fisher-Yates)."""
+        for i in range(len(_cards) - 1, 0, -1):
+            j = self.below(i + 1)
+            _cards[i], _cards[j] = _cards[j], _cards[i]
+
+    def pop_card(self, _cards: List[InterfaceCard]) -> Optional[InterfaceCard]:
+        """Remove and return a uniformly chosen card, or None if there is none."""
+        if not _cards:
+            return None
+        return _cards.pop(self.below(len(_cards)))
+
+    def snapshot(self) -> int:
+        """Return the position of the stream."""
+        return self._state
+
+    def restore(self, state: int) -> None:
+        """Return to a position returned by snapshot."""
+        self._state = state
@@ -0,0 +1,122 @@
+"""
+Terra Futura: compact multiset of resources packed into a single integer.
+"""
+from __future__ import annotations
+from typing import Dict, Iterable, Iterator, List
+from terra_futura.simple_types import Resource
+
+SLOT_BITS = 8
+SLOT_MASK = (1 << SLOT_BITS) - 1
+MAX_COUNT = SLOT_MASK >> 1
+
+RESOURCE_ORDER: List[Resource] = sorted(Resource, key=lambda r: r.value)
+UNIT: Dict[Resource, int] = {
+    r: 1 << (SLOT_BITS * (r.value - 1)) for r in RESOURCE_ORDER
+}
+SHIFT: Dict[Resource, int] = {
+    r: SLOT_BITS * (r.value - 1) for r in RESOURCE_ORDER
+}
+# Highest bit of every slot. Counts never reach it, so it can absorb the
+# borrow of a slot-wise subtraction and tell us which slots went negative.
+GUARD = sum((MAX_COUNT + 1) * unit for unit in UNIT.values())
+
+
+def pack(resources: Iterable[Resource]) -> int:
+    """Pack resources into an integer with one counter per resource."""
+    packed = 0
+    for r in resources:
+        packed += UNIT[r]
+    if packed & GUARD:
+        raise ValueError("Too many resources of one kind")
+    return packed
+
+
+def mask_of(resources: Iterable[Resource]) -> int:
+    """Return a mask covering the slots of the given resource kinds."""
+    mask = 0
+    for r in resources:
+        mask |= SLOT_MASK << SHIFT[r]
+    return mask
+
+
+def is_subset(needed: int, available: int) -> bool:
+    """Check that every counter of needed fits into available."""
+    return ((available | GUARD) - needed) & GUARD == GUARD
+
+
+class ResourceBag:
+    """Multiset of resources stored as 8 packed counters."""
+
+    __slots__ = ("_packed",)
+
+    def __init__(self, resources: Iterable[Resource] = (), packed: int = 0):
+        """Initialize the bag with the given resources or packed counters."""
+        self._packed = pack(resources) + packed
+
+    @property
+    def packed(self) -> int:
+        """Packed representation of the bag."""
+        return self._packed
+
+    def count(self, resource: Resource) -> int:
+        """Return how many resources of one kind are in the bag."""
+        return (self._packed >> SHIFT[resource]) & SLOT_MASK
+
+    @property
+    def pollution(self) -> int:
+        """Number of pollution cubes in the bag."""
+        return (self._packed >> SHIFT[Resource.POLLUTION]) & SLOT_MASK
+
+    def contains(self, other: ResourceBag) -> bool:
+        """Check if the other bag is a subset of this one."""
+        return is_subset(other.packed, self._packed)
+
+    def add(self, other: ResourceBag) -> None:
+        """Add all resources of the other bag."""
+        packed = self._packed + other.packed
+        if packed & GUARD:
+            raise ValueError("Too many resources of one kind")
+        self._packed = packed
+
+    def remove(self, other: ResourceBag) -> None:
+        """Remove all resources of the other bag."""
+        if not is_subset(other.packed, self._packed):
+            raise ValueError("Not enough resources")
+        self._packed -= other.packed
+
+    def to_list(self) -> List[Resource]:
+        """Expand the bag into a list ordered by resource kind."""
+        return list(iter(self))
+
+    def __iter__(self) -> Iterator[Resource]:
+        """Iterate over the resources, repeating each by its count."""
+        packed = self._packed
+        for r in RESOURCE_ORDER:
+            for _ in range(packed & SLOT_MASK):
+                yield r
+            packed >>= SLOT_BITS
+
+    def __contains__(self, resource: object) -> bool:
+        """Check if at least one resource of the given kind is present."""
+        if not isinstance(resource, Resource):
+            return False
+        return self.count(resource) > 0
+
+    def __len__(self) -> int:
+        """Total number of resources in the bag."""
+        total = 0
+        packed = self._packed
+        while packed:
+            total += packed & SLOT_MASK
+            packed >>= SLOT_BITS
+        return total
+
+    def __eq__(self, other: object) -> bool:
+        """Equality check."""
+        if not isinstance(other, ResourceBag):
+            return False
+        return self._packed == other.packed
+
+    def __str__(self) -> str:
+        """String representation."""
+        return "[" + ", ".join(r.name for r in self) + "]"
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from collections import Counter
 from .simple_types import Resource, Points
 
@@ -8,15 +8,29 @@ class ScoringMethod:
 
     def __init__(self, resources: List[Resource], points_per_combination: Points):
 
-        self.resources: List[Resource] = resources
+        self._resources: List[Resource] = list(resources)
         self.points_per_combination: Points = points_per_combination
-        self.calculated_total: Optional[Points] = None
-        self.selected: bool = False
+        self._calculated_total: Optional[Points] = None
+        self._selected: bool = False
+        self._dict: Optional[Dict[str, Any]] = None
+
+    # Read-only, so that nothing changes the state behind the cached dict.
+    @property
+    def resources(self) -> List[Resource]:
+        return list(self._resources)
+
+    @property
+    def selected(self) -> bool:
+        return self._selected
+
+    @property
+    def calculated_total(self) -> Optional[Points]:
+        return self._calculated_total
 
     def select_this_method_and_calculate(self, available_resources: List[Resource]) -> Points:
-        self.selected = True
+        self._selected = True
 
-        required = Counter(self.resources)
+        required = Counter(self._resources)
 
         available = Counter(r for r in available_resources
                             if r not in [Resource.MONEY, Resource.POLLUTION])
@@ -31,17 +45,36 @@ class ScoringMethod:
             )
 
         total_points = Points(num_complete_sets * self.points_per_combination.value)
-        self.calculated_total = total_points
+        self._calculated_total = total_points
+        self._dict = None
 
         return total_points
 
+    def snapshot(self) -> Tuple[bool, Optional[Points]]:
+        return self._selected, self._calculated_total
+
+    def restore(self, snapshot: Tuple[bool, Optional[Points]]) -> None:
+        self._selected, self._calculated_total = snapshot
+        self._dict = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the cached state; callers must not modify it."""
+        if self._dict is None:
+            self._dict = {
+                "resources": [r.name for r in self._resources],
+                "points": self.points_per_combination.value,
+                "selected": self._selected,
+                "total": self._calculated_total.value if self._calculated_total else None,
+            }
+        return self._dict
+
     def state(self) -> str:
 
-        resource_names = [r.name for r in self.resources]
-        total_str = str(self.calculated_total) if self.calculated_total else "Not calculated"
+        resource_names = [r.name for r in self._resources]
+        total_str = str(self._calculated_total) if self._calculated_total else "Not calculated"
 
         return (f"ScoringMethod["
                 f"resources={resource_names}, "
                 f"points={self.points_per_combination}, "
-                f"selected={self.selected}, "
+                f"selected={self._selected}, "
                 f"total={total_str}]")
@@ -0,0 +1,62 @@
+"""
+Terra Futura: reward an assisting player picks after an assisted activation.
+"""
+from __future__ import annotations
+import json
+from typing import Any, Dict, List, Optional, Tuple
+from terra_futura.interfaces import InterfaceCard, InterfaceSelectReward
+from terra_futura.simple_types import Resource
+
+# (pending player, card receiving the reward, resources to choose from)
+RewardSnapshot = Tuple[Optional[int], Optional[InterfaceCard], Tuple[Resource, ...]]
+
+
+class SelectReward(InterfaceSelectReward):
+    """One pending reward: a player chooses a resource to put on a card."""
+
+    def __init__(self) -> None:
+        self._player: Optional[int] = None
+        self._card: Optional[InterfaceCard] = None
+        self.selection: List[Resource] = []
+
+    def set_reward(self, player: int, card: InterfaceCard, reward: List[Resource]) -> None:
+        self._player = player
+        self._card = card
+        self.selection = list(reward)
+
+    def get_pending_player(self) -> Optional[int]:
+        """Return the player who has to choose, or None if no reward is pending."""
+        return self._player
+
+    def can_select_reward(self, resource: Resource) -> bool:
+        return self._card is not None and resource in self.selection \
+            and self._card.can_put_resources([resource])
+
+    def select_reward(self, resource: Resource) -> None:
+        """Put the chosen resource on the card; raises ValueError if it can't be chosen."""
+        if not self.can_select_reward(resource):
+            raise ValueError(f"{resource} cannot be selected as a reward")
+        assert self._card is not None
+        self._card.put_resources([resource])
+
+    def clear(self) -> None:
+        """Forget the pending reward."""
+        self._player = None
+        self._card = None
+        self.selection = []
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "player": self._player,
+            "selection": [r.name.capitalize() for r in self.selection],
+        }
+
+    def state(self) -> str:
+        return json.dumps(self.to_dict())
+
+    def snapshot(self) -> RewardSnapshot:
+        return self._player, self._card, tuple(self.selection)
+
+    def restore(self, snapshot: RewardSnapshot) -> None:
+        self._player, self._card, selection = snapshot
+        self.selection = list(selection)
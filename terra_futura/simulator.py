@@ -0,0 +1,212 @@
+"""Headless self-play: plays complete games with pluggable policies.
+
+Games are driven only through the actions of the game interface; nothing
+calls ``state()`` and no observers are attached.
+
+The package ships no card catalogue, so the command line needs the decks
+from elsewhere: ``--decks module:function`` names a function returning fresh
+cards per deck, as in
+``python3 -m terra_futura.simulator --decks my_cards:decks --games 1000``.
+Without decks every pile would be empty and no game could be played.
+Every player is dealt activation patterns and scoring methods from
+ACTIVATION_PATTERNS and SCORING_METHODS, so that the games can finish.
+"""
+from __future__ import annotations
+import argparse
+import importlib
+import itertools
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
+from terra_futura.activation_pattern import ActivationPattern, GridActivation
+from terra_futura.interfaces import InterfaceCard, InterfacePile, TerraFuturaInterface
+from terra_futura.mcts import ActionSource, RandomRollout, RolloutPolicy
+from terra_futura.pile import Pile
+from terra_futura.random_provider import SeededRandomProvider
+from terra_futura.scoring_method import ScoringMethod
+from terra_futura.simple_types import Deck, GameState, Points, Resource
+
+if TYPE_CHECKING:
+    from terra_futura.game import Game
+
+Policy = RolloutPolicy
+GameFactory = Callable[[List[int]], TerraFuturaInterface]
+DeckSource = Callable[[], Dict[Deck, List[InterfaceCard]]]
+
+MIN_PLAYERS = 2
+MAX_PLAYERS = 5
+
+ACTIVATION_PATTERNS: List[List[Tuple[int, int]]] = [
+    [(x, y) for x in range(-1, 2) for y in range(-1, 2) if (x + y) % 2 == 0],
+    [(x, y) for x in range(-1, 2) for y in range(-1, 2) if (x + y) % 2 != 0],
+    [(x, y) for x in range(-1, 2) for y in range(-1, 2) if x == 0 or y == 0],
+    [(x, y) for x in range(-1, 2) for y in range(-1, 2) if x != 0 and y != 0],
+]
+SCORING_METHODS: List[Tuple[List[Resource], int]] = [
+    ([Resource.GREEN], 1),
+    ([Resource.RED, Resource.YELLOW], 3),
+    ([Resource.GEAR, Resource.BULB], 5),
+    ([Resource.CAR], 4),
+]
+DEALT_PATTERNS = 2
+DEALT_SCORINGS = 2
+
+
+class SimulationStats:
+    """Totals of a batch of simulated games."""
+
+    def __init__(self) -> None:
+        self.games = 0
+        self.actions = 0
+        self.unfinished = 0
+        self.seconds = 0.0
+        self.wins: Dict[int, int] = {}
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def actions_per_second(self) -> float:
+        return self.actions / self.seconds if self.seconds > 0 else 0.0
+
+
+class SelfPlaySimulator:
+    """Plays games between policies, one policy per seat.
+
+    ``policies[i]`` plays for player id ``i``. A game that reaches
+    ``max_actions`` or has no legal action left is counted as unfinished.
+    """
+
+    def __init__(self, game_factory: GameFactory, actions: ActionSource,
+                 policies: Sequence[Policy], max_actions: int = 10_000):
+        self._game_factory = game_factory
+        self._actions = actions
+        self._policies = list(policies)
+        self._max_actions = max_actions
+        self._player_ids = [list(range(n)) for n in range(MAX_PLAYERS + 1)]
+
+    def play_game(self, players: int) -> TerraFuturaInterface:
+        """Play one game and return it in its final position."""
+        return self._play(players, SimulationStats())
+
+    def run(self, games: int, players: int) -> SimulationStats:
+        """Play a batch of games and return throughput and win counts."""
+        if not MIN_PLAYERS <= players <= min(MAX_PLAYERS, len(self._policies)):
+            raise ValueError(f"Cannot simulate {players} players "
+                             f"with {len(self._policies)} policies")
+        stats = SimulationStats()
+        start = time.perf_counter()
+        for _ in range(games):
+            self._play(players, stats)
+        stats.seconds = time.perf_counter() - start
+        return stats
+
+    def _play(self, players: int, stats: SimulationStats) -> TerraFuturaInterface:
+        game = self._game_factory(self._player_ids[players])
+        legal_actions = self._actions.legal_actions
+        policies = self._policies
+        for _ in range(self._max_actions):
+            if game.get_state() == GameState.FINISH:
+                break
+            legal = legal_actions(game)
+            if not legal:
+                break
+            player = game.get_current_player()
+            if not policies[player].choose(game, legal).apply(game, player):
+                break
+            stats.actions += 1
+
+        stats.games += 1
+        winner = game.get_winner() if game.get_state() == GameState.FINISH else None
+        if winner is None:
+            stats.unfinished += 1
+        else:
+            stats.wins[winner] = stats.wins.get(winner, 0) + 1
+        return game
+
+
+def _deal_choices(random: SeededRandomProvider, options: int, count: int) -> List[int]:
+    """Indices of count different options, in the order they were drawn."""
+    remaining = list(range(options))
+    return [remaining.pop(random.below(len(remaining))) for _ in range(count)]
+
+
+def deal_players(game: Game, random: SeededRandomProvider) -> None:
+    """Give every player activation patterns and scoring methods."""
+    for player in game.players.values():
+        grid = GridActivation(player.grid)
+        player.activation_patterns = [
+            ActivationPattern(grid, ACTIVATION_PATTERNS[i])
+            for i in _deal_choices(random, len(ACTIVATION_PATTERNS), DEALT_PATTERNS)
+        ]
+        player.scoring_methods = [
+            ScoringMethod(SCORING_METHODS[i][0], Points(SCORING_METHODS[i][1]))
+            for i in _deal_choices(random, len(SCORING_METHODS), DEALT_SCORINGS)
+        ]
+
+
+def dealing_factory(decks: DeckSource, seed: int = 0) -> GameFactory:
+    """Return a factory of games dealt from fresh decks.
+
+    Every game gets its own cards from decks, and its piles and the
+    patterns and scoring methods of its players are dealt by streams split
+    from seed by game number, so a batch is reproducible from the seed.
+    """
+    # pylint: disable=import-outside-toplevel
+    from terra_futura.game import Game
+
+    root = SeededRandomProvider(seed)
+    numbers = itertools.count()
+
+    def factory(player_ids: List[int]) -> TerraFuturaInterface:
+        random = root.split(next(numbers))
+        piles: Dict[Deck, InterfacePile] = {
+            deck: Pile(cards, random.for_pile(deck)) for deck, cards in decks().items()
+        }
+        game = Game(player_ids, piles)
+        deal_players(game, random.split(0))
+        return game
+    return factory
+
+
+def load_decks(name: str) -> DeckSource:
+    """Import the deck source named as module:function."""
+    module, _, function = name.partition(":")
+    source: DeckSource = getattr(importlib.import_module(module), function)
+    return source
+
+
+def main(argv: Optional[Sequence[str]] = None,
+         decks: Optional[DeckSource] = None) -> None:
+    """Simulate random self-play games and print the throughput.
+
+    decks, or the --decks option, supplies the cards the games are dealt
+    from; one of them is required.
+    """
+    # pylint: disable=import-outside-toplevel
+    from terra_futura.move_generator import MoveGenerator
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--decks", metavar="MODULE:FUNCTION")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-activations", type=int, default=8)
+    args = parser.parse_args(argv)
+    if args.decks:
+        decks = load_decks(args.decks)
+    if decks is None:
+        parser.error("no cards to deal: pass --decks MODULE:FUNCTION")
+
+    policies = [RandomRollout(args.seed + i) for i in range(MAX_PLAYERS)]
+    simulator = SelfPlaySimulator(dealing_factory(decks, args.seed),
+                                  MoveGenerator(args.max_activations), policies)
+    stats = simulator.run(args.games, args.players)
+    print(f"{stats.games} games, {stats.actions} actions in {stats.seconds:.2f}s: "
+          f"{stats.games_per_second:,.1f} games/s, "
+          f"{stats.actions_per_second:,.0f} actions/s, "
+          f"{stats.unfinished} unfinished, wins {stats.wins}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Terra Futura: JSON-Patch-like differences between JSON-shaped states.
+
+States are the plain objects returned by to_dict(). diff walks two states
+and emits ``add``, ``remove`` and ``replace`` operations addressed by JSON
+Pointer paths; subtrees that are the same object are skipped without being
+visited, which makes diffing cached, unchanged fragments free.
+"""
+from __future__ import annotations
+import copy
+import json
+from typing import Any, Dict, List
+
+Operation = Dict[str, Any]
+
+
+def _escape(key: Any) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def diff(old: Any, new: Any, path: str = "") -> List[Operation]:
+    """Operations turning old into new."""
+    ops: List[Operation] = []
+    _diff(old, new, path, ops)
+    return ops
+
+
+def _diff(old: Any, new: Any, path: str, ops: List[Operation]) -> None:
+    if old is new:
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key in old:
+                _diff(old[key], value, child, ops)
+            else:
+                ops.append({"op": "add", "path": child, "value": value})
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+    elif isinstance(old, list) and isinstance(new, list):
+        common = min(len(old), len(new))
+        for index in range(common):
+            _diff(old[index], new[index], f"{path}/{index}", ops)
+        for index in range(common, len(new)):
+            ops.append({"op": "add", "path": f"{path}/{index}", "value": new[index]})
+        for index in range(len(old) - 1, common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{index}"})
+    elif type(old) is not type(new) or old != new:
+        ops.append({"op": "replace", "path": path, "value": new})
+
+
+def apply_patch(doc: Any, ops: List[Operation]) -> Any:
+    """Return a copy of doc with the operations applied; doc is unchanged."""
+    doc = copy.deepcopy(doc)
+    for op in ops:
+        if op["path"] == "":
+            doc = copy.deepcopy(op["value"])
+            continue
+        *parents, last = [_unescape(token) for token in op["path"].split("/")[1:]]
+        target = doc
+        for token in parents:
+            target = target[int(token)] if isinstance(target, list) else target[token]
+        if isinstance(target, list):
+            index = int(last)
+            if op["op"] == "add":
+                target.insert(index, copy.deepcopy(op["value"]))
+            elif op["op"] == "remove":
+                del target[index]
+            else:
+                target[index] = copy.deepcopy(op["value"])
+        elif op["op"] == "remove":
+            del target[last]
+        else:
+            target[last] = copy.deepcopy(op["value"])
+    return doc
+
+
+class StateReplica:
+    """Client-side copy of a state rebuilt from keyframe and delta messages.
+
+    States of received versions are kept until acknowledged, because the
+    sender diffs against the last version it knows was acknowledged. Until
+    the sender sees an acknowledgement it keeps patching against its older
+    base, so acknowledging keeps the versions back to the base of the newest
+    patch received.
+    """
+
+    def __init__(self) -> None:
+        self.version = 0
+        self.state: Any = None
+        self._history: Dict[int, Any] = {}
+        self._base = 0
+
+    def apply(self, message: str) -> bool:
+        """Apply a message; False means its base is unknown and a resync is needed."""
+        data = json.loads(message)
+        if "state" in data:
+            state = data["state"]
+        else:
+            if data["base"] not in self._history:
+                return False
+            state = apply_patch(self._history[data["base"]], data["patch"])
+        self._base = data.get("base", data["version"])
+        self.version = data["version"]
+        self.state = self._history[self.version] = state
+        return True
+
+    def acknowledge(self) -> int:
+        """Forget versions the sender no longer patches against and return the current one."""
+        oldest = min(self._base, self.version)
+        self._history = {version: state for version, state in self._history.items()
+                         if version >= oldest}
+        return self.version
@@ -0,0 +1,192 @@
+"""Batched environment stepping many games with flat observation buffers.
+
+Observations, rewards and done flags live in preallocated ``array``
+buffers that are overwritten in place on every step. They are exposed as
+shaped memoryviews, so ``numpy.asarray(env.observations)`` wraps them
+without copying; the package itself does not depend on NumPy.
+"""
+from __future__ import annotations
+from array import array
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Protocol, Sequence, Tuple, cast
+from terra_futura.action_space import ActionSpace
+from terra_futura.actions import Action
+from terra_futura.grid import GRID_SIDE, slot_of
+from terra_futura.interfaces import InterfaceCard, TerraFuturaInterface
+from terra_futura.mcts import ActionSource, Evaluator, winner_takes_all
+from terra_futura.move_generator import VISIBLE_CARDS
+from terra_futura.resource_bag import RESOURCE_ORDER
+from terra_futura.simple_types import Deck, GameState
+
+if TYPE_CHECKING:
+    from terra_futura.game import Game
+
+GRID_SLOTS = GRID_SIDE * GRID_SIDE
+PILE_FEATURES = 3
+
+GameFactory = Callable[[List[int]], TerraFuturaInterface]
+
+
+class ActionDecoder(Protocol):
+    def decode(self, game: TerraFuturaInterface, code: int) -> Optional[Action]:
+        raise NotImplementedError
+
+
+class LegalActionDecoder:
+    """Decodes an action as its index in the list of legal actions."""
+
+    def __init__(self, actions: ActionSource):
+        self._actions = actions
+
+    def decode(self, game: TerraFuturaInterface, code: int) -> Optional[Action]:
+        legal = self._actions.legal_actions(game)
+        return legal[code] if 0 <= code < len(legal) else None
+
+
+class ObservationLayout:
+    """Offsets of the features inside the observation of one game.
+
+    Per player seat: grid occupancy (25), active cards (25) and resource
+    counts of every grid slot (25 x 8, pollution last). Then, per deck and
+    visible pile index: presence, pollution limit and assistance flag. Then
+    one-hot encodings of the game state and of the seat on turn.
+    """
+
+    def __init__(self, players: int):
+        self.players = players
+        self.fields: Dict[str, Tuple[int, int]] = {}
+        offset = 0
+        for name, length in (
+            ("occupied", players * GRID_SLOTS),
+            ("active", players * GRID_SLOTS),
+            ("resources", players * GRID_SLOTS * len(RESOURCE_ORDER)),
+            ("piles", len(Deck) * (VISIBLE_CARDS + 1) * PILE_FEATURES),
+            ("state", len(GameState)),
+            ("on_turn", players),
+        ):
+            self.fields[name] = (offset, length)
+            offset += length
+        self.size = offset
+
+    def offset(self, name: str) -> int:
+        return self.fields[name][0]
+
+
+class VectorEnv:
+    """Steps ``num_games`` games at once, resetting finished games.
+
+    Game ``i`` occupies row ``i`` of every buffer. The reward of a step is
+    the evaluator's reward for the player who acted; an action that does not
+    decode or is refused leaves the game unchanged and sets ``illegal``.
+    With an ``action_space``, the legal mask of every game is kept in
+    ``masks`` next to its observation.
+    """
+
+    # pylint: disable=too-many-instance-attributes, too-many-arguments, too-many-positional-arguments
+
+    def __init__(self, game_factory: GameFactory, num_games: int, players: int,
+                 decoder: ActionDecoder, evaluator: Evaluator = winner_takes_all,
+                 action_space: Optional[ActionSpace] = None):
+        self._game_factory = game_factory
+        self._player_ids = list(range(players))
+        self._decoder = decoder
+        self._evaluator = evaluator
+        self.layout = ObservationLayout(players)
+        self.num_games = num_games
+        self.games: List[TerraFuturaInterface] = []
+
+        size = self.layout.size
+        self._observations = array("B", bytes(num_games * size))
+        self._rewards = array("d", bytes(8 * num_games))
+        self._dones = array("B", bytes(num_games))
+        self._illegal = array("B", bytes(num_games))
+        self._zeros = bytes(size)
+        self._observation_rows = [memoryview(self._observations)[i * size:(i + 1) * size]
+                                  for i in range(num_games)]
+        self.observations = memoryview(self._observations).cast("B", (num_games, size))
+        self.rewards = memoryview(self._rewards)
+        self.dones = memoryview(self._dones)
+        self.illegal = memoryview(self._illegal)
+
+        self._action_space = action_space
+        self._mask_rows: List[memoryview] = []
+        self.masks: Optional[memoryview] = None
+        if action_space is not None:
+            masks = array("B", bytes(num_games * action_space.size))
+            self._mask_rows = [
+                memoryview(masks)[i * action_space.size:(i + 1) * action_space.size]
+                for i in range(num_games)
+            ]
+            self.masks = memoryview(masks).cast("B", (num_games, action_space.size))
+
+    def row(self, index: int) -> memoryview:
+        """Observation of one game as a flat view into the shared buffer."""
+        return self._observation_rows[index]
+
+    def reset(self) -> memoryview:
+        """Start new games in every row and return the observations."""
+        self.games = [self._game_factory(self._player_ids) for _ in range(self.num_games)]
+        for i, game in enumerate(self.games):
+            self._rewards[i] = 0.0
+            self._dones[i] = 0
+            self._illegal[i] = 0
+            self._write(i, game)
+        return self.observations
+
+    def step(self, codes: Sequence[int]) -> Tuple[memoryview, memoryview, memoryview]:
+        """Apply one encoded action per game; return observations, rewards, dones."""
+        if len(codes) != self.num_games:
+            raise ValueError(f"Expected {self.num_games} actions, got {len(codes)}")
+        for i, code in enumerate(codes):
+            game = self.games[i]
+            player = game.get_current_player()
+            action = self._decoder.decode(game, int(code))
+            applied = action is not None and action.apply(game, player)
+            self._illegal[i] = not applied
+            done = game.get_state() == GameState.FINISH
+            self._dones[i] = done
+            self._rewards[i] = self._evaluator(game).get(player, 0.0) if done else 0.0
+            if done:
+                game = self.games[i] = self._game_factory(self._player_ids)
+            self._write(i, game)
+        return self.observations, self.rewards, self.dones
+
+    def _write(self, index: int, game: TerraFuturaInterface) -> None:
+        self.encode(game, self._observation_rows[index])
+        if self._action_space is not None:
+            self._action_space.mask(game, self._mask_rows[index])
+
+    def encode(self, terra_futura: TerraFuturaInterface, row: memoryview) -> None:
+        """Write the observation of a game into a row of the observation buffer."""
+        game = cast("Game", terra_futura)
+        layout = self.layout
+        row[:] = self._zeros
+        self._encode_grids(game, row)
+
+        offset = layout.offset("piles")
+        for deck in Deck:
+            pile = game.piles[deck]
+            for index in range(VISIBLE_CARDS + 1):
+                pile_card: Optional[InterfaceCard] = pile.get_card(index)
+                if pile_card is not None:
+                    row[offset] = 1
+                    row[offset + 1] = min(pile_card.pollution_limit, 255)
+                    row[offset + 2] = pile_card.has_assistance()
+                offset += PILE_FEATURES
+
+        row[layout.offset("state") + game.get_state().value - 1] = 1
+        row[layout.offset("on_turn") + self._player_ids.index(game.get_current_player())] = 1
+
+    def _encode_grids(self, game: Game, row: memoryview) -> None:
+        layout = self.layout
+        occupied = layout.offset("occupied")
+        active = layout.offset("active")
+        resources = layout.offset("resources")
+        width = len(RESOURCE_ORDER)
+        for seat, player_id in enumerate(self._player_ids):
+            base = seat * GRID_SLOTS
+            for position, card in game.players[player_id].grid.get_cards():
+                slot = base + slot_of(position)
+                row[occupied + slot] = 1
+                row[active + slot] = card.is_active()
+                start = resources + slot * width
+                row[start:start + width] = card.snapshot().to_bytes(width, "little")
@@ -0,0 +1,137 @@
+"""
+Terra Futura: Zobrist keys for incrementally hashing game positions.
+"""
+from __future__ import annotations
+import hashlib
+import json
+from typing import Any, Dict, Iterable, Tuple
+from terra_futura.interfaces import InterfaceCard, InterfacePile
+from terra_futura.pile import VISIBLE_CARDS
+from terra_futura.simple_types import Deck, GameState
+
+MASK64 = (1 << 64) - 1
+
+_STATE = 1
+_PLAYER = 2
+_TURN = 3
+_PLACEMENT = 4
+_RESOURCES = 5
+_PILE = 6
+_PILE_SIZE = 7
+_ACTIVATED = 8
+_ACTIVATION = 9
+_FINAL_PHASE = 10
+_FINISHED = 11
+_REWARD = 12
+
+
+def splitmix64(value: int) -> int:
+    """Scramble a 64-bit value with the SplitMix64 finalizer."""
+    value = (value + 0x9E3779B97F4A7C15) & MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK64
+    return value ^ (value >> 31)
+
+
+class ZobristTable:
+    """Deterministic 64-bit keys for every hashed part of a game.
+
+    Keys are derived from what they describe, never from the order in which
+    they were first requested, so equal positions hash equally in every
+    process. A card is identified by its definition (effects, pollution
+    limit, assistance), which makes identical cards interchangeable.
+    """
+
+    def __init__(self, seed: int = 0):
+        """Initialize the table; tables with equal seeds produce equal keys."""
+        self._seed = splitmix64(seed & MASK64)
+        # Entries keep their card alive, so its id is not reused meanwhile.
+        self._card_keys: Dict[int, Tuple[InterfaceCard, int]] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Card ids mean nothing in a copy, so the cache is not copied.
+        return {"_seed": self._seed}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._seed = state["_seed"]
+        self._card_keys = {}
+
+    def _key(self, kind: int, value: int) -> int:
+        return splitmix64(self._seed ^ (kind << 56) ^ (value & ((1 << 56) - 1)))
+
+    def card_key(self, card: InterfaceCard) -> int:
+        """Return the key of a card definition."""
+        entry = self._card_keys.get(id(card))
+        if entry is None:
+            definition = json.dumps([
+                card.pollution_limit,
+                card.has_assistance(),
+                card.upper_effect.state() if card.upper_effect else None,
+                card.lower_effect.state() if card.lower_effect else None,
+            ])
+            digest = hashlib.blake2b(definition.encode(), digest_size=8).digest()
+            entry = (card, int.from_bytes(digest, "little"))
+            self._card_keys[id(card)] = entry
+        return entry[1]
+
+    def turn(self, state: GameState, player_id: int, turn_number: int) -> int:
+        """Key of the game state, the player on turn and the turn number."""
+        return (self._key(_STATE, state.value) ^ self._key(_PLAYER, player_id)
+                ^ self._key(_TURN, turn_number))
+
+    def placement(self, player_id: int, slot: int, card: InterfaceCard) -> int:
+        """Key of a card lying in a grid slot of a player."""
+        return splitmix64(self._key(_PLACEMENT, player_id * 32 + slot) ^ self.card_key(card))
+
+    def resources(self, player_id: int, slot: int, packed: int) -> int:
+        """Key of the packed resources of the card in a grid slot of a player."""
+        return splitmix64(self._key(_RESOURCES, player_id * 32 + slot) ^ packed)
+
+    def activated(self, player_id: int, mask: int) -> int:
+        """Key of the grid slots of a player activated this turn, as a bit mask."""
+        return splitmix64(self._key(_ACTIVATED, player_id) ^ mask)
+
+    def activation(self, pending: int, complete: bool) -> int:
+        """Key of the slots left to activate this turn and of activation being complete."""
+        return splitmix64(self._key(_ACTIVATION, int(complete)) ^ pending)
+
+    def final_phase(self, active: bool, finished: Iterable[int]) -> int:
+        """Key of the final activation phase and the players done with it."""
+        key = self._key(_FINAL_PHASE, int(active))
+        for player_id in finished:
+            key ^= self._key(_FINISHED, player_id)
+        return key
+
+    def reward(self, player_id: int, slot: int, packed: int) -> int:
+        """Key of a pending reward: the receiving card's slot and the packed choices."""
+        return splitmix64(self._key(_REWARD, player_id * 32 + slot) ^ packed)
+
+    def _pile_card(self, deck: Deck, index: int, card: InterfaceCard) -> int:
+        return splitmix64(self._key(_PILE, deck.value * 64 + index) ^ self.card_key(card))
+
+    def _pile_sizes(self, deck: Deck, pile: InterfacePile) -> int:
+        key = 0
+        for part, size in enumerate(pile.sizes()):
+            key ^= self._key(_PILE_SIZE, (deck.value * 8 + part) << 16 | size)
+        return key
+
+    def pile(self, deck: Deck, pile: InterfacePile) -> int:
+        """Key of the visible cards of a pile and the sizes of its other parts."""
+        key = self._pile_sizes(deck, pile)
+        for index in range(1, VISIBLE_CARDS + 1):
+            card = pile.get_card(index)
+            if card is not None:
+                key ^= self._pile_card(deck, index, card)
+        return key
+
+    def pile_slot(self, deck: Deck, pile: InterfacePile, index: int) -> int:
+        """Part of pile() that taking or discarding the card at index changes.
+
+        The pile refills a visible slot in place, so only that slot and the
+        sizes change; XOR-ing this key before and after updates the hash.
+        """
+        key = self._pile_sizes(deck, pile)
+        card = pile.get_card(index) if 1 <= index <= VISIBLE_CARDS else None
+        if card is not None:
+            key ^= self._pile_card(deck, index, card)
+        return key
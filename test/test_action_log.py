@@ -0,0 +1,83 @@
+import unittest
+from typing import List
+from test.test_mcts import FakeNim, take
+
+from terra_futura.action_log import ActionLog, ActionRecord, ReplayEngine, ReplayError, record_call
+from terra_futura.actions import (
+    ActivateCardAction,
+    DiscardCardAction,
+    FinishTurnAction,
+    SelectActivationPatternAction,
+    SelectRewardAction,
+    SelectScoringAction,
+    TakeCardAction,
+)
+from terra_futura.interfaces import TerraFuturaInterface
+from terra_futura.simple_types import CardSource, Deck, GridPosition, Resource
+
+
+def nim(seed: int, player_ids: List[int]) -> TerraFuturaInterface:
+    assert player_ids == [0, 1]
+    return FakeNim(seed)
+
+
+class TestRecordCall(unittest.TestCase):
+
+    def test_every_interface_action_is_recorded(self) -> None:
+        pos = GridPosition(1, 0)
+        source = CardSource(Deck.II, 2)
+        inputs = [(Resource.GREEN, GridPosition(0, 0))]
+        calls = [
+            ("take_card", (3, source, pos), {}, TakeCardAction(source, pos)),
+            ("discard_last_card_from_deck", (3, Deck.I), {}, DiscardCardAction(Deck.I)),
+            ("activate_card", (3, pos, inputs, [], []), {"other_player_id": 1,
+                                                         "other_card": pos},
+             ActivateCardAction(pos, inputs, [], [], 1, pos)),
+            ("select_reward", (), {"player_id": 3, "resource": Resource.CAR},
+             SelectRewardAction(Resource.CAR)),
+            ("turn_finished", (3,), {}, FinishTurnAction()),
+            ("select_activation_pattern", (3, 1), {}, SelectActivationPatternAction(1)),
+            ("select_scoring", (3, 0), {}, SelectScoringAction(0)),
+        ]
+        for name, args, kwargs, action in calls:
+            self.assertEqual(record_call(name, args, kwargs), ActionRecord(3, action))
+
+    def test_activation_record_does_not_share_lists(self) -> None:
+        inputs = [(Resource.GREEN, GridPosition(0, 0))]
+        record = record_call("activate_card",
+                             (0, GridPosition(0, 0), inputs, [], [], None, None), {})
+        inputs.clear()
+        assert isinstance(record.action, ActivateCardAction)
+        self.assertEqual(len(record.action.inputs), 1)
+
+
+class TestReplayEngine(unittest.TestCase):
+
+    def test_replay_rebuilds_final_position(self) -> None:
+        log = ActionLog(5, [0, 1], [ActionRecord(0, take(2)), ActionRecord(1, take(1)),
+                                    ActionRecord(0, take(2))])
+        engine = ReplayEngine(nim)
+        game = engine.replay(log)
+        self.assertEqual(game.get_winner(), 0)
+        games = list(engine.replay_many([log, ActionLog(4, [0, 1])]))
+        self.assertEqual([g.get_current_player() for g in games], [1, 0])
+        self.assertEqual((engine.games, engine.actions), (3, 6))
+
+    def test_refused_action_raises(self) -> None:
+        log = ActionLog(3, [0, 1], [ActionRecord(0, take(1)), ActionRecord(0, take(1))])
+        with self.assertRaises(ReplayError) as context:
+            ReplayEngine(nim).replay(log)
+        self.assertEqual(context.exception.index, 1)
+
+    def test_log_truncate_and_equality(self) -> None:
+        log = ActionLog(1, [0, 1])
+        log.append(ActionRecord(0, take(1)))
+        log.append(ActionRecord(1, take(2)))
+        log.truncate(1)
+        self.assertEqual(log, ActionLog(1, [0, 1], [ActionRecord(0, take(1))]))
+        self.assertEqual(log.pop(), ActionRecord(0, take(1)))
+        self.assertEqual(len(log), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+from array import array
+from typing import List
+from test.test_vector_env import FakeBoardGame, FakeBoardMoves
+
+from terra_futura.action_space import ActionSpace
+from terra_futura.actions import (
+    ActivateCardAction,
+    DiscardCardAction,
+    FinishTurnAction,
+    SelectRewardAction,
+    SelectScoringAction,
+    TakeCardAction,
+)
+from terra_futura.card import Card
+from terra_futura.effects import EffectTransformationFixed
+from terra_futura.grid import POSITIONS, slot_of
+from terra_futura.simple_types import CardSource, Deck, GameState, GridPosition, Resource
+from terra_futura.vector_env import VectorEnv
+
+
+class FakeActivationGame(FakeBoardGame):  # pylint: disable=abstract-method
+
+    def __init__(self, player_ids: List[int]):
+        super().__init__(player_ids)
+        grid = self.players[0].grid
+        grid.put_card(GridPosition(0, 0), Card([], 1))
+        grid.put_card(GridPosition(1, 0), Card(
+            [], 1, lowerEffect=EffectTransformationFixed([], [Resource.GREEN], 0)))
+
+    def get_state(self) -> GameState:
+        return GameState.ACTIVATE_CARD
+
+    def get_cards_to_activate(self) -> List[GridPosition]:
+        return [GridPosition(0, 0), GridPosition(1, 0)]
+
+    def is_activation_complete(self) -> bool:
+        return True
+
+
+def codes(bits: int) -> List[int]:
+    return [code for code in range(bits.bit_length()) if bits >> code & 1]
+
+
+class TestActionSpace(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.space = ActionSpace()
+
+    def test_fixed_actions_round_trip(self) -> None:
+        game = FakeBoardGame([0, 1])
+        for action in (TakeCardAction(CardSource(Deck.II, 3), GridPosition(-1, 2)),
+                       DiscardCardAction(Deck.I), FinishTurnAction(),
+                       SelectRewardAction(Resource.MONEY), SelectScoringAction(1)):
+            code = self.space.encode(action)
+            assert code is not None
+            self.assertEqual(self.space.decode(game, code), action)
+        self.assertEqual(self.space.size, self.space.scoring + 2)
+        self.assertIsNone(self.space.decode(game, self.space.size))
+
+    def test_take_mask_matches_legal_actions(self) -> None:
+        game = FakeBoardGame([0, 1])
+        game.take_card(0, CardSource(Deck.I, 0), GridPosition(0, 0))
+        game.take_card(1, CardSource(Deck.I, 0), GridPosition(1, 1))
+        game.take_card(0, CardSource(Deck.I, 0), GridPosition(0, 1))
+        legal = {self.space.encode(action) for action in FakeBoardMoves().legal_actions(game)}
+        bits = self.space.mask_bits(game)
+        takes = [code for code in codes(bits) if code < self.space.discard]
+        self.assertTrue(legal <= set(takes))
+        for code in takes:
+            action = self.space.decode(game, code)
+            assert isinstance(action, TakeCardAction)
+            self.assertIsNotNone(game.piles[action.source.deck].get_card(action.source.index))
+            self.assertTrue(game.players[1].grid.can_put_card(action.destination))
+        self.assertEqual(len(takes), (3 + 1) * len(legal))
+        self.assertEqual(codes(bits)[-2:], [self.space.discard, self.space.discard + 1])
+
+    def test_activation_mask(self) -> None:
+        game = FakeActivationGame([0, 1])
+        bits = self.space.mask_bits(game)
+        producer = self.space.activate + slot_of(GridPosition(1, 0)) * 8
+        self.assertEqual(codes(bits), [producer, self.space.finish])
+        action = self.space.decode(game, producer)
+        assert isinstance(action, ActivateCardAction)
+        self.assertEqual(action.outputs, [(Resource.GREEN, GridPosition(1, 0))])
+        self.assertIsNone(self.space.decode(game, producer + 1))
+
+    def test_mask_bytes(self) -> None:
+        game = FakeBoardGame([0, 1])
+        out = array("B", bytes(self.space.size))
+        self.space.mask(game, memoryview(out))
+        self.assertEqual([i for i, value in enumerate(out) if value],
+                         codes(self.space.mask_bits(game)))
+        self.assertEqual(sum(out), 6 * len(POSITIONS) + 2)
+
+    def test_vector_env_keeps_masks(self) -> None:
+        env = VectorEnv(FakeBoardGame, 2, 2, self.space, action_space=self.space)
+        env.reset()
+        assert env.masks is not None
+        self.assertEqual(env.masks.shape, (2, self.space.size))
+        centre = slot_of(GridPosition(0, 0))
+        env.step([centre, centre])
+        env.step([centre, 0])
+        self.assertEqual(env.illegal.tolist(), [0, 0])
+        masks = env.masks.tolist()
+        assert isinstance(masks[0], list)
+        self.assertEqual(sum(masks[0][:25]), 4)
+        self.assertEqual(masks[0][:25], masks[1][:25])
+
+
+if __name__ == '__main__':
+    unittest.main()
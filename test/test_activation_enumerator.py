@@ -0,0 +1,72 @@
+import unittest
+
+from terra_futura.activation_enumerator import ActivationEnumerator
+from terra_futura.card import Card
+from terra_futura.effects import (
+    EffectArbitraryBasic,
+    EffectAssistance,
+    EffectOr,
+    EffectTransformationFixed
+)
+from terra_futura.grid import Grid
+from terra_futura.process_action import ProcessAction
+from terra_futura.simple_types import GridPosition, Resource
+
+
+class TestActivationEnumerator(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.grid = Grid()
+        self.source_a = Card([Resource.RED, Resource.RED, Resource.GREEN], 1)
+        self.source_b = Card([Resource.RED, Resource.RED, Resource.CAR], 0)
+        self.grid.put_card(GridPosition(0, 0), self.source_a)
+        self.grid.put_card(GridPosition(1, 0), self.source_b)
+        self.enumerator = ActivationEnumerator()
+
+    def _place(self, card: Card) -> Card:
+        self.grid.put_card(GridPosition(0, 1), card)
+        return card
+
+    def test_fixed_effect_distributes_inputs_without_duplicates(self) -> None:
+        card = self._place(Card([], 2, upperEffect=EffectTransformationFixed(
+            [Resource.RED, Resource.RED], [Resource.BULB], 1)))
+        activations = list(self.enumerator.activations(card, self.grid))
+
+        # 3 ways to take two reds (2+0, 1+1, 0+2) times 2 pollution targets
+        # (source_b has no room for pollution).
+        self.assertEqual(len(activations), 6)
+        for inputs, outputs, pollution in activations:
+            self.assertEqual(outputs, [(Resource.BULB, GridPosition(0, 1))])
+            self.assertNotIn(GridPosition(1, 0), pollution)
+            self.assertIsNotNone(ProcessAction().plan_activation(
+                card, self.grid, inputs, outputs, pollution))
+
+    def test_or_of_arbitrary_and_fixed_is_deduplicated(self) -> None:
+        card = self._place(Card([], 0, lowerEffect=EffectOr([
+            EffectArbitraryBasic(1, [Resource.MONEY], 0),
+            EffectTransformationFixed([Resource.GREEN], [Resource.MONEY], 0),
+            EffectAssistance()
+        ])))
+        activations = list(self.enumerator.activations(card, self.grid))
+
+        # Red from either source or green from source_a.
+        self.assertEqual(len(activations), 3)
+        for inputs, outputs, pollution in activations:
+            self.assertIsNotNone(ProcessAction().plan_activation(
+                card, self.grid, inputs, outputs, pollution))
+
+    def test_nothing_when_card_cannot_be_activated(self) -> None:
+        card = self._place(Card([], 0, upperEffect=EffectTransformationFixed(
+            [], [Resource.GREEN], 0)))
+        self.assertEqual(len(list(self.enumerator.activations(card, self.grid))), 1)
+        self.grid.set_activated(card.get_position())
+        self.assertEqual(list(self.enumerator.activations(card, self.grid)), [])
+
+    def test_missing_resources_give_no_activation(self) -> None:
+        card = self._place(Card([], 0, upperEffect=EffectTransformationFixed(
+            [Resource.GEAR], [Resource.CAR], 0)))
+        self.assertEqual(list(self.enumerator.activations(card, self.grid)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
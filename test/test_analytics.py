@@ -0,0 +1,175 @@
+import os
+import tempfile
+import unittest
+from typing import List, Optional, Tuple
+
+from terra_futura.action_log import ActionLog, ActionRecord, ReplayError
+from terra_futura.actions import (
+    ActivateCardAction,
+    FinishTurnAction,
+    SelectScoringAction,
+    TakeCardAction,
+)
+from terra_futura.analytics import (
+    ActivationCounts,
+    CardWins,
+    CountAccumulator,
+    HistogramAccumulator,
+    PollutionPerTurn,
+    ScoringTotals,
+    SeriesAccumulator,
+    WinRateAccumulator,
+    aggregate,
+    archive_source,
+    card_label,
+    decode,
+    extract,
+    replay,
+)
+from terra_futura.archive import Archive, ArchiveWriter
+from terra_futura.card import Card
+from terra_futura.effects import EffectTransformationFixed
+from terra_futura.grid import Grid
+from terra_futura.interfaces import TerraFuturaInterface
+from terra_futura.scoring_method import ScoringMethod
+from terra_futura.simple_types import CardSource, Deck, GridPosition, Points, Resource
+
+PRODUCER = EffectTransformationFixed([], [Resource.GREEN], 1)
+
+
+class FakePlayer:
+
+    def __init__(self) -> None:
+        self.grid = Grid()
+        self.selected_scoring: Optional[ScoringMethod] = None
+
+
+class FakeLedgerGame(TerraFuturaInterface):  # pylint: disable=abstract-method
+    """Accepts every action and applies its resources without checking rules."""
+
+    def __init__(self, player_ids: List[int]):
+        self.players = {pid: FakePlayer() for pid in player_ids}
+
+    def take_card(self, player_id: int, source: CardSource,
+                  destination: GridPosition) -> bool:
+        self.players[player_id].grid.put_card(
+            destination, Card([], 5, lowerEffect=PRODUCER if source.index else None))
+        return True
+
+    def activate_card(self, player_id: int, card: GridPosition,
+                      inputs: List[Tuple[Resource, GridPosition]],
+                      outputs: List[Tuple[Resource, GridPosition]],
+                      pollution: List[GridPosition], other_player_id: Optional[int],
+                      other_card: Optional[GridPosition]) -> bool:
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+        grid = self.players[player_id].grid
+        for resource, pos in outputs:
+            target = grid.get_card(pos)
+            assert target is not None
+            target.put_resources([resource])
+        for pos in pollution:
+            target = grid.get_card(pos)
+            assert target is not None
+            target.put_resources([Resource.POLLUTION])
+        return True
+
+    def turn_finished(self, player_id: int) -> bool:
+        return True
+
+    def select_scoring(self, player_id: int, card: int) -> bool:
+        player = self.players[player_id]
+        player.selected_scoring = ScoringMethod([Resource.GREEN], Points(card + 1))
+        greens = [r for _, c in player.grid.get_cards() for r in c.resources]
+        player.selected_scoring.select_this_method_and_calculate(greens)
+        return True
+
+
+    def get_winner(self) -> Optional[int]:
+        scored = [pid for pid, player in self.players.items() if player.selected_scoring]
+        return scored[0] if scored else None
+
+
+def ledger(seed: int, player_ids: List[int]) -> TerraFuturaInterface:  # pylint: disable=unused-argument
+    return FakeLedgerGame(player_ids)
+
+
+def sample_log(seed: int) -> ActionLog:
+    centre = GridPosition(0, 0)
+    produce = ActivateCardAction(centre, [], [(Resource.GREEN, centre)], [centre])
+    return ActionLog(seed, [0, 1], [
+        ActionRecord(0, TakeCardAction(CardSource(Deck.I, 1), centre)),
+        ActionRecord(0, produce),
+        ActionRecord(0, FinishTurnAction()),
+        ActionRecord(1, TakeCardAction(CardSource(Deck.I, 0), centre)),
+        ActionRecord(1, FinishTurnAction()),
+        ActionRecord(0, produce),
+        ActionRecord(0, FinishTurnAction()),
+        ActionRecord(0, SelectScoringAction(seed)),
+    ])
+
+
+class TestAnalytics(unittest.TestCase):
+
+    def test_extractors(self) -> None:
+        rows = list(extract(replay([sample_log(2)], ledger),
+                            [ActivationCounts(), PollutionPerTurn(), ScoringTotals()]))
+        producer = card_label(Card([], 1, lowerEffect=PRODUCER))
+        self.assertEqual(rows, [{
+            "activations": {producer: 2},
+            "pollution": [1, 1, 2],
+            "scores": {0: 6},
+        }])
+
+    def test_card_wins_and_histograms(self) -> None:
+        rows = list(extract(replay([sample_log(1), sample_log(4)], ledger),
+                            [CardWins(), PollutionPerTurn()]))
+        producer = card_label(Card([], 1, lowerEffect=PRODUCER))
+        plain = card_label(Card([], 1))
+        self.assertEqual(rows[0]["card_wins"], {producer: (1, 1), plain: (0, 1)})
+        rates = aggregate(rows, {"card_wins": WinRateAccumulator(),
+                                 "pollution": HistogramAccumulator(2)})
+        self.assertEqual(rates["card_wins"].result(), {producer: 1.0, plain: 0.0})
+        self.assertEqual(rates["pollution"].result(), {0: 4, 2: 2})
+
+    def test_pipeline_over_archive_is_lazy(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "games.tfl")
+            with ArchiveWriter(path) as writer:
+                writer.extend(sample_log(seed) for seed in range(3))
+            with Archive(path) as archive:
+                rows = extract(replay(decode(archive_source(archive, 1)), ledger),
+                               [ActivationCounts(), PollutionPerTurn(), ScoringTotals()])
+                first = next(rows)
+                self.assertEqual(first["scores"], {0: 4})
+                totals = aggregate(rows, {"activations": CountAccumulator(),
+                                          "pollution": SeriesAccumulator(),
+                                          "scores": CountAccumulator()})
+        self.assertEqual(totals["scores"].result(), {0: 6})
+        self.assertEqual(list(totals["activations"].result().values()), [2])
+        self.assertEqual(totals["pollution"].result(), [1.0, 1.0, 2.0])
+
+    def test_refused_action_stops_the_pipeline(self) -> None:
+        refusing = FakeLedgerGame.turn_finished
+        try:
+            FakeLedgerGame.turn_finished = lambda self, player_id: False  # type: ignore
+            with self.assertRaises(ReplayError) as raised:
+                list(extract(replay([sample_log(0)], ledger), [ActivationCounts()]))
+        finally:
+            FakeLedgerGame.turn_finished = refusing  # type: ignore
+        self.assertEqual(raised.exception.index, 2)
+
+    def test_accumulators_merge(self) -> None:
+        left, right = SeriesAccumulator(), SeriesAccumulator()
+        left.add([1, 2])
+        right.add([3, 4, 5])
+        left.merge(right)
+        self.assertEqual(left.result(), [2.0, 3.0, 5.0])
+        counts, other = CountAccumulator(), CountAccumulator()
+        counts.add({"a": 1})
+        other.add({"a": 2, "b": 1})
+        counts.merge(other)
+        self.assertEqual(counts.result(), {"a": 3, "b": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
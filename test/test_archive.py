@@ -0,0 +1,126 @@
+import os
+import tempfile
+import unittest
+from typing import List, Tuple
+from unittest import mock
+from test.test_mcts import FakeNim, take
+
+from terra_futura.action_log import ActionLog, ActionRecord, ReplayEngine
+from terra_futura.actions import FinishTurnAction
+from terra_futura.archive import Archive, ArchiveWriter
+from terra_futura.interfaces import TerraFuturaInterface
+from terra_futura.log_codec import (
+    FORMATS,
+    MAGIC,
+    CodecError,
+    Data,
+    LogFormat,
+    decode_header,
+    decode_log,
+    decode_records,
+    read_logs,
+)
+
+
+def nim(seed: int, player_ids: List[int]) -> TerraFuturaInterface:
+    assert player_ids == [0, 1]
+    return FakeNim(seed)
+
+
+def turns_log(seed: int, turns: int) -> ActionLog:
+    log = ActionLog(seed, [0, 1])
+    for turn in range(turns):
+        log.append(ActionRecord(turn % 2, take(1 + turn % 2)))
+        log.append(ActionRecord(turn % 2, FinishTurnAction()))
+    return log
+
+
+def old_format(decoded: List[str]) -> LogFormat:
+    """Format of an earlier version that lists the decoders it ran."""
+    def log(data: Data, pos: int) -> Tuple[ActionLog, int]:
+        decoded.append("log")
+        return decode_log(data, pos)
+
+    def header(data: Data, pos: int) -> Tuple[int, List[int], int, int]:
+        decoded.append("header")
+        return decode_header(data, pos)
+
+    def records(data: Data, pos: int, end: int) -> List[ActionRecord]:
+        decoded.append("records")
+        return decode_records(data, pos, end)
+    return LogFormat(log, header, records)
+
+
+class TestArchive(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.directory.name, "games.tfl")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_random_access_by_game_and_turn(self) -> None:
+        logs = [turns_log(i, i % 5) for i in range(20)]
+        with ArchiveWriter(self.path) as writer:
+            writer.extend(logs[:12])
+        with ArchiveWriter(self.path) as writer:
+            self.assertEqual(writer.append(logs[12]), 12)
+            writer.extend(logs[13:])
+
+        with Archive(self.path) as archive:
+            self.assertEqual(len(archive), 20)
+            self.assertEqual(archive.log(13), logs[13])
+            self.assertEqual(archive.turn_count(13), 3)
+            turn = archive.turn_bytes(13, 1)
+            self.assertEqual(decode_records(turn, 0, len(turn)), logs[13].records[2:4])
+            self.assertEqual(archive.log_before(14, 3).records, logs[14].records[:6])
+            self.assertEqual(archive.log_before(14, 4), logs[14])
+            self.assertEqual(len(archive.log_before(0, 0)), 0)
+            del turn
+            with self.assertRaises(IndexError):
+                archive.turn_bytes(13, 3)
+            with self.assertRaises(IndexError):
+                archive.log(20)
+
+        with open(self.path, "rb") as stream:
+            self.assertEqual(list(read_logs(stream)), logs)
+
+    def test_position_replays_to_turn(self) -> None:
+        with ArchiveWriter(self.path) as writer:
+            writer.append(ActionLog(9, [0, 1], [ActionRecord(0, take(2)),
+                                                ActionRecord(1, take(1))]))
+        with Archive(self.path) as archive:
+            game = archive.position(0, 1, ReplayEngine(nim))
+            self.assertEqual(game.snapshot(), (6, 0, None, 12))
+
+    def test_empty_archive(self) -> None:
+        ArchiveWriter(self.path).close()
+        with Archive(self.path) as archive:
+            self.assertEqual(len(archive), 0)
+
+    def test_old_version_is_decoded_by_its_format(self) -> None:
+        logs = [turns_log(i, 3) for i in range(3)]
+        with ArchiveWriter(self.path) as writer:
+            writer.extend(logs)
+        with open(self.path, "r+b") as data:
+            data.seek(len(MAGIC))
+            data.write(bytes([0]))
+
+        with self.assertRaises(CodecError):
+            Archive(self.path)
+        decoded: List[str] = []
+        with mock.patch.dict(FORMATS, {0: old_format(decoded)}):
+            with Archive(self.path) as archive:
+                self.assertEqual(archive.log(1), logs[1])
+                self.assertEqual(archive.log_before(2, 1).records, logs[2].records[:2])
+            with open(self.path, "rb") as stream:
+                self.assertEqual(list(read_logs(stream)), logs)
+            with self.assertRaises(CodecError):
+                ArchiveWriter(self.path)
+        self.assertEqual(decoded[:3], ["log", "header", "records"])
+        self.assertEqual(len(decoded), 3 + len(logs))
+
+
+if __name__ == '__main__':
+    unittest.main()
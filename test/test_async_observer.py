@@ -0,0 +1,86 @@
+import asyncio
+import threading
+import unittest
+from typing import List
+
+from test.test_gameobserver import FakeObserver
+from terra_futura.async_observer import AsyncGameObserver
+from terra_futura.interfaces import ObserverInterface
+
+
+class FakeSlowObserver(ObserverInterface):
+    """Awaits the gate before accepting every state."""
+
+    def __init__(self) -> None:
+        self.gate = asyncio.Event()
+        self.received: List[str] = []
+
+    # pylint: disable-next=invalid-overridden-method
+    async def notify(self, game_state: str) -> None:  # type: ignore[override]
+        await self.gate.wait()
+        self.received.append(game_state)
+
+
+class FakeFailingObserver(ObserverInterface):
+    def notify(self, game_state: str) -> None:
+        raise ConnectionError(game_state)
+
+
+class TestAsyncGameObserver(unittest.IsolatedAsyncioTestCase):
+
+    async def test_slow_observer_is_coalesced(self) -> None:
+        observer = AsyncGameObserver(asyncio.get_running_loop(), maxsize=2)
+        slow, fast = FakeSlowObserver(), FakeObserver()
+        observer.register(1, slow)
+        observer.register(2, fast)
+        for turn in range(6):
+            observer.notifyAll({1: f"state {turn}", 2: f"state {turn}"})
+            await asyncio.sleep(0)
+
+        slow.gate.set()
+        await observer.drain()
+        self.assertEqual(fast.received, "state 5")
+        # The first state was taken before the queue filled up.
+        self.assertEqual(slow.received, ["state 0", "state 4", "state 5"])
+        metrics = observer.metrics()
+        self.assertEqual((metrics[1].delivered, metrics[1].dropped, metrics[1].depth), (3, 3, 0))
+        self.assertEqual(metrics[1].max_depth, 2)
+        self.assertEqual((metrics[2].delivered, metrics[2].dropped), (6, 0))
+        await observer.close()
+
+    async def test_drain_waits_for_delivery(self) -> None:
+        observer = AsyncGameObserver(asyncio.get_running_loop())
+        slow = FakeSlowObserver()
+        observer.register(1, slow)
+        await observer.drain(timeout=1)
+        observer.notifyAll({1: "a"})
+        await asyncio.sleep(0)
+        with self.assertRaises(asyncio.TimeoutError):
+            await observer.drain(timeout=0.01)
+        self.assertEqual(slow.received, [])
+
+        slow.gate.set()
+        await observer.drain(timeout=1)
+        self.assertEqual(slow.received, ["a"])
+        await observer.close()
+
+    async def test_notify_from_another_thread(self) -> None:
+        observer = AsyncGameObserver(asyncio.get_running_loop())
+        fake = FakeObserver()
+        failing = FakeFailingObserver()
+        observer.register(1, fake)
+        observer.register(2, failing)
+        thread = threading.Thread(target=observer.notifyAll, args=({1: "a", 2: "b", 3: "c"},))
+        thread.start()
+        thread.join()
+        await asyncio.sleep(0)
+        await observer.drain()
+        self.assertEqual(fake.received, "a")
+        self.assertEqual(observer.metrics()[2].errors, 1)
+        self.assertNotIn(3, observer.metrics())
+        await observer.close()
+        self.assertEqual(observer.metrics(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -40,6 +40,13 @@ class TestCardBasics(unittest.TestCase):
         card.put_resources([Resource.POLLUTION])
         self.assertIn(Resource.POLLUTION, card.resources)
 
+    def test_snapshot_and_restore(self)-> None:
+        card = Card([Resource.GREEN], pollutionSpacesL=2)
+        snapshot = card.snapshot()
+        card.put_resources([Resource.POLLUTION, Resource.CAR])
+        card.restore(snapshot)
+        self.assertEqual(card.resources, [Resource.GREEN])
+
 
 class TestCardWithEffects(unittest.TestCase):
 
@@ -117,8 +124,25 @@ class TestCardState(unittest.TestCase):
         effect = EffectTransformationFixed([Resource.RED], [Resource.GREEN], pollution=0)
         card = Card([Resource.RED, Resource.GREEN], 3, True, effect, None)
         state = json.loads(card.state())
-        self.assertEqual(state["resources"], ["Red", "Green"])
+        self.assertCountEqual(state["resources"], ["Red", "Green"])
         self.assertEqual(state["pollution_limit"], 3)
         self.assertTrue(state["assistance"])
         self.assertEqual(state["upper_effect"]["type"], "fixed")
         self.assertIsNone(state["lower_effect"])
+
+    def test_state_is_cached_until_changed(self) -> None:
+        effect = EffectTransformationFixed([Resource.RED], [Resource.GREEN], pollution=0)
+        card = Card([Resource.RED], 2, False, effect, effect)
+        state = card.state()
+        self.assertIs(card.state(), state)
+        self.assertEqual(state, json.dumps(card.to_dict()))
+
+        card.put_resources([Resource.POLLUTION])
+        self.assertEqual(json.loads(card.state())["pollution"], 1)
+        card.get_resources([Resource.RED])
+        self.assertEqual(card.to_dict()["resources"], ["Pollution"])
+        self.assertEqual(card.state(), json.dumps(card.to_dict()))
+        card.restore(Card([Resource.RED], 2).snapshot())
+        self.assertEqual(card.state(), state)
+        card.resources.append(Resource.GEAR)
+        self.assertEqual(card.state(), state)
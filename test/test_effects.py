@@ -49,6 +49,21 @@ class TestEffects(unittest.TestCase):
         self.assertTrue(effect_or.check([Resource.GREEN], [Resource.MONEY], 0))
         self.assertFalse(effect_or.check([Resource.YELLOW], [Resource.MONEY], 0))
 
+    def test_effect_or_nested_and_arbitrary(self) -> None:
+        effect_or = EffectOr([
+            EffectOr([
+                EffectTransformationFixed([Resource.RED, Resource.GREEN], [Resource.CAR], 1)
+            ]),
+            EffectArbitraryBasic(2, [Resource.BULB], 0),
+            EffectPollutionTransfer()
+        ])
+        self.assertTrue(effect_or.check([Resource.GREEN, Resource.RED], [Resource.CAR], 1))
+        self.assertFalse(effect_or.check([Resource.GREEN, Resource.RED], [Resource.CAR], 0))
+        self.assertTrue(effect_or.check([Resource.YELLOW, Resource.YELLOW], [Resource.BULB], 0))
+        self.assertFalse(effect_or.check([Resource.YELLOW, Resource.GEAR], [Resource.BULB], 0))
+        self.assertFalse(effect_or.check([Resource.YELLOW], [Resource.BULB], 0))
+        self.assertTrue(effect_or.check([], [], 3))
+
     def test_effect_or_has_assistance(self) -> None:
         effect = EffectOr([
             EffectTransformationFixed([], [], 0),
@@ -67,6 +82,11 @@ class TestEffects(unittest.TestCase):
         self.assertEqual(state["type"], "fixed")
         self.assertEqual(state["pollution"], 1)
 
+    def test_nested_state_is_serialized_once(self) -> None:
+        eff = EffectOr([EffectTransformationFixed([], [Resource.RED], 0), EffectAssistance()])
+        self.assertEqual(eff.to_dict()["options"][1], {"type": "assistance"})
+        self.assertEqual(eff.state(), json.dumps(eff.to_dict()))
+
     def test_pollution_transfer(self) -> None:
         effect = EffectPollutionTransfer()
         self.assertTrue(effect.check([], [], 0))
@@ -0,0 +1,287 @@
+import unittest
+from typing import List, Set
+
+from terra_futura.activation_pattern import ActivationPattern, GridActivation
+from terra_futura.actions import ActivateCardAction, CandidateAction, TakeCardAction
+from terra_futura.card import Card
+from terra_futura.effects import EffectTransformationFixed
+from terra_futura.game import Game
+from terra_futura.interfaces import InterfaceCard, InterfacePile
+from terra_futura.pile import Pile
+from terra_futura.random_provider import SeededRandomProvider
+from terra_futura.simple_types import CardSource, Deck, GameState, GridPosition, Resource
+
+CENTRE = GridPosition(0, 0)
+EAST = GridPosition(1, 0)
+
+
+def producer(output: Resource = Resource.GREEN) -> Card:
+    return Card([], 1, upperEffect=EffectTransformationFixed([], [output], 0))
+
+
+def converter() -> Card:
+    return Card([], 1, upperEffect=EffectTransformationFixed([Resource.GREEN], [Resource.GEAR], 1))
+
+
+def helper() -> Card:
+    """Assistance card producing green whose lower effect turns red into a gear."""
+    return Card([], 2, True,
+                upperEffect=EffectTransformationFixed([], [Resource.GREEN], 0),
+                lowerEffect=EffectTransformationFixed([Resource.RED], [Resource.GEAR], 0))
+
+
+def dealt_game(player_ids: List[int]) -> Game:
+    """Game with unshuffled piles: producers and converters, then helpers."""
+    first: List[InterfaceCard] = [converter() if i % 3 else producer() for i in range(18)]
+    second: List[InterfaceCard] = [helper() for _ in range(6)]
+    piles: dict[Deck, InterfacePile] = {Deck.I: Pile(first), Deck.II: Pile(second)}
+    return Game(player_ids, piles)
+
+
+def applies(game: Game, player_id: int, candidate: CandidateAction) -> bool:
+    snapshot = game.snapshot()
+    done = candidate.apply(game, player_id)
+    game.restore(snapshot)
+    return done
+
+
+class TestGame(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.game = dealt_game([1, 2])
+
+    def test_turn_order(self) -> None:
+        game = self.game
+        self.assertFalse(game.take_card(2, CardSource(Deck.I, 1), CENTRE))
+        self.assertTrue(game.take_card(1, CardSource(Deck.I, 3), CENTRE))
+        self.assertEqual(game.get_state(), GameState.ACTIVATE_CARD)
+        self.assertEqual(game.get_cards_to_activate(), [CENTRE])
+        self.assertFalse(game.turn_finished(1))
+        self.assertTrue(game.activate_card(1, CENTRE, [], [(Resource.GREEN, CENTRE)],
+                                           [], None, None))
+        self.assertTrue(game.is_activation_complete())
+        self.assertTrue(game.turn_finished(1))
+        self.assertEqual((game.get_current_player(), game.get_turn_number()), (2, 2))
+        self.assertEqual(game.get_state(), GameState.TAKE_CARD_NO_CARD_DISCARDED)
+
+    def test_validate_many_matches_single_actions(self) -> None:
+        game = self.game
+        takes: List[CandidateAction] = [
+            TakeCardAction(CardSource(deck, index), GridPosition(x, 0))
+            for deck in Deck for index in (0, 1, 4, 5) for x in (0, 2)
+        ]
+        self.assertEqual(game.validate_many(1, takes), [applies(game, 1, c) for c in takes])
+        self.assertEqual(game.validate_many(2, takes), [False] * len(takes))
+
+        game.take_card(1, CardSource(Deck.I, 3), CENTRE)
+        activations: List[CandidateAction] = [
+            ActivateCardAction(CENTRE, [], [(Resource.GREEN, CENTRE)], []),
+            ActivateCardAction(CENTRE, [], [(Resource.GREEN, CENTRE)], [CENTRE]),
+            ActivateCardAction(CENTRE, [], [(Resource.RED, CENTRE)], []),
+            ActivateCardAction(EAST, [], [(Resource.GREEN, EAST)], []),
+            ActivateCardAction(CENTRE, [], [(Resource.GREEN, CENTRE)], [], 2, CENTRE),
+            TakeCardAction(CardSource(Deck.I, 1), EAST),
+        ]
+        verdicts = game.validate_many(1, activations)
+        self.assertEqual(verdicts, [applies(game, 1, c) for c in activations])
+        self.assertEqual(verdicts, [True, False, False, False, False, False])
+
+    def test_restore_returns_to_snapshot(self) -> None:
+        game = self.game
+        game.take_card(1, CardSource(Deck.I, 3), CENTRE)
+        snapshot = game.snapshot()
+        state, hash_value = game.state(), game.hash
+        produced = game.players[1].grid.get_card(CENTRE)
+        assert produced is not None
+
+        game.activate_card(1, CENTRE, [], [(Resource.GREEN, CENTRE)], [], None, None)
+        game.turn_finished(1)
+        game.discard_last_card_from_deck(2, Deck.I)
+        game.take_card(2, CardSource(Deck.II, 1), CENTRE)
+        self.assertNotEqual(game.state(), state)
+
+        game.restore(snapshot)
+        self.assertEqual(game.state(), state)
+        self.assertEqual(game.hash, hash_value)
+        self.assertEqual(game.rehash(), hash_value)
+        self.assertEqual(produced.snapshot(), 0)
+        self.assertIsNone(game.players[2].grid.get_card(CENTRE))
+        self.assertEqual(game.piles[Deck.I].sizes(), (13, 0))
+        self.assertEqual(game.piles[Deck.II].sizes(), (2, 0))
+        self.assertTrue(game.activate_card(1, CENTRE, [], [(Resource.GREEN, CENTRE)],
+                                           [], None, None))
+
+    def test_discard_and_state(self) -> None:
+        game = self.game
+        last = game.piles[Deck.I].get_card(4)
+        self.assertTrue(game.discard_last_card_from_deck(1, Deck.I))
+        self.assertFalse(game.discard_last_card_from_deck(1, Deck.I))
+        self.assertIsNot(game.piles[Deck.I].get_card(4), last)
+        self.assertEqual(game.piles[Deck.I].sizes(), (13, 1))
+        state = game.to_dict()
+        self.assertEqual(state["state"], "TAKE_CARD_CARD_DISCARDED")
+        self.assertEqual(state["piles"]["I"]["discarded"], 1)
+
+    def test_undo_reverts_actions(self) -> None:
+        game = self.game
+        game.journal.enabled = True
+        state, hash_value = game.state(), game.hash
+        self.assertFalse(game.undo())
+
+        game.take_card(1, CardSource(Deck.I, 3), CENTRE)
+        mark = game.mark()
+        taken = game.state()
+        game.activate_card(1, CENTRE, [], [(Resource.GREEN, CENTRE)], [], None, None)
+        game.turn_finished(1)
+        self.assertFalse(game.activate_card(2, CENTRE, [], [], [], None, None))
+        game.discard_last_card_from_deck(2, Deck.I)
+
+        self.assertTrue(game.undo())
+        self.assertEqual(game.get_state(), GameState.TAKE_CARD_NO_CARD_DISCARDED)
+        self.assertEqual(game.get_current_player(), 2)
+        game.undo_to(mark)
+        self.assertEqual(game.state(), taken)
+        self.assertTrue(game.undo())
+        self.assertFalse(game.undo())
+        self.assertEqual(game.state(), state)
+        self.assertEqual(game.hash, hash_value)
+
+    def test_undo_assisted_activation(self) -> None:
+        game = self.game
+        supplier = producer(Resource.RED)
+        supplier.put_resources([Resource.RED])
+        game.players[1].grid.put_card(CENTRE, supplier)
+        assistant = helper()
+        game.players[2].grid.put_card(CENTRE, assistant)
+        game.rehash()
+        game.take_card(1, CardSource(Deck.II, 1), EAST)
+        assisted = game.players[1].grid.get_card(EAST)
+        assert assisted is not None
+
+        game.journal.enabled = True
+        state, hash_value = game.state(), game.hash
+        self.assertTrue(game.activate_card(1, EAST, [(Resource.RED, CENTRE)],
+                                           [(Resource.GEAR, EAST)], [], 2, CENTRE))
+        self.assertEqual(game.get_state(), GameState.SELECT_REWARD)
+        self.assertFalse(game.select_reward(1, Resource.GEAR))
+        self.assertTrue(game.select_reward(2, Resource.GEAR))
+        self.assertEqual(game.get_state(), GameState.ACTIVATE_CARD)
+        self.assertTrue(assistant.resources)
+        self.assertTrue(assisted.resources)
+
+        self.assertTrue(game.undo())
+        self.assertEqual(game.get_state(), GameState.SELECT_REWARD)
+        self.assertFalse(assistant.resources)
+        self.assertTrue(game.undo())
+        self.assertEqual(game.state(), state)
+        self.assertEqual(game.hash, hash_value)
+        self.assertEqual(supplier.resources, [Resource.RED])
+        self.assertFalse(assisted.resources)
+        self.assertTrue(game.activate_card(1, EAST, [(Resource.RED, CENTRE)],
+                                           [(Resource.GEAR, EAST)], [], 2, CENTRE))
+
+    def test_pattern_skips_empty_positions(self) -> None:
+        game = self.game
+        game.players[1].grid.put_card(CENTRE, producer())
+        game.players[1].activation_patterns.append(
+            ActivationPattern(GridActivation(game.players[1].grid), [(0, 0), (1, 1)]))
+        game.players[2].activation_patterns.append(
+            ActivationPattern(GridActivation(game.players[2].grid), [(1, 1)]))
+        game.turn_number, game.on_turn = 18, 2
+        self.assertTrue(game.take_card(2, CardSource(Deck.I, 3), CENTRE))
+        self.assertTrue(game.activate_card(2, CENTRE, [], [(Resource.GREEN, CENTRE)],
+                                           [], None, None))
+        self.assertTrue(game.turn_finished(2))
+
+        self.assertTrue(game.select_activation_pattern(1, 0))
+        self.assertEqual(game.get_cards_to_activate(), [CENTRE])
+        self.assertTrue(game.activate_card(1, CENTRE, [], [(Resource.GREEN, CENTRE)],
+                                           [], None, None))
+        self.assertTrue(game.turn_finished(1))
+        self.assertTrue(game.select_activation_pattern(2, 0))
+        self.assertEqual(game.get_state(), GameState.SELECT_SCORING_METHOD)
+
+    def test_hash_is_kept_incrementally(self) -> None:
+        game = self.game
+        hashes: Set[int] = set()
+
+        def check(done: bool) -> None:
+            self.assertTrue(done)
+            self.assertNotIn(game.hash, hashes)
+            hashes.add(game.hash)
+            self.assertEqual(game.hash, game.rehash())
+
+        supplier = producer(Resource.RED)
+        supplier.put_resources([Resource.RED])
+        game.players[1].grid.put_card(CENTRE, supplier)
+        game.players[2].grid.put_card(CENTRE, helper())
+        for player_id in (1, 2):
+            grid = GridActivation(game.players[player_id].grid)
+            game.players[player_id].activation_patterns.append(ActivationPattern(grid, [(0, 0)]))
+        game.rehash()
+        check(True)
+
+        check(game.discard_last_card_from_deck(1, Deck.II))
+        check(game.take_card(1, CardSource(Deck.II, 0), EAST))
+        check(game.activate_card(1, EAST, [(Resource.RED, CENTRE)],
+                                 [(Resource.GEAR, EAST)], [], 2, CENTRE))
+        check(game.select_reward(2, Resource.GEAR))
+        check(game.activate_card(1, CENTRE, [], [(Resource.RED, CENTRE)], [], None, None))
+        check(game.turn_finished(1))
+
+        game.turn_number = 18
+        game.rehash()
+        check(True)
+        check(game.take_card(2, CardSource(Deck.I, 3), EAST))
+        check(game.activate_card(2, EAST, [], [(Resource.GREEN, EAST)], [], None, None))
+        check(game.activate_card(2, CENTRE, [], [(Resource.GREEN, CENTRE)], [], None, None))
+        check(game.turn_finished(2))
+        self.assertEqual(game.get_state(), GameState.SELECT_ACTIVATION_PATTERN)
+        check(game.select_activation_pattern(1, 0))
+        check(game.activate_card(1, CENTRE, [], [(Resource.RED, CENTRE)], [], None, None))
+        check(game.turn_finished(1))
+        check(game.select_activation_pattern(2, 0))
+        check(game.activate_card(2, CENTRE, [], [(Resource.GREEN, CENTRE)], [], None, None))
+        check(game.turn_finished(2))
+        self.assertEqual(game.get_state(), GameState.SELECT_SCORING_METHOD)
+
+
+class TestPile(unittest.TestCase):
+
+    def test_visible_cards_keep_their_places(self) -> None:
+        cards: List[InterfaceCard] = [producer() for _ in range(6)]
+        pile = Pile(cards)
+        self.assertIs(pile.get_card(1), cards[5])
+        self.assertIs(pile.get_card(0), cards[1])
+        self.assertIs(pile.take_card(2), cards[4])
+        self.assertIs(pile.get_card(2), cards[1])
+        self.assertIs(pile.get_card(3), cards[3])
+        self.assertIs(pile.remove_last_card(), cards[2])
+        self.assertIs(pile.get_card(4), cards[0])
+        self.assertIsNone(pile.get_card(0))
+        self.assertIs(pile.take_card(1), cards[5])
+        self.assertIs(pile.get_card(1), cards[2])
+        self.assertEqual(pile.sizes(), (0, 0))
+        self.assertIsNone(pile.take_card(5))
+
+        snapshot = pile.snapshot()
+        pile.take_card(1)
+        pile.restore(snapshot)
+        self.assertIs(pile.get_card(1), cards[2])
+
+    def test_restore_rewinds_the_random_stream(self) -> None:
+        pile = Pile([producer() for _ in range(12)], SeededRandomProvider(3))
+
+        def reshuffle() -> List[InterfaceCard]:
+            for _ in range(10):
+                pile.remove_last_card()
+            return [card for card in (pile.get_card(i) for i in range(5)) if card is not None]
+
+        snapshot = pile.snapshot()
+        first = reshuffle()
+        pile.restore(snapshot)
+        self.assertEqual(reshuffle(), first)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import json
+import unittest
+from typing import Any, Dict
+from terra_futura.gameobserver import DeltaGameObserver, GameObserver
+from terra_futura.interfaces import ObserverInterface
+from terra_futura.state_patch import StateReplica
+
+
+class FakeObserver(ObserverInterface):
+    def __init__(self) -> None:
+        self.received: str | None = None
+
+    def notify(self, game_state: str) -> None:
+        self.received = game_state
+
+
+class TestGameObserver(unittest.TestCase):
+
+    def test_register_and_notify(self) -> None:
+        observer = GameObserver()
+        fake1 = FakeObserver()
+        fake2 = FakeObserver()
+        observer.register(1, fake1)
+        observer.register(2, fake2)
+        state = {1: "state1", 2: "state2"}
+        observer.notifyAll(state)
+        assert fake1.received == "state1"
+        assert fake2.received == "state2"
+
+    def test_notify_only_registered(self) -> None:
+        observer = GameObserver()
+        fake = FakeObserver()
+        observer.register(1, fake)
+        state = {1: "hello", 99: "should_not_send"}
+        observer.notifyAll(state)
+        assert fake.received == "hello"
+
+
+class TestDeltaGameObserver(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.fake = FakeObserver()
+        self.replica = StateReplica()
+
+    def send(self, observer: DeltaGameObserver, state: Any) -> Dict[str, Any]:
+        observer.notifyAllStates({1: state})
+        assert self.fake.received is not None
+        self.assertTrue(self.replica.apply(self.fake.received))
+        self.assertEqual(self.replica.state, state)
+        message: Dict[str, Any] = json.loads(self.fake.received)
+        return message
+
+    def test_patches_between_keyframes(self) -> None:
+        observer = DeltaGameObserver(keyframe_interval=3)
+        observer.register(1, self.fake)
+        cards = [{"resources": ["Green"]}, {"resources": []}]
+        first = self.send(observer, {"cards": cards, "turn": 1})
+        self.assertEqual(first, {"version": 1, "state": {"cards": cards, "turn": 1}})
+
+        changed = [cards[0], {"resources": ["Red"]}]
+        second = self.send(observer, {"cards": changed, "turn": 2})
+        self.assertEqual(second["base"], 1)
+        self.assertEqual(second["patch"], [
+            {"op": "add", "path": "/cards/1/resources/0", "value": "Red"},
+            {"op": "replace", "path": "/turn", "value": 2},
+        ])
+        self.send(observer, {"cards": changed[:1], "turn": 3})
+        self.assertIn("state", self.send(observer, {"cards": [], "turn": 4}))
+        self.assertEqual(observer.versions, {1: 4})
+
+    def test_acknowledged_base_and_resync(self) -> None:
+        observer = DeltaGameObserver(wait_for_ack=True)
+        observer.register(1, self.fake)
+        self.send(observer, {"turn": 1})
+        self.assertIn("state", self.send(observer, {"turn": 2}))
+        observer.acknowledge(1, self.replica.acknowledge())
+        self.assertEqual(self.send(observer, {"turn": 3})["base"], 2)
+        self.assertEqual(self.send(observer, {"turn": 4})["base"], 2)
+
+        observer.resync(1)
+        self.assertIn("state", self.send(observer, {"turn": 5}))
+
+    def test_patches_against_base_acknowledged_in_flight(self) -> None:
+        observer = DeltaGameObserver(wait_for_ack=True)
+        observer.register(1, self.fake)
+        self.send(observer, {"turn": 1})
+        observer.acknowledge(1, self.replica.acknowledge())
+        self.assertEqual(self.send(observer, {"turn": 2})["base"], 1)
+        ack_in_flight = self.replica.acknowledge()
+        self.assertEqual(self.send(observer, {"turn": 3})["base"], 1)
+        observer.acknowledge(1, ack_in_flight)
+        self.assertEqual(self.send(observer, {"turn": 4})["base"], 2)
+        self.replica.acknowledge()
+        self.assertEqual(self.send(observer, {"turn": 5})["base"], 2)
+
+    def test_string_states_are_parsed(self) -> None:
+        observer = DeltaGameObserver()
+        observer.register(1, self.fake)
+        observer.notifyAll({1: '{"turn": 1}', 2: "not sent"})
+        observer.notifyAll({1: '{"turn": 2}'})
+        assert self.fake.received is not None
+        self.assertEqual(json.loads(self.fake.received)["patch"],
+                         [{"op": "replace", "path": "/turn", "value": 2}])
+        self.assertGreater(observer.bytes_sent, 0)
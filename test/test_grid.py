@@ -0,0 +1,125 @@
+import unittest
+import json
+import pickle
+
+from terra_futura.grid import POSITIONS, Grid
+from terra_futura.card import Card
+from terra_futura.simple_types import GridPosition, Resource
+
+
+class TestGridPlacement(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.grid = Grid()
+        self.start = Card([], 1)
+        self.grid.put_card(GridPosition(0, 0), self.start)
+
+    def test_put_and_get_card(self) -> None:
+        card = Card([], 1)
+        self.grid.put_card(GridPosition(1, 0), card)
+        self.assertIs(self.grid.get_card(GridPosition(1, 0)), card)
+        self.assertEqual(card.get_position(), GridPosition(1, 0))
+        self.assertIsNone(self.grid.get_card(GridPosition(-1, 0)))
+        self.assertIsNone(self.grid.get_card(GridPosition(3, 0)))
+
+    def test_find_card_by_identity(self) -> None:
+        card = Card([], 1)
+        self.grid.put_card(GridPosition(0, 1), card)
+        self.assertEqual(self.grid.find_card(card), GridPosition(0, 1))
+        self.assertEqual(self.grid.find_card(self.start), GridPosition(0, 0))
+        self.assertIsNone(self.grid.find_card(Card([], 1)))
+
+    def test_find_card_in_a_copy(self) -> None:
+        copied = pickle.loads(pickle.dumps(self.grid))
+        start = copied.get_card(GridPosition(0, 0))
+        self.assertIsNotNone(start)
+        self.assertEqual(copied.find_card(start), GridPosition(0, 0))
+        self.assertIsNone(copied.find_card(self.start))
+
+    def test_card_must_touch_existing_card(self) -> None:
+        self.assertTrue(self.grid.can_put_card(GridPosition(0, -1)))
+        self.assertFalse(self.grid.can_put_card(GridPosition(1, 1)))
+        self.assertFalse(self.grid.can_put_card(GridPosition(0, 0)))
+        self.assertFalse(self.grid.can_put_card(GridPosition(0, 3)))
+
+    def test_grid_is_at_most_three_wide(self) -> None:
+        self.grid.put_card(GridPosition(1, 0), Card([], 1))
+        self.grid.put_card(GridPosition(2, 0), Card([], 1))
+        self.assertFalse(self.grid.can_put_card(GridPosition(-1, 0)))
+        self.assertTrue(self.grid.can_put_card(GridPosition(2, 1)))
+        with self.assertRaises(ValueError):
+            self.grid.put_card(GridPosition(-1, 0), Card([], 1))
+
+    def test_placeable_mask_matches_can_put_card(self) -> None:
+        self.grid.put_card(GridPosition(1, 0), Card([], 1))
+        self.grid.put_card(GridPosition(1, 1), Card([], 1))
+        self.grid.put_card(GridPosition(1, -1), Card([], 1))
+        mask = self.grid.placeable_mask()
+        for slot, pos in enumerate(POSITIONS):
+            self.assertEqual(bool(mask >> slot & 1), self.grid.can_put_card(pos))
+        self.assertEqual(Grid().placeable_mask(), (1 << 25) - 1)
+
+    def test_row_and_column(self) -> None:
+        self.grid.put_card(GridPosition(1, 0), Card([], 1))
+        self.grid.put_card(GridPosition(1, 1), Card([], 1))
+        row, column = self.grid.get_row_and_column(GridPosition(1, 0))
+        self.assertCountEqual(row, [GridPosition(0, 0), GridPosition(1, 0)])
+        self.assertCountEqual(column, [GridPosition(1, 0), GridPosition(1, 1)])
+        self.assertCountEqual(self.grid.get_cross(GridPosition(1, 0)), [
+            GridPosition(0, 0), GridPosition(1, 0), GridPosition(1, 1)])
+
+
+class TestGridActivation(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.grid = Grid()
+        self.pos = GridPosition(0, 0)
+        self.card = Card([], 1)
+        self.grid.put_card(self.pos, self.card)
+
+    def test_card_activates_once_per_turn(self) -> None:
+        self.assertTrue(self.grid.can_be_activated(self.pos))
+        self.grid.set_activated(self.pos)
+        self.assertFalse(self.grid.can_be_activated(self.pos))
+        self.grid.end_turn()
+        self.assertTrue(self.grid.can_be_activated(self.pos))
+
+    def test_empty_or_polluted_card_cannot_be_activated(self) -> None:
+        self.assertFalse(self.grid.can_be_activated(GridPosition(1, 0)))
+        self.card.put_resources([Resource.POLLUTION])
+        self.assertTrue(self.grid.can_be_activated(self.pos))
+        self.card.resources = [Resource.POLLUTION] * 2
+        self.assertFalse(self.grid.can_be_activated(self.pos))
+
+    def test_activation_pattern_limits_cards(self) -> None:
+        other = GridPosition(0, 1)
+        self.grid.put_card(other, Card([], 1))
+        self.grid.set_activated(self.pos)
+        self.grid.set_activation_pattern([self.pos])
+        self.assertTrue(self.grid.can_be_activated(self.pos))
+        self.assertFalse(self.grid.can_be_activated(other))
+        self.grid.end_turn()
+        self.assertTrue(self.grid.can_be_activated(other))
+
+    def test_snapshot_and_restore(self) -> None:
+        snapshot = self.grid.snapshot()
+        other = Card([], 1)
+        self.grid.put_card(GridPosition(1, 0), other)
+        self.grid.set_activated(self.pos)
+
+        self.grid.restore(snapshot)
+        self.assertIsNone(self.grid.get_card(GridPosition(1, 0)))
+        self.assertIsNone(self.grid.find_card(other))
+        self.assertTrue(self.grid.can_put_card(GridPosition(1, 0)))
+        self.assertTrue(self.grid.can_be_activated(self.pos))
+
+    def test_state(self) -> None:
+        self.grid.set_activated(self.pos)
+        state = json.loads(self.grid.state())
+        self.assertEqual(state["cards"][0]["position"], [0, 0])
+        self.assertTrue(state["cards"][0]["activated"])
+        self.assertEqual(self.grid.state(), json.dumps(self.grid.to_dict()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -87,12 +87,26 @@ class TestScoringMethod(unittest.TestCase):
         before = method.state()
         self.assertIn("Not calculated", before)
         self.assertIn("selected=False", before)
+        self.assertIsNone(method.to_dict()["total"])
 
         method.select_this_method_and_calculate([Resource.GREEN, Resource.RED])
 
         after = method.state()
         self.assertIn("selected=True", after)
         self.assertIn("total=", after)
+        self.assertEqual(method.to_dict(), {"resources": ["GREEN", "RED"], "points": 4,
+                                            "selected": True, "total": 4})
+
+    def test_cached_state_cannot_be_bypassed(self) -> None:
+        method = ScoringMethod([Resource.GREEN], Points(4))
+        state = method.to_dict()
+        method.resources.append(Resource.RED)
+        with self.assertRaises(AttributeError):
+            method.selected = True  # type: ignore[misc]
+        with self.assertRaises(AttributeError):
+            method.calculated_total = Points(1)  # type: ignore[misc]
+        self.assertEqual(method.to_dict(), state)
+        self.assertEqual(method.resources, [Resource.GREEN])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,65 @@
+import unittest
+from typing import List
+
+from terra_futura.card import Card
+from terra_futura.effects import EffectTransformationFixed
+from terra_futura.grid import Grid
+from terra_futura.journal import Journal
+from terra_futura.process_action import ProcessAction
+from terra_futura.simple_types import GridPosition, Resource
+
+
+class TestJournal(unittest.TestCase):
+
+    def test_undo_to_reverts_newest_first(self) -> None:
+        journal = Journal(enabled=True)
+        values: List[int] = [0]
+        journal.record(values.__setitem__, 0, 0)
+        values[0] = 1
+        mark = journal.mark()
+        journal.record(values.__setitem__, 0, 1)
+        values[0] = 2
+        journal.record(values.__setitem__, 0, 2)
+        values[0] = 3
+
+        journal.undo_to(mark)
+        self.assertEqual(values, [1])
+        self.assertEqual(len(journal), 1)
+        journal.undo_to(0)
+        self.assertEqual(values, [0])
+
+    def test_disabled_journal_records_nothing(self) -> None:
+        journal = Journal()
+        journal.record(self.fail)
+        self.assertEqual(len(journal), 0)
+        journal.undo_to(0)
+
+
+class TestProcessActionJournal(unittest.TestCase):
+
+    def test_activation_is_undone(self) -> None:
+        grid = Grid()
+        source = Card([Resource.RED, Resource.RED], 1)
+        target = Card([], 1, upperEffect=EffectTransformationFixed(
+            [Resource.RED], [Resource.CAR], 1))
+        grid.put_card(GridPosition(0, 0), source)
+        grid.put_card(GridPosition(0, 1), target)
+        action = ProcessAction()
+        action.journal = Journal(enabled=True)
+
+        self.assertTrue(action.activate_card(
+            target, grid,
+            [(Resource.RED, GridPosition(0, 0))],
+            [(Resource.CAR, GridPosition(0, 1))],
+            [GridPosition(0, 0)]
+        ))
+        self.assertEqual(source.resources, [Resource.RED, Resource.POLLUTION])
+        self.assertEqual(target.resources, [Resource.CAR])
+
+        action.journal.undo_to(0)
+        self.assertEqual(source.resources, [Resource.RED, Resource.RED])
+        self.assertEqual(target.resources, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import io
+import unittest
+
+from terra_futura.action_log import ActionLog, ActionRecord
+from terra_futura.actions import (
+    ActivateCardAction,
+    DiscardCardAction,
+    FinishTurnAction,
+    SelectActivationPatternAction,
+    SelectRewardAction,
+    SelectScoringAction,
+    TakeCardAction,
+)
+from terra_futura.log_codec import (
+    CodecError,
+    LogWriter,
+    decode_log,
+    encode_log,
+    read_logs,
+    read_varint,
+    write_varint,
+)
+from terra_futura.simple_types import CardSource, Deck, GridPosition, Resource
+
+
+def sample_log() -> ActionLog:
+    centre, corner = GridPosition(0, 0), GridPosition(-2, 2)
+    return ActionLog(2 ** 63 + 5, [0, 300], [
+        ActionRecord(0, TakeCardAction(CardSource(Deck.II, 4), corner)),
+        ActionRecord(300, DiscardCardAction(Deck.I)),
+        ActionRecord(300, ActivateCardAction(
+            centre,
+            [(Resource.GREEN, corner), (Resource.MONEY, centre), (Resource.CAR, corner)],
+            [(Resource.POLLUTION, centre)],
+            [corner, GridPosition(1, -1)])),
+        ActionRecord(0, ActivateCardAction(centre, [], [], [], 300, GridPosition(2, -2))),
+        ActionRecord(300, SelectRewardAction(Resource.BULB)),
+        ActionRecord(0, FinishTurnAction()),
+        ActionRecord(0, SelectActivationPatternAction(1)),
+        ActionRecord(300, SelectScoringAction(200)),
+    ])
+
+
+class TestLogCodec(unittest.TestCase):
+
+    def test_varint_round_trip(self) -> None:
+        out = bytearray()
+        for value in (0, 127, 128, 300, 2 ** 64 - 1):
+            write_varint(out, value)
+        pos = 0
+        for value in (0, 127, 128, 300, 2 ** 64 - 1):
+            decoded, pos = read_varint(out, pos)
+            self.assertEqual(decoded, value)
+        self.assertEqual(pos, len(out))
+        with self.assertRaises(ValueError):
+            write_varint(out, -1)
+
+    def test_every_action_round_trips(self) -> None:
+        log = sample_log()
+        data = encode_log(log)
+        decoded, end = decode_log(data)
+        self.assertEqual(end, len(data))
+        self.assertEqual(decoded, log)
+        decoded, _ = decode_log(memoryview(data))
+        self.assertEqual(decoded, log)
+
+    def test_decoded_logs_are_independent(self) -> None:
+        data = encode_log(sample_log())
+        first, second = decode_log(data)[0], decode_log(data)[0]
+        action = first.records[2].action
+        assert isinstance(action, ActivateCardAction)
+        action.inputs.clear()
+        first.records[0].player_id = 7
+        self.assertEqual(second, sample_log())
+        self.assertEqual(decode_log(data)[0], sample_log())
+
+    def test_records_are_compact(self) -> None:
+        take = ActionLog(0, [0, 1], [ActionRecord(
+            1, TakeCardAction(CardSource(Deck.I, 2), GridPosition(1, 1)))])
+        self.assertEqual(len(encode_log(take)), 5 + 4)
+
+    def test_stream_round_trip(self) -> None:
+        stream = io.BytesIO()
+        writer = LogWriter(stream)
+        writer.write_all([sample_log(), ActionLog(1, [3, 4])])
+        stream.seek(0)
+        self.assertEqual(list(read_logs(stream)), [sample_log(), ActionLog(1, [3, 4])])
+
+    def test_rejects_bad_streams(self) -> None:
+        with self.assertRaises(CodecError):
+            list(read_logs(io.BytesIO(b"JSON")))
+        with self.assertRaises(CodecError):
+            list(read_logs(io.BytesIO(b"TFL\x09")))
+        stream = io.BytesIO()
+        LogWriter(stream).write(sample_log())
+        with self.assertRaises(CodecError):
+            list(read_logs(io.BytesIO(stream.getvalue()[:-3])))
+        with self.assertRaises(CodecError):
+            decode_log(encode_log(sample_log())[:-2])
+
+    def test_position_must_fit_a_byte(self) -> None:
+        log = ActionLog(0, [0], [ActionRecord(0, TakeCardAction(
+            CardSource(Deck.I, 0), GridPosition(8, 0)))])
+        with self.assertRaises(ValueError):
+            encode_log(log)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+from test.test_analytics import ledger, sample_log
+from terra_futura.analytics import (
+    Accumulator,
+    CardWins,
+    CountAccumulator,
+    Extractor,
+    PollutionPerTurn,
+    ScoringTotals,
+    SeriesAccumulator,
+    WinRateAccumulator,
+)
+from terra_futura.archive import ArchiveWriter
+from terra_futura.map_reduce import MapReduce, shard_name
+
+
+def extractors() -> List[Extractor]:
+    return [CardWins(), PollutionPerTurn(), ScoringTotals()]
+
+
+def accumulators() -> Dict[str, Accumulator]:
+    return {"card_wins": WinRateAccumulator(), "pollution": SeriesAccumulator(),
+            "scores": CountAccumulator()}
+
+
+def score_accumulators() -> Dict[str, Accumulator]:
+    return {"scores": CountAccumulator()}
+
+
+class TestMapReduce(unittest.TestCase):
+    executor: ProcessPoolExecutor
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.executor = ProcessPoolExecutor(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.executor.shutdown()
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.directory.name, "games.tfl")
+        with ArchiveWriter(self.path) as writer:
+            writer.extend(sample_log(seed) for seed in range(7))
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def job(self, output_dir: str = "") -> MapReduce:
+        return MapReduce(self.path, ledger, extractors, accumulators, shard_size=3,
+                         output_dir=output_dir or None, executor=self.executor)
+
+    def test_matches_a_single_pass(self) -> None:
+        job = self.job()
+        self.assertEqual(job.shards(), [(0, 3), (3, 6), (6, 7)])
+        merged = job.run()
+        self.assertEqual(merged["scores"].result(), {0: 2 * sum(range(1, 8))})
+        self.assertEqual(merged["pollution"].result(), [1.0, 1.0, 2.0])
+        self.assertEqual(sorted(merged["card_wins"].result().values()), [0.0, 1.0])
+
+    def test_resumes_from_saved_shards(self) -> None:
+        output = os.path.join(self.directory.name, "out")
+        first = self.job(output).run()
+        self.assertEqual(sorted(os.listdir(output)),
+                         [shard_name(shard) for shard in [(0, 3), (3, 6), (6, 7)]])
+
+        os.remove(os.path.join(output, shard_name((3, 6))))
+        job = self.job(output)
+        again = job.run()
+        self.assertEqual((job.resumed, job.computed), (2, 1))
+        self.assertEqual(again["scores"].result(), first["scores"].result())
+
+    def test_ignores_shards_of_other_archives_and_jobs(self) -> None:
+        output = os.path.join(self.directory.name, "out")
+        self.job(output).run()
+
+        job = MapReduce(self.path, ledger, extractors, score_accumulators, shard_size=3,
+                        output_dir=output, executor=self.executor)
+        self.assertEqual(set(job.run()), {"scores"})
+        self.assertEqual((job.resumed, job.computed), (0, 3))
+
+        with ArchiveWriter(self.path) as writer:
+            writer.append(sample_log(1))
+        job = self.job(output)
+        merged = job.run()
+        self.assertEqual((job.resumed, job.computed), (0, 3))
+        self.assertEqual(merged["scores"].result(), self.job().run()["scores"].result())
+        job = self.job(output)
+        job.run()
+        self.assertEqual((job.resumed, job.computed), (3, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
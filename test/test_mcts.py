@@ -0,0 +1,109 @@
+import unittest
+from typing import Any, List, Optional
+
+from test.test_game import dealt_game
+from terra_futura.actions import Action, TakeCardAction
+from terra_futura.interfaces import TerraFuturaInterface
+from terra_futura.mcts import MCTSBot
+from terra_futura.move_generator import MoveGenerator
+from terra_futura.simple_types import CardSource, Deck, GameState, GridPosition
+
+
+class FakeNim(TerraFuturaInterface):  # pylint: disable=abstract-method
+    """Two players take one or two stones; taking the last stone wins."""
+
+    def __init__(self, stones: int):
+        self.stones = stones
+        self.player = 0
+        self.winner: Optional[int] = None
+        self.hash = stones
+
+    def take_card(self, player_id: int, source: CardSource,
+                  destination: GridPosition) -> bool:
+        if player_id != self.player or not 1 <= source.index <= min(2, self.stones):
+            return False
+        self.stones -= source.index
+        if self.stones == 0:
+            self.winner = player_id
+        self.player = 1 - self.player
+        self.hash = self.stones * 2 + self.player
+        return True
+
+    def get_state(self) -> GameState:
+        return GameState.FINISH if self.winner is not None else \
+            GameState.TAKE_CARD_NO_CARD_DISCARDED
+
+    def get_current_player(self) -> int:
+        return self.player
+
+    def get_winner(self) -> Optional[int]:
+        return self.winner
+
+    def snapshot(self) -> Any:
+        return (self.stones, self.player, self.winner, self.hash)
+
+    def restore(self, snapshot: Any) -> None:
+        self.stones, self.player, self.winner, self.hash = snapshot
+
+
+class FakeNimMoves:
+
+    def legal_actions(self, terra_futura: TerraFuturaInterface) -> List[Action]:
+        assert isinstance(terra_futura, FakeNim)
+        return [TakeCardAction(CardSource(Deck.I, n), GridPosition(0, 0))
+                for n in range(1, min(2, terra_futura.stones) + 1)]
+
+
+def take(stones: int) -> Action:
+    return TakeCardAction(CardSource(Deck.I, stones), GridPosition(0, 0))
+
+
+class TestMCTSBot(unittest.TestCase):
+
+    def test_finds_winning_move(self) -> None:
+        for stones, expected in ((4, 1), (5, 2), (2, 2)):
+            game = FakeNim(stones)
+            bot = MCTSBot(FakeNimMoves(), iterations=500, seed=1)
+            self.assertEqual(bot.choose_action(game), take(expected))
+            self.assertEqual(game.snapshot(), (stones, 0, None, stones))
+            self.assertEqual(bot.stats.iterations, 500)
+
+    def test_same_seed_same_choice(self) -> None:
+        choices = [MCTSBot(FakeNimMoves(), iterations=50, seed=7).choose_action(FakeNim(9))
+                   for _ in range(2)]
+        self.assertEqual(choices[0], choices[1])
+
+    def test_play_keeps_subtree(self) -> None:
+        game = FakeNim(7)
+        bot = MCTSBot(FakeNimMoves(), iterations=300, seed=3)
+        action = bot.play(game)
+        self.assertEqual(action, take(1))
+        self.assertEqual(game.stones, 6)
+        root = bot._root  # pylint: disable=protected-access
+        assert root is not None
+        self.assertGreater(root.visits, 0)
+        self.assertEqual(root.hash, game.hash)
+
+    def test_finished_game_has_no_action(self) -> None:
+        game = FakeNim(1)
+        self.assertTrue(game.take_card(0, CardSource(Deck.I, 1), GridPosition(0, 0)))
+        bot = MCTSBot(FakeNimMoves(), iterations=10, seed=0)
+        self.assertIsNone(bot.choose_action(game))
+
+    def test_search_keeps_undo_history(self) -> None:
+        game = dealt_game([1, 2])
+        game.journal.enabled = True
+        before = game.state()
+        self.assertTrue(game.take_card(1, CardSource(Deck.I, 3), GridPosition(0, 0)))
+        taken, entries = game.state(), len(game.journal)
+
+        bot = MCTSBot(MoveGenerator(max_activations=2), iterations=20, rollout_depth=8, seed=2)
+        self.assertIsNotNone(bot.choose_action(game))
+        self.assertEqual((game.state(), len(game.journal)), (taken, entries))
+        self.assertTrue(game.undo())
+        self.assertEqual(game.state(), before)
+        self.assertFalse(game.undo())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from test.test_mcts import FakeNim, FakeNimMoves, take
+
+from terra_futura.parallel_search import LeafParallelMCTS, RootParallelSearch, task_seed
+
+
+class TestParallelSearch(unittest.TestCase):
+
+    executor: ProcessPoolExecutor
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.executor = ProcessPoolExecutor(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.executor.shutdown()
+
+    def test_task_seeds_differ(self) -> None:
+        self.assertEqual(task_seed(5, 1), task_seed(5, 1))
+        self.assertEqual(len({task_seed(5, i) for i in range(100)}), 100)
+        self.assertNotEqual(task_seed(5, 0), task_seed(6, 0))
+
+    def test_root_parallel_merges_visits(self) -> None:
+        search = RootParallelSearch(FakeNimMoves(), workers=3, iterations=601,
+                                    seed=2, executor=self.executor)
+        game = FakeNim(5)
+        self.assertEqual(search.choose_action(game), take(2))
+        self.assertEqual(sum(visits for visits, _ in search.visits.values()), 601)
+        self.assertEqual(game.snapshot(), (5, 0, None, 5))
+
+        again = RootParallelSearch(FakeNimMoves(), workers=3, iterations=601,
+                                   seed=2, executor=self.executor)
+        again.choose_action(FakeNim(5))
+        self.assertEqual(again.visits, search.visits)
+
+    def test_leaf_parallel_is_deterministic(self) -> None:
+        results = []
+        for _ in range(2):
+            with LeafParallelMCTS(FakeNimMoves(), workers=2, batch_size=4,
+                                  iterations=400, seed=9, executor=self.executor) as bot:
+                game = FakeNim(4)
+                self.assertEqual(bot.choose_action(game), take(1))
+                self.assertEqual(bot.stats.iterations, 400)
+                self.assertEqual(game.snapshot(), (4, 0, None, 4))
+                results.append(bot.action_statistics())
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(sum(visits for _, visits, _ in results[0]), 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 # pylint: disable=too-many-instance-attributes, too-many-public-methods, duplicate-code, invalid-name
 import unittest
 from collections import Counter
-from typing import List, Tuple, Dict, Optional
+from typing import Any, List, Tuple, Dict, Optional
 
 from terra_futura.process_action import ProcessAction
 from terra_futura.interfaces import InterfaceCard, InterfaceGrid, InterfaceEffect
@@ -29,6 +29,9 @@ class FakeEffect(InterfaceEffect):
     def has_assistance(self) -> bool:
         return False
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {}
+
     def state(self) -> str:
         return "{}"
 
@@ -261,5 +264,29 @@ class TestProcessAction(unittest.TestCase):
         self.assertEqual(self.card_b.get_resource_count(Resource.GREEN), 1)
         self.assertEqual(self.card_a.get_pollution_count(), 0)
 
+    def test_plan_is_side_effect_free_and_reusable(self) -> None:
+        plan = self.process_action.plan_activation(
+            self.card_b, self.grid,
+            self.player_inputs, self.player_outputs, self.player_pollution
+        )
+
+        assert plan is not None
+        self.assertEqual(self.card_a.get_resource_count(Resource.RED), 2)
+        self.assertEqual(plan.inputs_by_card, [(self.card_a, [Resource.RED, Resource.RED])])
+        self.assertEqual(plan.pollution_cards, [self.card_a])
+
+        self.assertTrue(self.process_action.can_execute_plan(plan))
+        self.process_action.execute_plan(plan)
+        self.assertEqual(self.card_a.get_resource_count(Resource.RED), 0)
+        self.assertEqual(self.card_b.get_resource_count(Resource.CAR), 1)
+        self.assertFalse(self.process_action.can_execute_plan(plan))
+
+    def test_plan_rejects_invalid_action(self) -> None:
+        self.card_a.set_active(False)
+        self.assertIsNone(self.process_action.plan_activation(
+            self.card_b, self.grid,
+            self.player_inputs, self.player_outputs, self.player_pollution
+        ))
+
 if __name__ == "__main__":
     unittest.main()
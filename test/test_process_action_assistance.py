@@ -64,6 +64,12 @@ class FakeGrid(InterfaceGrid):
     def get_card(self, coordinate: GridPosition) -> Optional[InterfaceCard]:
         return self.cards.get((coordinate.x, coordinate.y))
 
+    def find_card(self, card: InterfaceCard) -> Optional[GridPosition]:
+        for (x, y), placed in self.cards.items():
+            if placed is card:
+                return GridPosition(x, y)
+        return None
+
     def can_put_card(self, coordinate: GridPosition) -> bool:
         _ = coordinate
         return True
@@ -217,6 +223,22 @@ class TestProcessActionAssistance(unittest.TestCase):
 
         self.assertEqual(len(self.reward.calls), 1)
 
+    def test_can_activate_card_has_no_side_effects(self) -> None:
+        input_card: FakeCard = self._add_card(1, 1, {Resource.GREEN: 1})
+        self.assertTrue(self.action.can_activate_card(
+            self.card, self.grid, 2, self.assist,
+            [(Resource.GREEN, GridPosition(1, 1))],
+            [(Resource.BULB, GridPosition(0, 0))],
+            []))
+        self.assertFalse(self.action.can_activate_card(
+            self.card, self.grid, 2, self.assist,
+            [(Resource.RED, GridPosition(1, 1))], [], []))
+
+        self.assertEqual(input_card.get_calls, [])
+        self.assertEqual(self.card.put_calls, [])
+        self.assertEqual(self.reward.calls, [])
+        self.assertIsNone(self.action.current_card())
+
     def test_no_assistance_effect_fails(self) -> None:
         self.card = FakeCard(has_assistance=False)
         self.grid.place(0, 0, self.card)
@@ -0,0 +1,63 @@
+import unittest
+from typing import List
+
+from terra_futura.card import Card
+from terra_futura.interfaces import InterfaceCard
+from terra_futura.random_provider import SeededRandomProvider, split_seed
+from terra_futura.simple_types import Deck
+
+
+def draw(provider: SeededRandomProvider, count: int) -> List[int]:
+    return [provider.next_u64() for _ in range(count)]
+
+
+class TestSeededRandomProvider(unittest.TestCase):
+
+    def test_equal_seeds_give_equal_streams(self) -> None:
+        self.assertEqual(draw(SeededRandomProvider(42), 10), draw(SeededRandomProvider(42), 10))
+        self.assertNotEqual(draw(SeededRandomProvider(42), 10), draw(SeededRandomProvider(43), 10))
+
+    def test_children_are_independent_of_parent_use(self) -> None:
+        parent = SeededRandomProvider(7)
+        first = draw(parent.for_pile(Deck.I), 5)
+        draw(parent, 100)
+        self.assertEqual(draw(parent.for_pile(Deck.I), 5), first)
+        self.assertNotEqual(draw(parent.for_pile(Deck.II), 5), first)
+        self.assertNotEqual(draw(parent.split(1).split(2), 5), draw(parent.split(2).split(1), 5))
+        self.assertEqual(parent.split(3).seed, split_seed(7, 3))
+
+    def test_below_is_in_range_and_roughly_uniform(self) -> None:
+        provider = SeededRandomProvider(1)
+        counts = [0] * 6
+        for _ in range(6000):
+            counts[provider.below(6)] += 1
+        self.assertTrue(all(800 < count < 1200 for count in counts), counts)
+        with self.assertRaises(ValueError):
+            provider.below(0)
+
+    def test_shuffle_and_pop_card(self) -> None:
+        cards: List[InterfaceCard] = [Card([], i) for i in range(10)]
+        shuffled = cards.copy()
+        SeededRandomProvider(5).shuffle(shuffled)
+        self.assertCountEqual(shuffled, cards)
+        self.assertNotEqual(shuffled, cards)
+        again = cards.copy()
+        SeededRandomProvider(5).shuffle(again)
+        self.assertEqual(again, shuffled)
+
+        provider = SeededRandomProvider(9)
+        popped = [provider.pop_card(shuffled) for _ in range(10)]
+        self.assertCountEqual(popped, cards)
+        self.assertIsNone(provider.pop_card(shuffled))
+
+    def test_snapshot_and_restore(self) -> None:
+        provider = SeededRandomProvider(3)
+        draw(provider, 3)
+        state = provider.snapshot()
+        expected = draw(provider, 4)
+        provider.restore(state)
+        self.assertEqual(draw(provider, 4), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+from terra_futura.resource_bag import ResourceBag, MAX_COUNT
+from terra_futura.simple_types import Resource
+
+
+class TestResourceBag(unittest.TestCase):
+
+    def test_counts(self) -> None:
+        bag = ResourceBag([Resource.RED, Resource.RED, Resource.POLLUTION])
+        self.assertEqual(bag.count(Resource.RED), 2)
+        self.assertEqual(bag.count(Resource.GREEN), 0)
+        self.assertEqual(bag.pollution, 1)
+        self.assertEqual(len(bag), 3)
+
+    def test_contains_is_multiset_subset(self) -> None:
+        bag = ResourceBag([Resource.RED, Resource.RED, Resource.GREEN])
+        self.assertTrue(bag.contains(ResourceBag([Resource.RED, Resource.RED])))
+        self.assertTrue(bag.contains(ResourceBag()))
+        self.assertFalse(bag.contains(ResourceBag([Resource.RED] * 3)))
+        self.assertFalse(bag.contains(ResourceBag([Resource.CAR])))
+        self.assertIn(Resource.GREEN, bag)
+        self.assertNotIn(Resource.MONEY, bag)
+
+    def test_add_and_remove(self) -> None:
+        bag = ResourceBag([Resource.GEAR])
+        bag.add(ResourceBag([Resource.GEAR, Resource.MONEY]))
+        bag.remove(ResourceBag([Resource.GEAR]))
+        self.assertEqual(bag, ResourceBag([Resource.MONEY, Resource.GEAR]))
+        with self.assertRaises(ValueError):
+            bag.remove(ResourceBag([Resource.CAR]))
+        self.assertEqual(bag.to_list(), [Resource.GEAR, Resource.MONEY])
+
+    def test_overflow_is_rejected(self) -> None:
+        bag = ResourceBag([Resource.POLLUTION] * MAX_COUNT)
+        with self.assertRaises(ValueError):
+            bag.add(ResourceBag([Resource.POLLUTION]))
+        self.assertEqual(bag.pollution, MAX_COUNT)
+
+
+if __name__ == "__main__":
+    unittest.main()
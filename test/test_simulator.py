@@ -0,0 +1,82 @@
+import io
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Dict, List
+from test.test_game import helper, producer
+from test.test_mcts import FakeNim, FakeNimMoves
+
+from terra_futura.game import Game
+from terra_futura.interfaces import InterfaceCard, TerraFuturaInterface
+from terra_futura.mcts import RandomRollout
+from terra_futura.simple_types import Deck, Resource
+from terra_futura.simulator import SelfPlaySimulator, dealing_factory, main
+
+
+def nim_of_seven(player_ids: List[int]) -> TerraFuturaInterface:
+    assert player_ids == [0, 1]
+    return FakeNim(7)
+
+
+def small_decks() -> Dict[Deck, List[InterfaceCard]]:
+    return {
+        Deck.I: [producer(resource) for resource in list(Resource)[:6] * 4],
+        Deck.II: [helper() for _ in range(12)],
+    }
+
+
+class TestSelfPlaySimulator(unittest.TestCase):
+
+    def test_run_counts_games_and_actions(self) -> None:
+        simulator = SelfPlaySimulator(nim_of_seven, FakeNimMoves(),
+                                      [RandomRollout(1), RandomRollout(2)])
+        stats = simulator.run(50, 2)
+        self.assertEqual(stats.games, 50)
+        self.assertEqual(stats.unfinished, 0)
+        self.assertEqual(sum(stats.wins.values()), 50)
+        self.assertGreaterEqual(stats.actions, 50 * 4)
+        self.assertLessEqual(stats.actions, 50 * 7)
+        self.assertGreater(stats.actions_per_second, stats.games_per_second)
+
+    def test_action_limit_leaves_game_unfinished(self) -> None:
+        simulator = SelfPlaySimulator(nim_of_seven, FakeNimMoves(),
+                                      [RandomRollout(1), RandomRollout(2)], max_actions=2)
+        game = simulator.play_game(2)
+        self.assertIsNone(game.get_winner())
+        stats = simulator.run(3, 2)
+        self.assertEqual((stats.unfinished, stats.actions), (3, 6))
+
+    def test_rejects_seats_without_policy(self) -> None:
+        simulator = SelfPlaySimulator(nim_of_seven, FakeNimMoves(), [RandomRollout()] * 2)
+        with self.assertRaises(ValueError):
+            simulator.run(1, 3)
+        with self.assertRaises(ValueError):
+            simulator.run(1, 1)
+
+    def test_dealing_factory_deals_fresh_reproducible_games(self) -> None:
+        first = dealing_factory(small_decks, seed=5)
+        second = dealing_factory(small_decks, seed=5)
+        games = [first([0, 1]), first([0, 1]), second([0, 1])]
+        self.assertEqual(games[0].state(), games[2].state())
+        self.assertNotEqual(games[0].state(), games[1].state())
+        piles = [game.piles for game in games if isinstance(game, Game)]
+        self.assertEqual(len(piles), 3)
+        self.assertIsNot(piles[0][Deck.I].get_card(1), piles[2][Deck.I].get_card(1))
+        self.assertEqual(piles[0][Deck.I].sizes(), (20, 0))
+        dealt = [game.players for game in games if isinstance(game, Game)]
+        self.assertEqual([len(player.activation_patterns) for player in dealt[0].values()], [2, 2])
+        self.assertEqual([len(player.scoring_methods) for player in dealt[0].values()], [2, 2])
+        self.assertEqual([p.state() for p in dealt[0][1].activation_patterns],
+                         [p.state() for p in dealt[2][1].activation_patterns])
+
+    def test_main_needs_decks(self) -> None:
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main(["--games", "1"])
+        output = io.StringIO()
+        with redirect_stdout(output):
+            main(["--games", "5", "--decks", "test.test_simulator:small_decks"])
+        self.assertTrue(output.getvalue().startswith("5 games"))
+        self.assertIn(" 0 unfinished", output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import json
+import unittest
+from typing import Any
+
+from terra_futura.card import Card
+from terra_futura.effects import EffectTransformationFixed
+from terra_futura.grid import Grid
+from terra_futura.simple_types import GridPosition, Resource
+from terra_futura.state_patch import StateReplica, apply_patch, diff
+
+
+class TestStatePatch(unittest.TestCase):
+
+    def check(self, old: Any, new: Any) -> None:
+        before = json.dumps(old)
+        self.assertEqual(apply_patch(old, diff(old, new)), new)
+        self.assertEqual(json.dumps(old), before)
+
+    def test_round_trips(self) -> None:
+        self.check({"a": [1, 2, 3], "b": {"c": None}}, {"a": [1, 5], "d/e~": True})
+        self.check({"a": [1]}, {"a": [1, {"x": 2}, 3]})
+        self.check({"a": 1}, [1, 2])
+        self.check({"a": 1}, {"a": "1"})
+        self.assertEqual(diff({"a": 1}, [1]), [{"op": "replace", "path": "", "value": [1]}])
+
+    def test_unchanged_fragments_are_skipped(self) -> None:
+        grid = Grid()
+        producer = EffectTransformationFixed([], [Resource.RED], 0)
+        for x in (-1, 0, 1):
+            grid.put_card(GridPosition(x, 0), Card([], 2, upperEffect=producer))
+        before = grid.to_dict()
+        card = grid.get_card(GridPosition(1, 0))
+        assert card is not None
+        card.put_resources([Resource.RED])
+        self.assertEqual(diff(before, grid.to_dict()), [
+            {"op": "add", "path": "/cards/2/card/resources/0", "value": "Red"},
+        ])
+
+    def test_replica_needs_a_known_base(self) -> None:
+        replica = StateReplica()
+        self.assertFalse(replica.apply('{"version": 2, "base": 1, "patch": []}'))
+        self.assertTrue(replica.apply('{"version": 1, "state": [0]}'))
+        self.assertTrue(replica.apply(
+            '{"version": 2, "base": 1, "patch": [{"op": "add", "path": "/1", "value": 1}]}'))
+        self.assertEqual((replica.version, replica.state), (2, [0, 1]))
+        self.assertEqual(replica.acknowledge(), 2)
+        self.assertTrue(replica.apply('{"version": 3, "base": 1, "patch": []}'))
+        self.assertTrue(replica.apply('{"version": 4, "base": 2, "patch": []}'))
+        self.assertEqual(replica.acknowledge(), 4)
+        self.assertFalse(replica.apply('{"version": 5, "base": 1, "patch": []}'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+import unittest
+from typing import List, Optional
+
+from terra_futura.actions import Action, TakeCardAction
+from terra_futura.card import Card
+from terra_futura.grid import POSITIONS, Grid
+from terra_futura.interfaces import InterfaceCard, InterfacePile, TerraFuturaInterface
+from terra_futura.simple_types import CardSource, Deck, GameState, GridPosition, Resource
+from terra_futura.vector_env import LegalActionDecoder, ObservationLayout, VectorEnv
+
+
+class FakePile(InterfacePile):  # pylint: disable=abstract-method
+
+    def __init__(self, cards: List[InterfaceCard]):
+        self.cards = cards
+
+    def get_card(self, index: int) -> Optional[InterfaceCard]:
+        return self.cards[index] if index < len(self.cards) else None
+
+    def take_card(self, index: int) -> Optional[InterfaceCard]:
+        return self.cards.pop(index) if index < len(self.cards) else None
+
+
+class FakePlayer:
+
+    def __init__(self) -> None:
+        self.grid = Grid()
+
+
+class FakeBoardGame(TerraFuturaInterface):  # pylint: disable=abstract-method
+    """Players alternate taking cards; whoever places the fourth card wins."""
+
+    def __init__(self, player_ids: List[int]):
+        self.players = {pid: FakePlayer() for pid in player_ids}
+        self.piles = {
+            Deck.I: FakePile([Card([Resource.GREEN] * i, 2 + i) for i in range(6)]),
+            Deck.II: FakePile([Card([], 1, True)]),
+        }
+        self.order = player_ids
+        self.on_turn = 0
+        self.placed = 0
+        self.hash = 0
+
+    def take_card(self, player_id: int, source: CardSource,
+                  destination: GridPosition) -> bool:
+        grid = self.players[player_id].grid
+        if player_id != self.get_current_player() or not grid.can_put_card(destination):
+            return False
+        card = self.piles[source.deck].take_card(source.index)
+        if card is None:
+            return False
+        grid.put_card(destination, card)
+        self.placed += 1
+        if self.placed < 4:
+            self.on_turn = (self.on_turn + 1) % len(self.order)
+        return True
+
+    def get_state(self) -> GameState:
+        return GameState.FINISH if self.placed >= 4 else GameState.TAKE_CARD_NO_CARD_DISCARDED
+
+    def get_current_player(self) -> int:
+        return self.order[self.on_turn]
+
+    def get_winner(self) -> Optional[int]:
+        return self.get_current_player() if self.placed >= 4 else None
+
+
+class FakeBoardMoves:
+
+    def legal_actions(self, terra_futura: TerraFuturaInterface) -> List[Action]:
+        assert isinstance(terra_futura, FakeBoardGame)
+        grid = terra_futura.players[terra_futura.get_current_player()].grid
+        return [TakeCardAction(CardSource(Deck.I, 0), pos)
+                for pos in POSITIONS if grid.can_put_card(pos)]
+
+
+class TestVectorEnv(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.env = VectorEnv(FakeBoardGame, 3, 2, LegalActionDecoder(FakeBoardMoves()))
+        self.layout = ObservationLayout(2)
+
+    def test_layout_is_contiguous(self) -> None:
+        end = 0
+        for offset, length in self.layout.fields.values():
+            self.assertEqual(offset, end)
+            end += length
+        self.assertEqual(end, self.layout.size)
+
+    def test_reset_encodes_piles_state_and_turn(self) -> None:
+        observations = self.env.reset()
+        self.assertEqual(observations.shape, (3, self.layout.size))
+        row = self.env.row(1).tolist()
+        piles = self.layout.offset("piles")
+        self.assertEqual(row[piles:piles + 6], [1, 2, 0, 1, 3, 0])
+        deck_two = piles + 5 * 3
+        self.assertEqual(row[deck_two:deck_two + 3], [1, 1, 1])
+        state = self.layout.offset("state")
+        self.assertEqual(row[state:state + 7], [1, 0, 0, 0, 0, 0, 0])
+        on_turn = self.layout.offset("on_turn")
+        self.assertEqual(row[on_turn:on_turn + 2], [1, 0])
+        self.assertEqual(sum(row[:piles]), 0)
+
+    def test_step_writes_grid_in_place(self) -> None:
+        self.env.reset()
+        self.env.step([0, 0, 0])
+        self.env.step([0, 1, 99])
+        self.assertEqual(self.env.illegal.tolist(), [0, 0, 1])
+        row = self.env.row(0).tolist()
+
+        occupied = self.layout.offset("occupied")
+        self.assertEqual(sum(row[occupied:occupied + 50]), 2)
+        self.assertEqual(row[occupied], 1)
+        self.assertEqual(row[occupied + 25], 1)
+        resources = self.layout.offset("resources") + 25 * 8
+        self.assertEqual(row[resources:resources + 8], [1, 0, 0, 0, 0, 0, 0, 0])
+        on_turn = self.layout.offset("on_turn")
+        self.assertEqual(row[on_turn:on_turn + 2], [1, 0])
+
+    def test_finished_game_is_reset_with_reward(self) -> None:
+        self.env.reset()
+        for _ in range(3):
+            _, rewards, dones = self.env.step([0, 0, 0])
+            self.assertEqual(dones.tolist(), [0, 0, 0])
+        first = self.env.games[0]
+        _, rewards, dones = self.env.step([0, 0, 0])
+        self.assertEqual(dones.tolist(), [1, 1, 1])
+        self.assertEqual(rewards.tolist(), [1.0, 1.0, 1.0])
+        self.assertIsNot(self.env.games[0], first)
+        occupied = self.layout.offset("occupied")
+        self.assertEqual(sum(self.env.row(0).tolist()[occupied:occupied + 50]), 0)
+
+    def test_step_checks_batch_size(self) -> None:
+        self.env.reset()
+        with self.assertRaises(ValueError):
+            self.env.step([0])
+
+
+if __name__ == '__main__':
+    unittest.main()
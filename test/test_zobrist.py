@@ -0,0 +1,88 @@
+import copy
+import pickle
+import unittest
+from typing import Optional, Tuple
+
+from terra_futura.card import Card
+from terra_futura.effects import EffectTransformationFixed
+from terra_futura.interfaces import InterfaceCard, InterfacePile
+from terra_futura.simple_types import Deck, GameState, Resource
+from terra_futura.zobrist import ZobristTable
+
+
+class FakePile(InterfacePile):
+    # pylint: disable=abstract-method
+    def __init__(self, visible: Tuple[InterfaceCard, ...], hidden: int) -> None:
+        self.visible = visible
+        self.hidden = hidden
+
+    def get_card(self, index: int) -> Optional[InterfaceCard]:
+        return self.visible[index - 1] if 1 <= index <= len(self.visible) else None
+
+    def sizes(self) -> Tuple[int, int]:
+        return self.hidden, 0
+
+
+def make_card(output: Resource) -> Card:
+    return Card([], 1, upperEffect=EffectTransformationFixed([], [output], 0))
+
+
+class TestZobristTable(unittest.TestCase):
+
+    def test_keys_do_not_depend_on_request_order(self) -> None:
+        first, second = ZobristTable(7), ZobristTable(7)
+        card_a, card_b = make_card(Resource.RED), make_card(Resource.GREEN)
+        key_a = first.placement(1, 3, card_a)
+        key_b = first.placement(1, 4, card_b)
+        self.assertEqual(second.placement(1, 4, card_b), key_b)
+        self.assertEqual(second.placement(1, 3, card_a), key_a)
+        self.assertNotEqual(ZobristTable(8).placement(1, 3, card_a), key_a)
+
+    def test_identical_cards_share_a_key(self) -> None:
+        table = ZobristTable()
+        self.assertEqual(table.card_key(make_card(Resource.RED)),
+                         table.card_key(make_card(Resource.RED)))
+        self.assertNotEqual(table.card_key(make_card(Resource.RED)),
+                            table.card_key(make_card(Resource.CAR)))
+
+    def test_copies_do_not_reuse_card_ids(self) -> None:
+        table = ZobristTable()
+        card = make_card(Resource.RED)
+        table.card_key(card)
+        for copied in (pickle.loads(pickle.dumps(table)), copy.deepcopy(table)):
+            other = make_card(Resource.GREEN)
+            card.upper_effect = other.upper_effect
+            self.assertEqual(copied.card_key(card), table.card_key(other))
+            card.upper_effect = make_card(Resource.RED).upper_effect
+
+    def test_parts_of_the_position_are_distinguished(self) -> None:
+        table = ZobristTable()
+        self.assertNotEqual(table.turn(GameState.ACTIVATE_CARD, 1, 1),
+                            table.turn(GameState.ACTIVATE_CARD, 2, 1))
+        self.assertNotEqual(table.turn(GameState.ACTIVATE_CARD, 1, 1),
+                            table.turn(GameState.ACTIVATE_CARD, 1, 2))
+        self.assertNotEqual(table.resources(1, 0, 1), table.resources(1, 1, 1))
+
+    def test_pile_key_follows_visible_cards(self) -> None:
+        table = ZobristTable()
+        red, green = make_card(Resource.RED), make_card(Resource.GREEN)
+        self.assertNotEqual(table.pile(Deck.I, FakePile((red, green), 3)),
+                            table.pile(Deck.I, FakePile((green, red), 3)))
+        self.assertNotEqual(table.pile(Deck.I, FakePile((red, green), 3)),
+                            table.pile(Deck.I, FakePile((red, green), 2)))
+        self.assertEqual(table.pile(Deck.II, FakePile((red,), 1)),
+                         table.pile(Deck.II, FakePile((make_card(Resource.RED),), 1)))
+
+    def test_pile_slot_updates_pile_key(self) -> None:
+        table = ZobristTable()
+        red, green = make_card(Resource.RED), make_card(Resource.GREEN)
+        before, after = FakePile((red, green), 3), FakePile((red, red), 2)
+        self.assertEqual(table.pile(Deck.I, before) ^ table.pile_slot(Deck.I, before, 2)
+                         ^ table.pile_slot(Deck.I, after, 2), table.pile(Deck.I, after))
+        taken = FakePile((red, green), 2)
+        self.assertEqual(table.pile(Deck.I, before) ^ table.pile_slot(Deck.I, before, 0)
+                         ^ table.pile_slot(Deck.I, taken, 0), table.pile(Deck.I, taken))
+
+
+if __name__ == "__main__":
+    unittest.main()